@@ -95,16 +95,63 @@ class Autoscaling(Expression):
         return "Autoscaling(%1$d, %2$s)" % (self.period, str(self.limits))
 
 
+class Monitoring(Expression):
+    """
+    Configuration of the monitoring of a service: the period between two samples (the default period
+    if None) and the names of the probes to sample (all of them if None, none if empty). Besides the
+    service-wide probes, each operation has its own probes, named after the operation (e.g.,
+    'reliability Select').
+    """
+
+    RESPONSE_TIME_QUANTILES = [("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("p99.9", 0.999)]
+
+    SERVICE_PROBES = ["time", "queue", "queue blocked", "utilisation", "worker count", "arrival rate",
+                      "rejection rate", "reliability", "throughput", "response time"] + \
+                     ["response time " + each_name for (each_name, _) in RESPONSE_TIME_QUANTILES]
+
+    OPERATION_PROBES = ["response time"] + \
+                       ["response time " + each_name for (each_name, _) in RESPONSE_TIME_QUANTILES] + \
+                       ["reliability", "arrival rate"]
+
+    @classmethod
+    def probe_names(cls, operations):
+        """
+        The names of the probes available for a service that exposes the given operations
+        """
+        names = list(cls.SERVICE_PROBES)
+        for each_operation in operations:
+            names.extend(each_probe + " " + each_operation for each_probe in cls.OPERATION_PROBES)
+        return names
+
+    def __init__(self, period=None, probes=None):
+        super().__init__()
+        if period is not None and (not isinstance(period, int) or period <= 0):
+            raise ValueError("Expecting a positive integer for the monitoring period, but found '%s'" % str(period))
+        self.period = period
+        self.probes = probes
+
+    @property
+    def is_disabled(self):
+        return self.probes is not None and len(self.probes) == 0
+
+    def accept(self, evaluation):
+        return evaluation.of_monitoring(self)
+
+    def __repr__(self):
+        return "Monitoring(%s, %s)" % (str(self.period), str(self.probes))
+
+
 class Settings(Expression):
 
-    def __init__(self, queue=None, autoscaling=None, throttling=None):
+    def __init__(self, queue=None, autoscaling=None, throttling=None, monitoring=None):
         super().__init__()
         self.queue = queue or FIFO()
         self.autoscaling = autoscaling or Autoscaling()
         self.throttling = throttling or NoThrottlingSettings()
+        self.monitoring = monitoring or Monitoring()
 
     def accept(self, evaluation):
         return evaluation.of_settings(self)
 
     def __repr__(self):
-        return "Settings(queue: %s)" % str(self._queue)
\ No newline at end of file
+        return "Settings(queue: %s)" % str(self.queue)
\ No newline at end of file
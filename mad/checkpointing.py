@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import random
+
+from importlib import import_module
+from io import BytesIO
+from marshal import dumps, loads
+from pickle import Pickler, Unpickler, HIGHEST_PROTOCOL
+from sys import modules
+from types import CellType, FunctionType
+
+
+class Snapshot:
+    """
+    A frozen copy of a simulation, including the pending events, the entities, the tasks and their
+    continuations, as well as the state of the random number generator. The same snapshot can be
+    restored several times, for instance to fork a warmed-up simulation into several variants.
+    The simulation is flushed first, so that its restored copies only report what comes next.
+
+    Snapshots are only portable between identical versions of Python and MAD.
+    """
+
+    def __init__(self, content):
+        self.content = content
+
+    @staticmethod
+    def of(simulation):
+        simulation.flush()
+        buffer = BytesIO()
+        _SnapshotPickler(buffer).dump((simulation, random.getstate()))
+        return Snapshot(buffer.getvalue())
+
+    @staticmethod
+    def load(input_stream):
+        return Snapshot(input_stream.read())
+
+    def save(self, output_stream):
+        output_stream.write(self.content)
+
+    def restore(self, storage):
+        (simulation, random_state) = Unpickler(BytesIO(self.content)).load()
+        random.setstate(random_state)
+        simulation.attach(storage)
+        return simulation
+
+
+class Checkpoints:
+    """
+    Run a simulation by segments of the given period, and save a snapshot in between two segments
+    """
+
+    def __init__(self, period, open_output_stream):
+        assert period > 0, "Invalid checkpoint period (found %d)" % period
+        self.period = period
+        self._open_output_stream = open_output_stream
+
+    def run(self, simulation, end, display=None):
+        next_checkpoint = (simulation.schedule.time_now // self.period + 1) * self.period
+        while next_checkpoint < end:
+            simulation.schedule.simulate_until(next_checkpoint, display)
+            if simulation.schedule.is_stopped:
+                return
+            self.save(simulation)
+            next_checkpoint += self.period
+        simulation.schedule.simulate_until(end, display)
+
+    def save(self, simulation):
+        with self._open_output_stream() as output_stream:
+            Snapshot.of(simulation).save(output_stream)
+
+
+class _SnapshotPickler(Pickler):
+    """
+    Pickle functions that cannot be found by name (i.e., lambdas and closures, which hold the
+    continuations of the simulation) by value, that is their code, their defaults and their closure.
+    """
+
+    def __init__(self, output_stream):
+        super().__init__(output_stream, HIGHEST_PROTOCOL)
+
+    def reducer_override(self, candidate):
+        if type(candidate) is FunctionType and not _is_importable(candidate):
+            return (_make_function,
+                    (dumps(candidate.__code__),
+                     candidate.__module__,
+                     candidate.__name__,
+                     candidate.__defaults__,
+                     candidate.__closure__))
+        if type(candidate) is CellType:
+            return (_make_cell, (), _contents_of(candidate), None, None, _fill_cell)
+        return NotImplemented
+
+
+def _is_importable(function):
+    owner = modules.get(function.__module__)
+    for each_name in function.__qualname__.split("."):
+        owner = getattr(owner, each_name, None)
+    return owner is function
+
+
+def _make_function(code, module, name, defaults, closure):
+    return FunctionType(loads(code), vars(import_module(module)), name, defaults, closure)
+
+
+def _make_cell():
+    return CellType()
+
+
+class _EmptyCell:
+    """
+    Marker for the cells of closures whose variable is not yet bound
+    """
+    pass
+
+
+def _contents_of(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return _EmptyCell
+
+
+def _fill_cell(cell, contents):
+    if contents is not _EmptyCell:
+        cell.cell_contents = contents
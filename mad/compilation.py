@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from mad.evaluation import Success, SUCCEEDED, FAILED, PAUSED, BUSY
+
+
+NO_ARGUMENTS = {}
+
+
+class Compiler:
+    """
+    Turn the body of an operation into a plan, that is a tree of pre-linked steps, once and for all,
+    so that invoking the operation does not walk the AST anymore. Plans are the only interpretation
+    of actions: mad.evaluation.Evaluation only handles the definitions and the settings.
+    """
+
+    def compile(self, expression):
+        return expression.accept(self)
+
+    def of_sequence(self, sequence):
+        steps = []
+        for each_expression in sequence.body:
+            step = self.compile(each_expression)
+            if isinstance(step, Block):
+                steps.extend(step.steps)
+            else:
+                steps.append(step)
+        if len(steps) == 1:
+            return steps[0]
+        return Block(steps)
+
+    def of_trigger(self, trigger):
+        return TriggerStep(trigger.service, trigger.operation, trigger.priority)
+
+    def of_query(self, query):
+        return QueryStep(query.service, query.operation, query.priority, query.timeout)
+
+    def of_think(self, think):
+        return ThinkStep(think.duration)
+
+    def of_fail(self, fail):
+        return FailStep(fail.probability)
+
+    def of_retry(self, retry):
+        return RetryStep(self.compile(retry.expression), retry.limit, retry.delay)
+
+    def of_ignore_error(self, ignore_error):
+        return IgnoreErrorStep(self.compile(ignore_error.expression))
+
+
+class Thunk:
+    """
+    A suspended call, which steps return to the driver loop (see 'trampoline') instead of making it
+    right away. The Python stack therefore stays as deep however long the sequences, or however
+    nested the retries and ignored errors.
+    """
+
+    __slots__ = ("function", "arguments")
+
+    def __init__(self, function, *arguments):
+        self.function = function
+        self.arguments = arguments
+
+
+def trampoline(result):
+    """
+    Run the given thunk, and the thunks it returns, until a regular result comes out
+    """
+    while isinstance(result, Thunk):
+        result = result.function(*result.arguments)
+    return result
+
+
+def run(plan, frame, continuation):
+    return trampoline(plan.execute(frame, continuation))
+
+
+def proceed(continuation, status):
+    """
+    Return a thunk that passes the given status to the given continuation
+    """
+    if isinstance(continuation, Continuation):
+        return Thunk(continuation.resume, status)
+    return Thunk(continuation, status)
+
+
+class Continuation:
+    """
+    A continuation created by the steps of a plan. When called from outside a plan (e.g., by the
+    scheduler), it drives the steps that follow until they all complete or wait.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, status):
+        return trampoline(self.resume(status))
+
+    def resume(self, status):
+        raise NotImplementedError("Continuation::resume is abstract!")
+
+
+class Frame:
+    """
+    The state of one invocation of an operation, as a flat record: the task that carries out the
+    invocation, the service that exposes the operation, the factory that creates the requests, the
+    arguments of the invocation (by parameter name), and the environment of the operation, which
+    is shared by all invocations. Invocations without arguments share a single empty mapping, which
+    must therefore never be modified.
+    """
+
+    __slots__ = ("environment", "task", "sender", "factory", "arguments")
+
+    def __init__(self, environment, task, sender, factory, arguments=None):
+        self.environment = environment
+        self.task = task
+        self.sender = sender
+        self.factory = factory
+        self.arguments = NO_ARGUMENTS if arguments is None else arguments
+
+
+class Step:
+    """
+    A step of a plan, executed within a frame. Once complete, a step passes its status to the given
+    continuation. Steps never call other steps or continuations directly, but return thunks instead.
+    """
+
+    def execute(self, frame, continuation):
+        raise NotImplementedError("Step::execute is abstract!")
+
+    def resolve(self, environment):
+        """
+        Bind the symbols used by this step to their value in the given environment
+        """
+        pass
+
+
+class Block(Step):
+    """
+    A sequence of steps, which stops at the first error
+    """
+
+    def __init__(self, steps):
+        assert len(steps) > 1, "Blocks need at least two steps (found %d)" % len(steps)
+        self.steps = steps
+        self._last = len(steps) - 1
+
+    def execute(self, frame, continuation):
+        return self.execute_from(0, frame, continuation)
+
+    def resolve(self, environment):
+        for each_step in self.steps:
+            each_step.resolve(environment)
+
+    def execute_from(self, index, frame, continuation):
+        if index == self._last:
+            return Thunk(self.steps[index].execute, frame, continuation)
+        return Thunk(self.steps[index].execute, frame, ProgramCounter(self, index + 1, frame, continuation))
+
+
+class ProgramCounter(Continuation):
+    """
+    The continuation of a step within a block: proceed with the next step, unless the previous one failed
+    """
+
+    __slots__ = ("block", "index", "frame", "continuation")
+
+    def __init__(self, block, index, frame, continuation):
+        self.block = block
+        self.index = index
+        self.frame = frame
+        self.continuation = continuation
+
+    def resume(self, status):
+        if status.is_successful:
+            return self.block.execute_from(self.index, self.frame, self.continuation)
+        return proceed(self.continuation, status)
+
+
+class ThinkStep(Step):
+    """
+    Keep the worker busy for the given duration. The worker is not released and the task is not paused.
+    """
+
+    def __init__(self, duration):
+        self.duration = duration
+
+    def execute(self, frame, continuation):
+        frame.task.compute(self.duration, continuation, SUCCEEDED)
+        return BUSY
+
+
+class FailStep(Step):
+
+    def __init__(self, probability):
+        self.probability = probability
+
+    def execute(self, frame, continuation):
+        if frame.sender.random_stream.random() < self.probability:
+            return proceed(continuation, FAILED)
+        else:
+            return proceed(continuation, SUCCEEDED)
+
+
+class InvocationStep(Step):
+    """
+    Send a request to another service, once the worker has prepared it (for one unit of time)
+    """
+
+    def __init__(self, service, operation, priority):
+        self.service = service
+        self.operation = operation
+        self.priority = priority
+        self.recipient = None
+
+    def resolve(self, environment):
+        self.recipient = environment.look_up(self.service)
+        if self.recipient is None:
+            raise ValueError("Could not find service '{0}' (invoked for '{0}/{1}')".format(self.service, self.operation))
+
+    def execute(self, frame, continuation):
+        frame.task.compute(1, self.send, frame, continuation, SUCCEEDED)
+        return BUSY
+
+    def send(self, frame, continuation, status):
+        raise NotImplementedError("InvocationStep::send is abstract!")
+
+
+class TriggerStep(InvocationStep):
+
+    def send(self, frame, continuation, status):
+        task = frame.task
+        request = frame.factory.create_trigger(task, self.operation, self.priority, continuation)
+        request.send_to(self.recipient)
+        task.pause()
+        return PAUSED
+
+
+class QueryStep(InvocationStep):
+
+    def __init__(self, service, operation, priority, timeout):
+        super().__init__(service, operation, priority)
+        self.timeout = timeout
+
+    def send(self, frame, continuation, status):
+        task = frame.task
+        request = frame.factory.create_query(task, self.operation, self.priority, continuation)
+        request.send_to(self.recipient)
+        if self.timeout is not None:
+            request.time_out_after(self.timeout, self.on_timeout, frame.sender, request, task)
+        task.pause()
+        return PAUSED
+
+    @staticmethod
+    def on_timeout(sender, request, task):
+        sender.listener.timeout_of(request)
+        request.discard()
+        task.resume_with(request.resume, FAILED)
+
+
+class RetryStep(Step):
+
+    def __init__(self, body, limit, delay):
+        self.body = body
+        self.limit = limit
+        self.delay = delay
+
+    def execute(self, frame, continuation):
+        backoff = frame.factory.create_backoff(self.delay, frame.sender.backoff_stream)
+        return Thunk(self.body.execute, frame, Attempt(self, frame, backoff, self.limit - 1, continuation))
+
+    def resolve(self, environment):
+        self.body.resolve(environment)
+
+
+class Attempt(Continuation):
+    """
+    The continuation of one attempt of a retry step: go on if successful, or try again after some delay
+    """
+
+    __slots__ = ("retry", "frame", "backoff", "remaining_tries", "continuation")
+
+    def __init__(self, retry, frame, backoff, remaining_tries, continuation):
+        self.retry = retry
+        self.frame = frame
+        self.backoff = backoff
+        self.remaining_tries = remaining_tries
+        self.continuation = continuation
+
+    def resume(self, status):
+        if self.remaining_tries <= 0:
+            return proceed(self.continuation, FAILED)
+        if status.is_successful:
+            return proceed(self.continuation, SUCCEEDED)
+        task = self.frame.task
+        delay = self.backoff.delay(self.retry.limit - self.remaining_tries)
+        self.frame.sender.schedule.after(delay, task.resume_with, self.try_again)
+        task.pause()
+        return PAUSED
+
+    def try_again(self, worker):
+        next_attempt = Attempt(self.retry, self.frame, self.backoff, self.remaining_tries - 1, self.continuation)
+        run(self.retry.body, self.frame, next_attempt)
+
+
+class IgnoreErrorStep(Step):
+
+    def __init__(self, body):
+        self.body = body
+
+    def execute(self, frame, continuation):
+        return Thunk(self.body.execute, frame, IgnoredError(continuation))
+
+    def resolve(self, environment):
+        self.body.resolve(environment)
+
+
+class IgnoredError(Continuation):
+    """
+    The continuation of a step whose errors are ignored
+    """
+
+    __slots__ = ("continuation",)
+
+    def __init__(self, continuation):
+        self.continuation = continuation
+
+    def resume(self, status):
+        return proceed(self.continuation, Success(status.value))
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime
+from hashlib import sha256
+from sqlite3 import connect
+
+from mad.log import Log
+from mad.storage import DataStorage
+
+
+class Database:
+    """
+    A SQLite database that gathers the results of many runs, so that they can be compared with plain
+    SQL queries. Each run records its model (and its hash), the trace, the metrics reported by each
+    service, and a summary of each metric.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            model TEXT NOT NULL,
+            model_hash TEXT NOT NULL,
+            source TEXT NOT NULL,
+            started TEXT NOT NULL,
+            length INTEGER,
+            seed INTEGER,
+            version TEXT
+        );
+        CREATE INDEX IF NOT EXISTS runs_by_model_hash ON runs (model_hash);
+
+        CREATE TABLE IF NOT EXISTS metrics (
+            run INTEGER NOT NULL REFERENCES runs (id),
+            service TEXT NOT NULL,
+            time REAL,
+            probe TEXT NOT NULL,
+            value REAL
+        );
+        CREATE INDEX IF NOT EXISTS metrics_by_run_service_time ON metrics (run, service, time);
+
+        CREATE TABLE IF NOT EXISTS summaries (
+            run INTEGER NOT NULL REFERENCES runs (id),
+            service TEXT NOT NULL,
+            probe TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            mean REAL,
+            minimum REAL,
+            maximum REAL,
+            PRIMARY KEY (run, service, probe)
+        );
+
+        CREATE TABLE IF NOT EXISTS trace (
+            run INTEGER NOT NULL REFERENCES runs (id),
+            time INTEGER NOT NULL,
+            context TEXT NOT NULL,
+            message TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS trace_by_run_time ON trace (run, time);
+    """
+
+    def __init__(self, location):
+        self.connection = connect(location)
+        self.connection.executescript(self.SCHEMA)
+
+    def new_run(self, model, source, length=None, seed=None, version=None):
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (model, model_hash, source, started, length, seed, version) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (model, sha256(source.encode("utf-8")).hexdigest(), source, datetime.now().isoformat(),
+                 length, seed, version))
+        return cursor.lastrowid
+
+    def insert_metrics(self, rows):
+        """
+        Insert the given (run, service, time, probe, value) rows, within a single transaction
+        """
+        with self.connection:
+            self.connection.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?, ?)", rows)
+
+    def insert_trace(self, rows):
+        """
+        Insert the given (run, time, context, message) rows, within a single transaction
+        """
+        with self.connection:
+            self.connection.executemany("INSERT INTO trace VALUES (?, ?, ?, ?)", rows)
+
+    def summarise(self, run):
+        """
+        Summarise each metric of the given run, from the metrics inserted so far
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM summaries WHERE run = ?", (run,))
+            self.connection.execute(
+                "INSERT INTO summaries "
+                "SELECT run, service, probe, count(value), avg(value), min(value), max(value) "
+                "FROM metrics WHERE run = ? GROUP BY service, probe",
+                (run,))
+
+    def close(self):
+        self.connection.close()
+
+
+class DatabaseStorage(DataStorage):
+    """
+    Store the trace and the reports of the given run into the given database, rather than into files
+    """
+
+    def __init__(self, parser, database, run):
+        super().__init__(parser,
+                         DatabaseLog(database, run),
+                         lambda name, format: DatabaseReport(database, run, name, format))
+        self.database = database
+        self.run = run
+
+    def close(self):
+        """
+        Summarise the run, once and for all, and close the database
+        """
+        self.database.summarise(self.run)
+        self.database.close()
+
+
+class DatabaseLog(Log):
+    """
+    Buffer the trace and insert it into the database by batches
+    """
+
+    BATCH_SIZE = 10000
+
+    def __init__(self, database, run):
+        super().__init__()
+        self.database = database
+        self.run = run
+        self._pending = []
+
+    def record(self, time, context, message):
+        self._pending.append((self.run, time, context, message))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self.database.insert_trace(self._pending)
+            self._pending = []
+
+
+class DatabaseReport:
+    """
+    Buffer the samples of a service (see mad.simulation.monitoring.Samples) and insert them into the
+    database by batches, one row per probe and per sample. Samples are associated with the value of
+    their 'time' probe, if any, which is therefore not stored as a metric itself.
+    """
+
+    BATCH_SIZE = 50000
+    TIME = "time"
+
+    def __init__(self, database, run, service, fields_format):
+        self.database = database
+        self.run = run
+        self.service = service
+        self.names = [each_name for (each_name, _) in fields_format]
+        self._pending = []
+
+    def write(self, samples, start, end):
+        times = self._times(samples, start, end)
+        for each_name in self.names:
+            if each_name == self.TIME:
+                continue
+            try:
+                values = samples.column(each_name)[start:end]
+            except KeyError:
+                continue
+            self._pending.extend((self.run, self.service, each_time, each_name, each_value)
+                                 for (each_time, each_value) in zip(times, values))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+
+    def _times(self, samples, start, end):
+        try:
+            return samples.column(self.TIME)[start:end]
+        except KeyError:
+            return [None] * (end - start)
+
+    def flush(self):
+        if self._pending:
+            self.database.insert_metrics(self._pending)
+            self._pending = []
@@ -22,6 +22,9 @@ class Environment:
     """
     Hold bindings that associate a symbol to an object during the simulation
     """
+
+    __slots__ = ("bindings",)
+
     def __init__(self):
         self.bindings = {}
 
@@ -54,6 +57,8 @@ class LocalEnvironment(Environment):
     and previous dynamic scope, respectively.
     """
 
+    __slots__ = ("parent", "dynamic_scope")
+
     def __init__(self, lexical_scope, dynamic_scope):
         super().__init__()
         assert \
@@ -17,8 +17,6 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-from random import random
-
 from mad.ast.settings import Settings
 
 
@@ -28,6 +26,7 @@ class Symbols:
     LISTENER = "!listener"
     LOGGER = "!logger"
     MONITOR = "!monitor"
+    MONITORING = "!monitoring"
     SELF = "!self"
     SERVICE = "!service"
     SIMULATION = "!simulation"
@@ -53,7 +52,7 @@ class SimulationFactory:
     def create_listener(self):
         self._abort(self.create_listener.__name__)
 
-    def create_monitor(self, period):
+    def create_monitor(self, name, environment, period, probes=None):
         self._abort(self.create_monitor.__name__)
 
     def create_logger(self, environment):
@@ -68,7 +67,7 @@ class SimulationFactory:
     def create_autoscaler(self, environment, strategy):
         self._abort(self.create_autoscaler.__name__)
 
-    def create_backoff(self, delay):
+    def create_backoff(self, delay, random_stream):
         self._abort(self.create_backoff.__name__)
 
     def create_operation(self, environment, definition):
@@ -132,7 +131,8 @@ class Evaluation:
         service_environment.define(Symbols.WORKER_POOL, worker_pool)
         service = self.factory.create_service(service.name, service_environment)
         self._define(service.name, service)
-        monitor = self.factory.create_monitor(Symbols.MONITOR, service_environment, None)
+        monitoring = service_environment.look_up(Symbols.MONITORING)
+        monitor = self.factory.create_monitor(Symbols.MONITOR, service_environment, monitoring.period, monitoring.probes)
         service_environment.define(Symbols.MONITOR, monitor)
         logger = self.factory.create_logger(service_environment)
         service_environment.define(Symbols.LOGGER, logger)
@@ -142,34 +142,39 @@ class Evaluation:
         self._evaluation_of(settings.queue)
         self._evaluation_of(settings.throttling)
         self._evaluation_of(settings.autoscaling)
-        return self.continuation(Success(None))
+        self._evaluation_of(settings.monitoring)
+        return self.continuation(SUCCEEDED)
+
+    def of_monitoring(self, monitoring):
+        self._define(Symbols.MONITORING, monitoring)
+        return self.continuation(SUCCEEDED)
 
     def of_fifo(self, fifo):
         queue = self.factory.create_FIFO_task_pool(self.environment)
         self._define(Symbols.QUEUE, queue)
-        return self.continuation(Success(None))
+        return self.continuation(SUCCEEDED)
 
     def of_lifo(self, lifo):
         queue = self.factory.create_LIFO_task_pool(self.environment)
         self._define(Symbols.QUEUE, queue)
-        return self.continuation(Success(None))
+        return self.continuation(SUCCEEDED)
 
     def of_autoscaling(self, autoscaling):
         autoscaler = self.factory.create_autoscaler(self.environment, autoscaling)
         self._define(Symbols.AUTOSCALING, autoscaler)
-        return self.continuation(Success(None))
+        return self.continuation(SUCCEEDED)
 
     def of_tail_drop(self, definition):
         task_pool = self._look_up(Symbols.QUEUE)
         tail_drop = self.factory.create_tail_drop(self.environment, definition.capacity, task_pool)
         self._define(Symbols.QUEUE, tail_drop)
-        return self.continuation(Success(None))
+        return self.continuation(SUCCEEDED)
 
     def of_no_throttling(self, no_throttling):
         task_pool = self._look_up(Symbols.QUEUE)
         no_throttling = self.factory.create_no_throttling(self.environment, task_pool)
         self._define(Symbols.QUEUE, no_throttling)
-        return self.continuation(Success(None))
+        return self.continuation(SUCCEEDED)
 
     def of_operation_definition(self, operation_definition):
         operation = self.factory.create_operation(self.environment, operation_definition)
@@ -196,103 +201,14 @@ class Evaluation:
                 return self.continuation(previous)
         return self._evaluation_of(sequence.first_expression, abort_on_error)
 
-    def of_trigger(self, trigger):
-        return self._compute(
-            duration=1,
-            after=lambda status: self._do_trigger(trigger))
-
-    def of_query(self, query):
-        return self._compute(
-            duration=1,
-            after=lambda status: self._send_query(query))
-
-    def of_think(self, think):
-        """
-        Simulate the worker processing the task for the specified amount of time.
-        The worker is not released and the task is not paused.
-        """
-        return self._compute(
-            duration=think.duration,
-            after=self.continuation)
-
-    def of_fail(self, fail):
-        if random() < fail.probability:
-            return self.continuation(Error())
-        else:
-            return self.continuation(Success(None))
-
-    def of_retry(self, retry):
-        task = self._look_up(Symbols.TASK)
-        sender = self._look_up(Symbols.SELF)
-        backoff = self.factory.create_backoff(retry.delay)
-
-        def retry_on_error(remaining_tries):
-            if remaining_tries <= 0:
-                return lambda s: self.continuation(Error())
-            else:
-                def continuation(status):
-                    if status.is_successful:
-                        return self.continuation(Success(None))
-                    else:
-                        def try_again(worker):
-                            self._evaluation_of(retry.expression, retry_on_error(remaining_tries-1))
-
-                        delay = backoff.delay(retry.limit - remaining_tries)
-                        sender.schedule.after(delay, lambda: task.resume_with(try_again))
-                        task.pause()
-                        return Paused()
-
-                return continuation
-
-        return self._evaluation_of(retry.expression, retry_on_error(retry.limit-1))
-
-    def of_ignore_error(self, ignore_error):
-        def ignore_status(status):
-            return self.continuation(Success(status.value))
-        return self._evaluation_of(ignore_error.expression, ignore_status)
-
-    def _do_trigger(self, trigger):
-        task = self._look_up(Symbols.TASK)
-
-        request = self.factory.create_trigger(task, trigger.operation, trigger.priority, self.continuation)
-        recipient = self._look_up(trigger.service)
-        request.send_to(recipient)
-
-        task.pause()
-        return Paused()
-
-    def _send_query(self, query):
-        task = self._look_up(Symbols.TASK)
-        sender = self._look_up(Symbols.SELF)
-
-        request = self.factory.create_query(task, query.operation, query.priority, self.continuation)
-
-        recipient = self._look_up(query.service)
-        request.send_to(recipient)
-
-        # TODO Move this in Request
-        if query.has_timeout:
-            def on_check_timeout():
-                if request.is_pending:
-                    sender.listener.timeout_of(request)
-                    request.discard()
-                    task.resume_with(lambda worker: self.continuation(Error()))
-
-            sender.schedule.after(query.timeout, on_check_timeout)
-
-        task.pause()
-        return Paused()
-
-    def _compute(self, duration, after):
-        task = self._look_up(Symbols.TASK)
-        task.compute(duration, continuation=lambda: after(Success()))
-        return Busy()
-
 
 class Result:
     """
-    Represent the result of an evaluation, including the status (pass, failed) and the value if associated value if any
+    Represent the result of an evaluation, including the status (pass, failed) and the value if associated value if any.
+    Results are never modified, so those without value are shared (see SUCCEEDED, FAILED, PAUSED and BUSY below).
     """
+    __slots__ = ("status", "value")
+
     PAUSED = 0
     SUCCESS = 1
     ERROR = 2
@@ -327,22 +243,34 @@ class Result:
 
 
 class Success(Result):
+    __slots__ = ()
 
     def __init__(self, value=None):
         super().__init__(Result.SUCCESS, value)
 
 
 class Error(Result):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(Result.ERROR, None)
 
 
 class Paused(Result):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(Result.PAUSED, None)
 
 
 class Busy(Result):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(Result.BUSY, None)
+
+
+SUCCEEDED = Success()
+FAILED = Error()
+PAUSED = Paused()
+BUSY = Busy()
@@ -40,6 +40,9 @@ class Log:
     def record(self, time, context, message):
         pass
 
+    def flush(self):
+        pass
+
 
 class FileLog(Log):
     """
@@ -54,3 +57,6 @@ class FileLog(Log):
     def record(self, time, context, message):
         self.output.write(self.format % (time, context, message))
 
+    def flush(self):
+        self.output.flush()
+
@@ -17,6 +17,13 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+from array import array
+from json import dumps, loads
+from math import nan
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from sys import byteorder
+
 
 class CSVReport:
     """
@@ -44,3 +51,159 @@ class CSVReport:
         self.output.write(", ".join(texts))
         self.output.write("\n")
 
+    def write(self, samples, start, end):
+        """
+        Append the given range of samples (see mad.simulation.monitoring.Samples)
+        """
+        for each_row in samples.rows(start, end):
+            self(**each_row)
+
+    def flush(self):
+        self.output.flush()
+
+
+MAGIC = b"MADCOLS1"
+_SIZE = Struct("<I")
+
+
+class ColumnarReport:
+    """
+    Write raw numeric samples into a binary output stream, laid out as follows (all numbers are
+    little-endian):
+     - the magic bytes 'MADCOLS1';
+     - the size of the header, as an unsigned 32-bit integer;
+     - the header, that is a JSON object whose 'columns' entry lists the names of the columns;
+     - a sequence of blocks, each made of its row count (an unsigned 32-bit integer), followed by the
+       values of each column in turn, as 64-bit floats where NaN stands for missing values.
+
+    Samples are buffered until a block is full or the report is flushed.
+    """
+
+    BLOCK_SIZE = 1 << 16
+
+    def __init__(self, output, fields_format):
+        self.output = output
+        self.names = [each_name for (each_name, _) in fields_format]
+        self._pending = [array("d") for _ in self.names]
+        self._print_header()
+
+    def _print_header(self):
+        header = dumps({"columns": self.names}).encode("utf-8")
+        self.output.write(MAGIC)
+        self.output.write(_SIZE.pack(len(header)))
+        self.output.write(header)
+
+    def write(self, samples, start, end):
+        """
+        Append the given range of samples (see mad.simulation.monitoring.Samples), which must be numeric
+        """
+        for (each_name, each_column) in zip(self.names, self._pending):
+            try:
+                each_column.extend(samples.column(each_name)[start:end])
+            except KeyError:
+                each_column.extend([nan] * (end - start))
+        if len(self._pending[0]) >= self.BLOCK_SIZE:
+            self._write_block()
+
+    def _write_block(self):
+        row_count = len(self._pending[0])
+        if row_count == 0:
+            return
+        self.output.write(_SIZE.pack(row_count))
+        for each_column in self._pending:
+            if byteorder != "little":
+                each_column.byteswap()
+            self.output.write(each_column.tobytes())
+        self._pending = [array("d") for _ in self.names]
+
+    def flush(self):
+        self._write_block()
+        self.output.flush()
+
+
+class ColumnarFile:
+    """
+    Read a file written by a ColumnarReport, mapping it in memory rather than parsing it. Blocks of
+    columns are exposed as memory views on the mapping, without any copy. These views are released
+    when the file is closed, and cannot be used afterwards: copy them (e.g., 'array("d", view)') to
+    keep the values. Views derived from them (e.g., slices) must be released before closing.
+    """
+
+    def __init__(self, location):
+        with open(location, "rb") as stream:
+            self._content = mmap(stream.fileno(), 0, access=ACCESS_READ)
+        if self._content[:len(MAGIC)] != MAGIC:
+            self._content.close()
+            raise ValueError("'{0:s}' is not a columnar report".format(location))
+        offset = len(MAGIC)
+        (header_size,) = _SIZE.unpack_from(self._content, offset)
+        offset += _SIZE.size
+        self.names = loads(self._content[offset:offset + header_size].decode("utf-8"))["columns"]
+        self._blocks = self._index_blocks(offset + header_size)
+        self._views = [memoryview(self._content)]
+
+    def _index_blocks(self, offset):
+        blocks = []
+        while offset < len(self._content):
+            (row_count,) = _SIZE.unpack_from(self._content, offset)
+            offset += _SIZE.size
+            blocks.append((offset, row_count))
+            offset += row_count * 8 * len(self.names)
+        return blocks
+
+    @property
+    def row_count(self):
+        return sum(row_count for (_, row_count) in self._blocks)
+
+    def blocks(self, name):
+        """
+        The successive blocks of values of the given column, as memory views of floats
+        """
+        for each_block in self._raw_blocks(name):
+            if byteorder != "little":
+                swapped = array("d")
+                swapped.frombytes(each_block)
+                swapped.byteswap()
+                yield memoryview(swapped)
+            else:
+                yield self._handed_out(each_block.cast("d"))
+
+    def _raw_blocks(self, name):
+        index = self.names.index(name)
+        content = self._views[0]
+        for (offset, row_count) in self._blocks:
+            start = offset + index * row_count * 8
+            yield self._handed_out(content[start:start + row_count * 8])
+
+    def _handed_out(self, view):
+        """
+        Keep track of the given view, so that it is released before the mapping gets closed
+        """
+        self._views.append(view)
+        return view
+
+    def column(self, name):
+        """
+        All the values of the given column, without copy if the file holds a single block
+        """
+        if len(self._blocks) == 1:
+            return next(self.blocks(name))
+        values = array("d")
+        for each_block in self._raw_blocks(name):
+            values.frombytes(each_block)
+        if byteorder != "little":
+            values.byteswap()
+        return values
+
+    def close(self):
+        for each_view in reversed(self._views):
+            each_view.release()
+        self._views = []
+        self._content.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *error):
+        self.close()
+
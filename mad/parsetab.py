@@ -1,13 +1,14 @@
 
 # parsetab.py
 # This file is automatically generated. Do not edit.
-_tabversion = '3.8'
+# pylint: disable=W,C,R
+_tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'A764B5F9DCEEE203180194F93875A827'
+_lr_signature = 'unitAUTOSCALING CLIENT CLOSE_BRACKET CLOSE_CURLY_BRACKET CLOSE_SQUARE_BRACKET COLON COMMA DELAY EVERY FAIL FIFO IDENTIFIER IGNORE INVOKE LIFO LIMIT LIMITS MONITORING NONE NUMBER OPEN_BRACKET OPEN_CURLY_BRACKET OPEN_SQUARE_BRACKET OPERATION PERIOD PRIORITY PROBES QUERY QUEUE REAL RETRY SERVICE SETTINGS SLASH STRING TAIL_DROP THINK THROTTLING TIMEOUT\n    unit : definition_list\n    \n    definition_list : definition definition_list\n                    | definition\n    \n    definition : define_service\n                | define_client\n    \n    define_service : SERVICE IDENTIFIER OPEN_CURLY_BRACKET settings operation_list CLOSE_CURLY_BRACKET\n                   | SERVICE IDENTIFIER OPEN_CURLY_BRACKET operation_list CLOSE_CURLY_BRACKET\n    \n    settings : SETTINGS OPEN_CURLY_BRACKET setting_list CLOSE_CURLY_BRACKET\n    \n    setting_list : setting setting_list\n                 | setting\n    \n    setting : queue\n            | autoscaling\n            | throttling\n            | monitoring\n    \n    queue : QUEUE COLON LIFO\n          | QUEUE COLON FIFO\n    \n    throttling : THROTTLING COLON NONE\n               | THROTTLING COLON TAIL_DROP OPEN_BRACKET NUMBER CLOSE_BRACKET\n    \n    autoscaling : AUTOSCALING OPEN_CURLY_BRACKET autoscaling_setting_list CLOSE_CURLY_BRACKET\n    \n    autoscaling_setting_list : autoscaling_setting autoscaling_setting_list\n                             | autoscaling_setting\n    \n    autoscaling_setting : PERIOD COLON NUMBER\n                        | LIMITS COLON OPEN_SQUARE_BRACKET NUMBER COMMA NUMBER CLOSE_SQUARE_BRACKET\n    \n    monitoring : MONITORING COLON NONE\n               | MONITORING OPEN_CURLY_BRACKET monitoring_setting_list CLOSE_CURLY_BRACKET\n    \n    monitoring_setting_list : monitoring_setting monitoring_setting_list\n                            | monitoring_setting\n    \n    monitoring_setting : PERIOD COLON NUMBER\n                       | PROBES COLON OPEN_SQUARE_BRACKET probe_list CLOSE_SQUARE_BRACKET\n    \n    probe_list : probe COMMA probe_list\n               | probe\n    \n    probe : STRING\n          | IDENTIFIER\n          | QUEUE\n    \n    operation_list : define_operation operation_list\n                   | define_operation\n    \n    define_client : CLIENT IDENTIFIER OPEN_CURLY_BRACKET EVERY NUMBER OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET CLOSE_CURLY_BRACKET\n    \n    define_operation : OPERATION IDENTIFIER OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET\n    \n    action_list : action action_list\n                | action\n    \n    action : invoke\n           | query\n           | think\n           | fail\n           | retry\n           | ignore\n    \n    think : THINK NUMBER\n    \n    fail : FAIL NUMBER\n         | FAIL\n    \n    query : QUERY IDENTIFIER SLASH IDENTIFIER\n          | QUERY IDENTIFIER SLASH IDENTIFIER OPEN_CURLY_BRACKET query_option_list CLOSE_CURLY_BRACKET\n    \n    query_option_list : query_option COMMA query_option_list\n                      | query_option\n    \n    query_option : timeout\n                 | priority\n    \n    timeout : TIMEOUT COLON NUMBER\n    \n    priority : PRIORITY COLON NUMBER\n    \n    invoke : INVOKE IDENTIFIER SLASH IDENTIFIER\n           | INVOKE IDENTIFIER SLASH IDENTIFIER OPEN_CURLY_BRACKET PRIORITY COLON NUMBER CLOSE_CURLY_BRACKET\n    \n    retry : RETRY OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET\n          | RETRY OPEN_BRACKET retry_option_list CLOSE_BRACKET OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET\n    \n    retry_option_list : retry_option COMMA retry_option_list\n                      | retry_option\n    \n    retry_option : LIMIT COLON NUMBER\n                 | DELAY COLON IDENTIFIER OPEN_BRACKET NUMBER CLOSE_BRACKET\n    \n    ignore : IGNORE OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET\n    '
     
-_lr_action_items = {'TIMEOUT':([6,16,],[7,7,]),'NUMBER':([13,15,],[17,18,]),'OPEN_CURLY_BRACKET':([5,],[6,]),'COLON':([7,9,],[13,15,]),'PRIORITY':([6,16,],[9,9,]),'QUERY':([0,],[2,]),'$end':([1,5,14,],[0,-38,-39,]),'CLOSE_CURLY_BRACKET':([8,10,11,12,17,18,19,],[14,-43,-42,-41,-44,-45,-40,]),'SLASH':([3,],[4,]),'COMMA':([10,11,12,17,18,],[-43,-42,16,-44,-45,]),'IDENTIFIER':([2,4,],[3,5,]),}
+_lr_action_items = {'SERVICE':([0,3,4,5,20,25,100,],[6,6,-4,-5,-7,-6,-37,]),'CLIENT':([0,3,4,5,20,25,100,],[7,7,-4,-5,-7,-6,-37,]),'$end':([1,2,3,4,5,8,20,25,100,],[0,-1,-3,-4,-5,-2,-7,-6,-37,]),'IDENTIFIER':([6,7,17,53,54,92,93,105,112,129,],[9,10,23,75,76,106,107,119,126,119,]),'OPEN_CURLY_BRACKET':([9,10,15,23,24,33,35,57,58,106,107,109,],[11,12,21,36,37,41,44,79,81,121,122,123,]),'SETTINGS':([11,],[15,]),'OPERATION':([11,13,16,38,73,],[17,17,17,-8,-38,]),'EVERY':([12,],[18,]),'CLOSE_CURLY_BRACKET':([14,16,19,22,26,27,28,29,30,31,39,45,46,47,48,49,50,51,52,56,59,60,61,62,63,66,68,69,70,73,74,77,78,82,83,84,88,89,94,99,101,104,106,107,108,113,115,128,131,132,133,134,137,142,146,148,149,150,151,152,154,],[20,-36,25,-35,38,-10,-11,-12,-13,-14,-9,73,-40,-41,-42,-43,-44,-45,-46,-49,82,-15,-16,83,-21,-17,-24,88,-27,-38,-39,-47,-48,100,-19,-20,-25,-26,108,113,-22,-28,-58,-50,-60,-66,-18,-29,142,-53,-54,-55,146,-51,-61,-23,154,-52,-56,-57,-59,]),'NUMBER':([18,55,56,85,87,90,102,111,127,138,141,144,145,],[24,77,78,101,103,104,114,125,139,147,149,151,152,]),'QUEUE':([21,27,28,29,30,31,60,61,66,68,83,88,105,115,129,],[32,32,-11,-12,-13,-14,-15,-16,-17,-24,-19,-25,120,-18,120,]),'AUTOSCALING':([21,27,28,29,30,31,60,61,66,68,83,88,115,],[33,33,-11,-12,-13,-14,-15,-16,-17,-24,-19,-25,-18,]),'THROTTLING':([21,27,28,29,30,31,60,61,66,68,83,88,115,],[34,34,-11,-12,-13,-14,-15,-16,-17,-24,-19,-25,-18,]),'MONITORING':([21,27,28,29,30,31,60,61,66,68,83,88,115,],[35,35,-11,-12,-13,-14,-15,-16,-17,-24,-19,-25,-18,]),'COLON':([32,34,35,64,65,71,72,97,98,130,135,136,],[40,42,43,85,86,90,91,111,112,141,144,145,]),'INVOKE':([36,37,46,47,48,49,50,51,52,56,77,78,79,81,106,107,108,113,123,142,146,154,],[53,53,53,-41,-42,-43,-44,-45,-46,-49,-47,-48,53,53,-58,-50,-60,-66,53,-51,-61,-59,]),'QUERY':([36,37,46,47,48,49,50,51,52,56,77,78,79,81,106,107,108,113,123,142,146,154,],[54,54,54,-41,-42,-43,-44,-45,-46,-49,-47,-48,54,54,-58,-50,-60,-66,54,-51,-61,-59,]),'THINK':([36,37,46,47,48,49,50,51,52,56,77,78,79,81,106,107,108,113,123,142,146,154,],[55,55,55,-41,-42,-43,-44,-45,-46,-49,-47,-48,55,55,-58,-50,-60,-66,55,-51,-61,-59,]),'FAIL':([36,37,46,47,48,49,50,51,52,56,77,78,79,81,106,107,108,113,123,142,146,154,],[56,56,56,-41,-42,-43,-44,-45,-46,-49,-47,-48,56,56,-58,-50,-60,-66,56,-51,-61,-59,]),'RETRY':([36,37,46,47,48,49,50,51,52,56,77,78,79,81,106,107,108,113,123,142,146,154,],[57,57,57,-41,-42,-43,-44,-45,-46,-49,-47,-48,57,57,-58,-50,-60,-66,57,-51,-61,-59,]),'IGNORE':([36,37,46,47,48,49,50,51,52,56,77,78,79,81,106,107,108,113,123,142,146,154,],[58,58,58,-41,-42,-43,-44,-45,-46,-49,-47,-48,58,58,-58,-50,-60,-66,58,-51,-61,-59,]),'LIFO':([40,],[60,]),'FIFO':([40,],[61,]),'PERIOD':([41,44,63,70,101,104,128,148,],[64,71,64,71,-22,-28,-29,-23,]),'LIMITS':([41,63,101,148,],[65,65,-22,-23,]),'NONE':([42,43,],[66,68,]),'TAIL_DROP':([42,],[67,]),'PROBES':([44,70,104,128,],[72,72,-28,-29,]),'OPEN_BRACKET':([57,67,126,],[80,87,138,]),'SLASH':([75,76,],[92,93,]),'LIMIT':([80,110,],[97,97,]),'DELAY':([80,110,],[98,98,]),'OPEN_SQUARE_BRACKET':([86,91,],[102,105,]),'CLOSE_BRACKET':([95,96,103,124,125,147,153,],[109,-63,115,-62,-64,153,-65,]),'COMMA':([96,114,117,118,119,120,125,132,133,134,151,152,153,],[110,127,129,-32,-33,-34,-64,143,-54,-55,-56,-57,-65,]),'STRING':([105,129,],[118,118,]),'CLOSE_SQUARE_BRACKET':([116,117,118,119,120,139,140,],[128,-31,-32,-33,-34,148,-30,]),'PRIORITY':([121,122,143,],[130,136,136,]),'TIMEOUT':([122,143,],[135,135,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -16,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'query_option_list':([6,16,],[8,19,]),'query':([0,],[1,]),'priority':([6,16,],[10,10,]),'timeout':([6,16,],[11,11,]),'query_option':([6,16,],[12,12,]),}
+_lr_goto_items = {'unit':([0,],[1,]),'definition_list':([0,3,],[2,8,]),'definition':([0,3,],[3,3,]),'define_service':([0,3,],[4,4,]),'define_client':([0,3,],[5,5,]),'settings':([11,],[13,]),'operation_list':([11,13,16,],[14,19,22,]),'define_operation':([11,13,16,],[16,16,16,]),'setting_list':([21,27,],[26,39,]),'setting':([21,27,],[27,27,]),'queue':([21,27,],[28,28,]),'autoscaling':([21,27,],[29,29,]),'throttling':([21,27,],[30,30,]),'monitoring':([21,27,],[31,31,]),'action_list':([36,37,46,79,81,123,],[45,59,74,94,99,137,]),'action':([36,37,46,79,81,123,],[46,46,46,46,46,46,]),'invoke':([36,37,46,79,81,123,],[47,47,47,47,47,47,]),'query':([36,37,46,79,81,123,],[48,48,48,48,48,48,]),'think':([36,37,46,79,81,123,],[49,49,49,49,49,49,]),'fail':([36,37,46,79,81,123,],[50,50,50,50,50,50,]),'retry':([36,37,46,79,81,123,],[51,51,51,51,51,51,]),'ignore':([36,37,46,79,81,123,],[52,52,52,52,52,52,]),'autoscaling_setting_list':([41,63,],[62,84,]),'autoscaling_setting':([41,63,],[63,63,]),'monitoring_setting_list':([44,70,],[69,89,]),'monitoring_setting':([44,70,],[70,70,]),'retry_option_list':([80,110,],[95,124,]),'retry_option':([80,110,],[96,96,]),'probe_list':([105,129,],[116,140,]),'probe':([105,129,],[117,117,]),'query_option_list':([122,143,],[131,150,]),'query_option':([122,143,],[132,132,]),'timeout':([122,143,],[133,133,]),'priority':([122,143,],[134,134,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -25,59 +26,71 @@ for _k, _v in _lr_goto_items.items():
        _lr_goto[_x][_k] = _y
 del _lr_goto_items
 _lr_productions = [
-  ("S' -> query","S'",1,None,None,None),
-  ('unit -> definition_list','unit',1,'p_unit','parsing.py',117),
-  ('definition_list -> definition definition_list','definition_list',2,'p_definition_list','parsing.py',124),
-  ('definition_list -> definition','definition_list',1,'p_definition_list','parsing.py',125),
-  ('definition -> define_service','definition',1,'p_definition','parsing.py',137),
-  ('definition -> define_client','definition',1,'p_definition','parsing.py',138),
-  ('define_service -> SERVICE IDENTIFIER OPEN_CURLY_BRACKET settings operation_list CLOSE_CURLY_BRACKET','define_service',6,'p_define_service','parsing.py',145),
-  ('define_service -> SERVICE IDENTIFIER OPEN_CURLY_BRACKET operation_list CLOSE_CURLY_BRACKET','define_service',5,'p_define_service','parsing.py',146),
-  ('settings -> SETTINGS OPEN_CURLY_BRACKET setting_list CLOSE_CURLY_BRACKET','settings',4,'p_settings','parsing.py',157),
-  ('setting_list -> setting setting_list','setting_list',2,'p_setting_list','parsing.py',164),
-  ('setting_list -> setting','setting_list',1,'p_setting_list','parsing.py',165),
-  ('setting -> queue','setting',1,'p_setting','parsing.py',177),
-  ('setting -> autoscaling','setting',1,'p_setting','parsing.py',178),
-  ('setting -> throttling','setting',1,'p_setting','parsing.py',179),
-  ('queue -> QUEUE COLON LIFO','queue',3,'p_queue','parsing.py',186),
-  ('queue -> QUEUE COLON FIFO','queue',3,'p_queue','parsing.py',187),
-  ('throttling -> THROTTLING COLON NONE','throttling',3,'p_throttling','parsing.py',201),
-  ('throttling -> THROTTLING COLON TAIL_DROP OPEN_BRACKET NUMBER CLOSE_BRACKET','throttling',6,'p_throttling','parsing.py',202),
-  ('autoscaling -> AUTOSCALING OPEN_CURLY_BRACKET autoscaling_setting_list CLOSE_CURLY_BRACKET','autoscaling',4,'p_autoscaling','parsing.py',212),
-  ('autoscaling_setting_list -> autoscaling_setting autoscaling_setting_list','autoscaling_setting_list',2,'p_autoscaling_setting_list','parsing.py',219),
-  ('autoscaling_setting_list -> autoscaling_setting','autoscaling_setting_list',1,'p_autoscaling_setting_list','parsing.py',220),
-  ('autoscaling_setting -> PERIOD COLON NUMBER','autoscaling_setting',3,'p_autoscaling_setting','parsing.py',232),
-  ('autoscaling_setting -> LIMITS COLON OPEN_SQUARE_BRACKET NUMBER COMMA NUMBER CLOSE_SQUARE_BRACKET','autoscaling_setting',7,'p_autoscaling_setting','parsing.py',233),
-  ('operation_list -> define_operation operation_list','operation_list',2,'p_operation_list','parsing.py',245),
-  ('operation_list -> define_operation','operation_list',1,'p_operation_list','parsing.py',246),
-  ('define_client -> CLIENT IDENTIFIER OPEN_CURLY_BRACKET EVERY NUMBER OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET CLOSE_CURLY_BRACKET','define_client',9,'p_define_client','parsing.py',258),
-  ('define_operation -> OPERATION IDENTIFIER OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET','define_operation',5,'p_define_operation','parsing.py',265),
-  ('action_list -> action action_list','action_list',2,'p_action_list','parsing.py',272),
-  ('action_list -> action','action_list',1,'p_action_list','parsing.py',273),
-  ('action -> invoke','action',1,'p_action','parsing.py',285),
-  ('action -> query','action',1,'p_action','parsing.py',286),
-  ('action -> think','action',1,'p_action','parsing.py',287),
-  ('action -> fail','action',1,'p_action','parsing.py',288),
-  ('action -> retry','action',1,'p_action','parsing.py',289),
-  ('action -> ignore','action',1,'p_action','parsing.py',290),
-  ('think -> THINK NUMBER','think',2,'p_think','parsing.py',297),
-  ('fail -> FAIL NUMBER','fail',2,'p_fail','parsing.py',304),
-  ('fail -> FAIL','fail',1,'p_fail','parsing.py',305),
-  ('query -> QUERY IDENTIFIER SLASH IDENTIFIER','query',4,'p_query','parsing.py',314),
-  ('query -> QUERY IDENTIFIER SLASH IDENTIFIER OPEN_CURLY_BRACKET query_option_list CLOSE_CURLY_BRACKET','query',7,'p_query','parsing.py',315),
-  ('query_option_list -> query_option COMMA query_option_list','query_option_list',3,'p_query_option_list','parsing.py',325),
-  ('query_option_list -> query_option','query_option_list',1,'p_query_option_list','parsing.py',326),
-  ('query_option -> timeout','query_option',1,'p_query_option','parsing.py',338),
-  ('query_option -> priority','query_option',1,'p_query_option','parsing.py',339),
-  ('timeout -> TIMEOUT COLON NUMBER','timeout',3,'p_timeout','parsing.py',346),
-  ('priority -> PRIORITY COLON NUMBER','priority',3,'p_priority','parsing.py',353),
-  ('invoke -> INVOKE IDENTIFIER SLASH IDENTIFIER','invoke',4,'p_invoke','parsing.py',360),
-  ('invoke -> INVOKE IDENTIFIER SLASH IDENTIFIER OPEN_CURLY_BRACKET PRIORITY COLON NUMBER CLOSE_CURLY_BRACKET','invoke',9,'p_invoke','parsing.py',361),
-  ('retry -> RETRY OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET','retry',4,'p_retry','parsing.py',371),
-  ('retry -> RETRY OPEN_BRACKET retry_option_list CLOSE_BRACKET OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET','retry',7,'p_retry','parsing.py',372),
-  ('retry_option_list -> retry_option COMMA retry_option_list','retry_option_list',3,'p_retry_option_list','parsing.py',384),
-  ('retry_option_list -> retry_option','retry_option_list',1,'p_retry_option_list','parsing.py',385),
-  ('retry_option -> LIMIT COLON NUMBER','retry_option',3,'p_retry_option','parsing.py',397),
-  ('retry_option -> DELAY COLON IDENTIFIER OPEN_BRACKET NUMBER CLOSE_BRACKET','retry_option',6,'p_retry_option','parsing.py',398),
-  ('ignore -> IGNORE OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET','ignore',4,'p_ignore','parsing.py',410),
+  ("S' -> unit","S'",1,None,None,None),
+  ('unit -> definition_list','unit',1,'p_unit','parsing.py',125),
+  ('definition_list -> definition definition_list','definition_list',2,'p_definition_list','parsing.py',132),
+  ('definition_list -> definition','definition_list',1,'p_definition_list','parsing.py',133),
+  ('definition -> define_service','definition',1,'p_definition','parsing.py',145),
+  ('definition -> define_client','definition',1,'p_definition','parsing.py',146),
+  ('define_service -> SERVICE IDENTIFIER OPEN_CURLY_BRACKET settings operation_list CLOSE_CURLY_BRACKET','define_service',6,'p_define_service','parsing.py',153),
+  ('define_service -> SERVICE IDENTIFIER OPEN_CURLY_BRACKET operation_list CLOSE_CURLY_BRACKET','define_service',5,'p_define_service','parsing.py',154),
+  ('settings -> SETTINGS OPEN_CURLY_BRACKET setting_list CLOSE_CURLY_BRACKET','settings',4,'p_settings','parsing.py',165),
+  ('setting_list -> setting setting_list','setting_list',2,'p_setting_list','parsing.py',172),
+  ('setting_list -> setting','setting_list',1,'p_setting_list','parsing.py',173),
+  ('setting -> queue','setting',1,'p_setting','parsing.py',185),
+  ('setting -> autoscaling','setting',1,'p_setting','parsing.py',186),
+  ('setting -> throttling','setting',1,'p_setting','parsing.py',187),
+  ('setting -> monitoring','setting',1,'p_setting','parsing.py',188),
+  ('queue -> QUEUE COLON LIFO','queue',3,'p_queue','parsing.py',195),
+  ('queue -> QUEUE COLON FIFO','queue',3,'p_queue','parsing.py',196),
+  ('throttling -> THROTTLING COLON NONE','throttling',3,'p_throttling','parsing.py',210),
+  ('throttling -> THROTTLING COLON TAIL_DROP OPEN_BRACKET NUMBER CLOSE_BRACKET','throttling',6,'p_throttling','parsing.py',211),
+  ('autoscaling -> AUTOSCALING OPEN_CURLY_BRACKET autoscaling_setting_list CLOSE_CURLY_BRACKET','autoscaling',4,'p_autoscaling','parsing.py',221),
+  ('autoscaling_setting_list -> autoscaling_setting autoscaling_setting_list','autoscaling_setting_list',2,'p_autoscaling_setting_list','parsing.py',228),
+  ('autoscaling_setting_list -> autoscaling_setting','autoscaling_setting_list',1,'p_autoscaling_setting_list','parsing.py',229),
+  ('autoscaling_setting -> PERIOD COLON NUMBER','autoscaling_setting',3,'p_autoscaling_setting','parsing.py',241),
+  ('autoscaling_setting -> LIMITS COLON OPEN_SQUARE_BRACKET NUMBER COMMA NUMBER CLOSE_SQUARE_BRACKET','autoscaling_setting',7,'p_autoscaling_setting','parsing.py',242),
+  ('monitoring -> MONITORING COLON NONE','monitoring',3,'p_monitoring','parsing.py',254),
+  ('monitoring -> MONITORING OPEN_CURLY_BRACKET monitoring_setting_list CLOSE_CURLY_BRACKET','monitoring',4,'p_monitoring','parsing.py',255),
+  ('monitoring_setting_list -> monitoring_setting monitoring_setting_list','monitoring_setting_list',2,'p_monitoring_setting_list','parsing.py',265),
+  ('monitoring_setting_list -> monitoring_setting','monitoring_setting_list',1,'p_monitoring_setting_list','parsing.py',266),
+  ('monitoring_setting -> PERIOD COLON NUMBER','monitoring_setting',3,'p_monitoring_setting','parsing.py',278),
+  ('monitoring_setting -> PROBES COLON OPEN_SQUARE_BRACKET probe_list CLOSE_SQUARE_BRACKET','monitoring_setting',5,'p_monitoring_setting','parsing.py',279),
+  ('probe_list -> probe COMMA probe_list','probe_list',3,'p_probe_list','parsing.py',291),
+  ('probe_list -> probe','probe_list',1,'p_probe_list','parsing.py',292),
+  ('probe -> STRING','probe',1,'p_probe','parsing.py',304),
+  ('probe -> IDENTIFIER','probe',1,'p_probe','parsing.py',305),
+  ('probe -> QUEUE','probe',1,'p_probe','parsing.py',306),
+  ('operation_list -> define_operation operation_list','operation_list',2,'p_operation_list','parsing.py',316),
+  ('operation_list -> define_operation','operation_list',1,'p_operation_list','parsing.py',317),
+  ('define_client -> CLIENT IDENTIFIER OPEN_CURLY_BRACKET EVERY NUMBER OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET CLOSE_CURLY_BRACKET','define_client',9,'p_define_client','parsing.py',329),
+  ('define_operation -> OPERATION IDENTIFIER OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET','define_operation',5,'p_define_operation','parsing.py',336),
+  ('action_list -> action action_list','action_list',2,'p_action_list','parsing.py',343),
+  ('action_list -> action','action_list',1,'p_action_list','parsing.py',344),
+  ('action -> invoke','action',1,'p_action','parsing.py',356),
+  ('action -> query','action',1,'p_action','parsing.py',357),
+  ('action -> think','action',1,'p_action','parsing.py',358),
+  ('action -> fail','action',1,'p_action','parsing.py',359),
+  ('action -> retry','action',1,'p_action','parsing.py',360),
+  ('action -> ignore','action',1,'p_action','parsing.py',361),
+  ('think -> THINK NUMBER','think',2,'p_think','parsing.py',368),
+  ('fail -> FAIL NUMBER','fail',2,'p_fail','parsing.py',375),
+  ('fail -> FAIL','fail',1,'p_fail','parsing.py',376),
+  ('query -> QUERY IDENTIFIER SLASH IDENTIFIER','query',4,'p_query','parsing.py',385),
+  ('query -> QUERY IDENTIFIER SLASH IDENTIFIER OPEN_CURLY_BRACKET query_option_list CLOSE_CURLY_BRACKET','query',7,'p_query','parsing.py',386),
+  ('query_option_list -> query_option COMMA query_option_list','query_option_list',3,'p_query_option_list','parsing.py',396),
+  ('query_option_list -> query_option','query_option_list',1,'p_query_option_list','parsing.py',397),
+  ('query_option -> timeout','query_option',1,'p_query_option','parsing.py',409),
+  ('query_option -> priority','query_option',1,'p_query_option','parsing.py',410),
+  ('timeout -> TIMEOUT COLON NUMBER','timeout',3,'p_timeout','parsing.py',417),
+  ('priority -> PRIORITY COLON NUMBER','priority',3,'p_priority','parsing.py',424),
+  ('invoke -> INVOKE IDENTIFIER SLASH IDENTIFIER','invoke',4,'p_invoke','parsing.py',431),
+  ('invoke -> INVOKE IDENTIFIER SLASH IDENTIFIER OPEN_CURLY_BRACKET PRIORITY COLON NUMBER CLOSE_CURLY_BRACKET','invoke',9,'p_invoke','parsing.py',432),
+  ('retry -> RETRY OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET','retry',4,'p_retry','parsing.py',442),
+  ('retry -> RETRY OPEN_BRACKET retry_option_list CLOSE_BRACKET OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET','retry',7,'p_retry','parsing.py',443),
+  ('retry_option_list -> retry_option COMMA retry_option_list','retry_option_list',3,'p_retry_option_list','parsing.py',455),
+  ('retry_option_list -> retry_option','retry_option_list',1,'p_retry_option_list','parsing.py',456),
+  ('retry_option -> LIMIT COLON NUMBER','retry_option',3,'p_retry_option','parsing.py',468),
+  ('retry_option -> DELAY COLON IDENTIFIER OPEN_BRACKET NUMBER CLOSE_BRACKET','retry_option',6,'p_retry_option','parsing.py',469),
+  ('ignore -> IGNORE OPEN_CURLY_BRACKET action_list CLOSE_CURLY_BRACKET','ignore',4,'p_ignore','parsing.py',481),
 ]
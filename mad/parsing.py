@@ -37,10 +37,12 @@ reserved = {
     "LIFO": "LIFO",
     "limit": "LIMIT",
     "limits": "LIMITS",
+    "monitoring": "MONITORING",
     "none": "NONE",
     "operation": "OPERATION",
     "period": "PERIOD",
     "priority": "PRIORITY",
+    "probes": "PROBES",
     "queue": "QUEUE",
     "query": "QUERY",
     "retry": "RETRY",
@@ -64,7 +66,8 @@ tokens = [  "CLOSE_BRACKET",
             "OPEN_SQUARE_BRACKET",
             "NUMBER",
             "REAL",
-            "SLASH"] + list(reserved.values())
+            "SLASH",
+            "STRING"] + list(reserved.values())
 
 t_CLOSE_BRACKET = r"\)"
 t_CLOSE_CURLY_BRACKET = r"\}"
@@ -82,6 +85,11 @@ def t_IDENTIFIER(t):
     t.type = reserved.get(t.value,'IDENTIFIER')    # Check for reserved words
     return t
 
+def t_STRING(t):
+    r'"[^"\n]*"'
+    t.value = t.value[1:-1]
+    return t
+
 def t_NUMBER(t):
     r'[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?'
     return t
@@ -177,6 +185,7 @@ def p_setting(p):
     setting : queue
             | autoscaling
             | throttling
+            | monitoring
     """
     p[0] = p[1]
 
@@ -240,6 +249,83 @@ def p_autoscaling_setting(p):
         raise RuntimeError("Invalid product in 'autoscaling_setting'")
 
 
+def p_monitoring(p):
+    """
+    monitoring : MONITORING COLON NONE
+               | MONITORING OPEN_CURLY_BRACKET monitoring_setting_list CLOSE_CURLY_BRACKET
+    """
+    if len(p) == 4:
+        p[0] = {"monitoring": Monitoring(probes=[])}
+    else:
+        p[0] = {"monitoring": Monitoring(**p[3])}
+
+
+def p_monitoring_setting_list(p):
+    """
+    monitoring_setting_list : monitoring_setting monitoring_setting_list
+                            | monitoring_setting
+    """
+    if len(p) == 3:
+        p[0] = merge_map(p[1], p[2])
+    elif len(p) == 2:
+        p[0] = p[1]
+    else:
+        raise RuntimeError("Invalid production in 'monitoring_setting_list'")
+
+
+def p_monitoring_setting(p):
+    """
+    monitoring_setting : PERIOD COLON NUMBER
+                       | PROBES COLON OPEN_SQUARE_BRACKET probe_list CLOSE_SQUARE_BRACKET
+    """
+    if len(p) == 6:
+        p[0] = {"probes": p[4]}
+    elif len(p) == 4:
+        p[0] = {"period": int(p[3])}
+    else:
+        raise RuntimeError("Invalid production in 'monitoring_setting'")
+
+
+def p_probe_list(p):
+    """
+    probe_list : probe COMMA probe_list
+               | probe
+    """
+    if len(p) == 4:
+        p[0] = [p[1]] + p[3]
+    elif len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        raise RuntimeError("Invalid production in 'probe_list'")
+
+
+def p_probe(p):
+    """
+    probe : STRING
+          | IDENTIFIER
+          | QUEUE
+    """
+    if p.slice[1].type == "STRING":
+        p[0] = p[1]
+    else:
+        p[0] = probe_name(p[1])
+
+
+def probe_name(identifier):
+    """
+    Spell out the probe keyword that starts the given identifier (e.g., 'response-time' stands for
+    'response time'). The rest, if any, is the name of an operation, whose hyphens are kept.
+    """
+    keywords = sorted(set(Monitoring.SERVICE_PROBES + Monitoring.OPERATION_PROBES), key=len, reverse=True)
+    for each_keyword in keywords:
+        hyphenated = each_keyword.replace(" ", "-")
+        if identifier == hyphenated:
+            return each_keyword
+        if identifier.startswith(hyphenated + "-"):
+            return each_keyword + " " + identifier[len(hyphenated) + 1:]
+    return identifier
+
+
 def p_operation_list(p):
     """
     operation_list : define_operation operation_list
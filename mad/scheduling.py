@@ -17,13 +17,19 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+from collections import deque
+from heapq import heapify, heappush, heappop
+
 
 class Event:
     """
-    Hold a action (i.e., a callable object) and the time at which this action shall be triggered
+    Hold a action (i.e., a callable object), the arguments it shall be called with, and the time at which
+    this action shall be triggered
     """
 
-    def __init__(self, time, action):
+    __slots__ = ("time", "action", "arguments", "pool", "is_cancelled")
+
+    def __init__(self, time, action, arguments=()):
         if not isinstance(time, int):
             raise ValueError("Time must be an integer value (found '%s')." % type(time))
         self.time = time
@@ -31,12 +37,24 @@ class Event:
         if not callable(action):
             raise ValueError("Only 'callable' objects can be scheduled (found '%s')." % (type(action)))
         self.action = action
+        self.arguments = arguments
+        self.pool = None
+        self.is_cancelled = False
 
     def __repr__(self):
         return "Event(%d, %s)" % (self.time, str(self.action))
 
     def trigger(self):
-        self.action()
+        self.action(*self.arguments)
+
+    def cancel(self):
+        """
+        Prevent the action from being triggered, if it is still pending
+        """
+        if not self.is_cancelled:
+            self.is_cancelled = True
+            if self.pool is not None:
+                self.pool.cancel(self)
 
     def is_scheduled_after(self, time):
         return self.time > time
@@ -45,6 +63,40 @@ class Event:
         return not self.is_scheduled_after(time)
 
 
+class RecurrentEvent(Event):
+    """
+    An event that puts itself back into the schedule of its scheduler each time it is triggered, so
+    that periodic actions reuse the very same event. Changes to the period take effect from the next
+    occurrence.
+    """
+
+    __slots__ = ("_period", "_scheduler")
+
+    def __init__(self, time, period, action, scheduler):
+        super().__init__(time, action)
+        self.period = period
+        self._scheduler = scheduler
+
+    @property
+    def period(self):
+        return self._period
+
+    @period.setter
+    def period(self, period):
+        if not isinstance(period, int) or period <= 0:
+            raise ValueError("Period must be a strictly positive integer (found '%s')." % period)
+        self._period = period
+
+    def __repr__(self):
+        return "RecurrentEvent(%d, %d, %s)" % (self.time, self.period, str(self.action))
+
+    def trigger(self):
+        self.action(*self.arguments)
+        if not self.is_cancelled:
+            self.time += self._period
+            self._scheduler.schedule.put(self)
+
+
 class EventPool:
     """
     An event pool that store events, and expose then the increasing order of their due time
@@ -54,6 +106,7 @@ class EventPool:
         self.events = []
 
     def put(self, event):
+        event.pool = self
         self.events.append(event)
 
     def next_event(self):
@@ -61,12 +114,226 @@ class EventPool:
         return min(self.events, key=lambda event: event.time)
 
     def discard(self, event):
+        event.pool = None
         self.events.remove(event)
 
+    def take_next_batch(self):
+        """
+        Remove and return all the events due at the earliest time, in the order they must be triggered
+        """
+        time = self.next_event().time
+        batch = [each_event for each_event in self.events if each_event.time == time]
+        for each_event in batch:
+            self.discard(each_event)
+        return batch
+
+    def cancel(self, event):
+        self.discard(event)
+
     @property
     def is_empty(self):
         return len(self.events) == 0
 
+    @property
+    def size(self):
+        return len(self.events)
+
+
+class HeapEventPool(EventPool):
+    """
+    An event pool backed by a binary heap, where events are ordered by due time and then by
+    order of insertion, so that events due at the same time are exposed in FIFO order.
+
+    Cancelled events are not removed right away, but left in the heap as tombstones, which are
+    skipped when they reach the top, or swept away once they make up half of the heap.
+    """
+
+    COMPACTION_THRESHOLD = 64
+
+    def __init__(self):
+        super().__init__()
+        self._counter = 0
+        self._tombstones = 0
+
+    def put(self, event):
+        event.pool = self
+        heappush(self.events, (event.time, self._counter, event))
+        self._counter += 1
+
+    def next_event(self):
+        assert not self.is_empty, "No event is scheduled"
+        while self.events[0][-1].is_cancelled:
+            heappop(self.events)
+            self._tombstones -= 1
+        return self.events[0][-1]
+
+    def discard(self, event):
+        event.pool = None
+        if self.events[0][-1] is event:
+            heappop(self.events)
+        else:
+            self.events = [each_entry for each_entry in self.events if each_entry[-1] is not event]
+            heapify(self.events)
+
+    def take_next_batch(self):
+        time = self.next_event().time
+        batch = []
+        while self.events and self.events[0][0] == time:
+            event = heappop(self.events)[-1]
+            if event.is_cancelled:
+                self._tombstones -= 1
+            else:
+                event.pool = None
+                batch.append(event)
+        return batch
+
+    def cancel(self, event):
+        self._tombstones += 1
+        if self._tombstones > max(self.COMPACTION_THRESHOLD, len(self.events) // 2):
+            self._compact()
+
+    def _compact(self):
+        self.events = [each_entry for each_entry in self.events if not each_entry[-1].is_cancelled]
+        heapify(self.events)
+        self._tombstones = 0
+
+    @property
+    def is_empty(self):
+        return len(self.events) == self._tombstones
+
+    @property
+    def size(self):
+        return len(self.events) - self._tombstones
+
+
+class CalendarEventPool(EventPool):
+    """
+    An event pool organised as a timing wheel, which exploits the integer nature of time. Events
+    due within the next 'size' units of time are stored in one bucket per time unit, whereas the
+    other events wait in an overflow heap until the wheel reaches them. Events due at the same
+    time are exposed in FIFO order.
+
+    As in the heap-based pool, cancelled events are left in place as tombstones.
+    """
+
+    DEFAULT_SIZE = 1024
+    COMPACTION_THRESHOLD = 64
+
+    def __init__(self, size=DEFAULT_SIZE):
+        assert size > 0, "Invalid wheel size (found %d)" % size
+        self._size = size
+        self._buckets = [deque() for _ in range(size)]
+        self._now = 0
+        self._count = 0
+        self._overflow = []
+        self._counter = 0
+        self._tombstones = 0
+
+    def put(self, event):
+        event.pool = self
+        if event.time < self._now:
+            self._rewind_to(event.time)
+        if event.time < self._now + self._size:
+            self._buckets[event.time % self._size].append(event)
+            self._count += 1
+        else:
+            heappush(self._overflow, (event.time, self._counter, event))
+            self._counter += 1
+
+    def next_event(self):
+        assert not self.is_empty, "No event is scheduled"
+        bucket = self._buckets[self._now % self._size]
+        while not bucket or bucket[0].is_cancelled:
+            if bucket:
+                bucket.popleft()
+                self._count -= 1
+                self._tombstones -= 1
+                continue
+            if self._count == 0:
+                self._now = self._overflow[0][0]
+            else:
+                self._now += 1
+            self._migrate()
+            bucket = self._buckets[self._now % self._size]
+        return bucket[0]
+
+    def discard(self, event):
+        event.pool = None
+        bucket = self._buckets[event.time % self._size]
+        if bucket and bucket[0] is event:
+            bucket.popleft()
+            self._count -= 1
+        elif any(each_event is event for each_event in bucket):
+            bucket.remove(event)
+            self._count -= 1
+        else:
+            self._overflow = [each_entry for each_entry in self._overflow if each_entry[-1] is not event]
+            heapify(self._overflow)
+
+    def take_next_batch(self):
+        self.next_event()
+        bucket = self._buckets[self._now % self._size]
+        batch = []
+        for each_event in bucket:
+            if each_event.is_cancelled:
+                self._tombstones -= 1
+            else:
+                each_event.pool = None
+                batch.append(each_event)
+        self._count -= len(bucket)
+        bucket.clear()
+        return batch
+
+    def cancel(self, event):
+        self._tombstones += 1
+        if self._tombstones > max(self.COMPACTION_THRESHOLD, (self._count + len(self._overflow)) // 2):
+            self._compact()
+
+    def _compact(self):
+        for each_bucket in self._buckets:
+            if any(each_event.is_cancelled for each_event in each_bucket):
+                live_events = [each_event for each_event in each_bucket if not each_event.is_cancelled]
+                self._count -= len(each_bucket) - len(live_events)
+                each_bucket.clear()
+                each_bucket.extend(live_events)
+        self._overflow = [each_entry for each_entry in self._overflow if not each_entry[-1].is_cancelled]
+        heapify(self._overflow)
+        self._tombstones = 0
+
+    @property
+    def is_empty(self):
+        return self._count + len(self._overflow) == self._tombstones
+
+    @property
+    def size(self):
+        return self._count + len(self._overflow) - self._tombstones
+
+    def _migrate(self):
+        horizon = self._now + self._size
+        while self._overflow and self._overflow[0][0] < horizon:
+            (time, _, event) = heappop(self._overflow)
+            self._buckets[time % self._size].append(event)
+            self._count += 1
+
+    def _rewind_to(self, time):
+        """
+        Move the wheel back in time, which only happens when the scheduler peeked at an event
+        beyond its end, and new events are later scheduled before it.
+        """
+        pending = []
+        for offset in range(self._size):
+            bucket = self._buckets[(self._now + offset) % self._size]
+            pending.extend(bucket)
+            bucket.clear()
+        while self._overflow:
+            pending.append(heappop(self._overflow)[-1])
+        self._now = time
+        self._count = 0
+        self._tombstones = 0
+        for each_event in pending:
+            if not each_event.is_cancelled:
+                self.put(each_event)
+
 
 class Clock:
     """
@@ -96,38 +363,84 @@ class Scheduler:
     Maintain a ordered list of events, which are executed according to their due date.
     """
 
-    def __init__(self, initial_time=0):
-        self.schedule = EventPool()
+    def __init__(self, initial_time=0, event_pool=None, batch_dispatch=False):
+        self.schedule = event_pool if event_pool is not None else HeapEventPool()
         self.clock = Clock(initial_time)
+        self.batch_dispatch = batch_dispatch
+        self.event_count = 0
+        self.is_stopped = False
+        self.stop_reason = None
 
     @property
     def time_now(self):
         return self.clock.time
 
-    def at(self, time, action):
-        event = Event(time, action)
+    @property
+    def pending_event_count(self):
+        return self.schedule.size
+
+    def at(self, time, action, *arguments):
+        """
+        Schedule the given action, called with the given arguments, at the given time, and return the
+        scheduled event, which can be cancelled
+        """
+        event = Event(time, action, arguments)
         if event.is_scheduled_before(self.clock.time):
             raise ValueError("Cannot schedule in the past (now is %d but found %d)" % (self.clock.time, time))
         self.schedule.put(event)
+        return event
 
-    def after(self, delay, action):
-        self.schedule.put(Event(self.time_now + delay, action))
+    def after(self, delay, action, *arguments):
+        event = Event(self.time_now + delay, action, arguments)
+        self.schedule.put(event)
+        return event
 
     def every(self, period, action):
-        def recurrent_action():
-            action()
-            self.after(period, recurrent_action)
-        self.after(period, recurrent_action)
+        event = RecurrentEvent(self.time_now + period, period, action, self)
+        self.schedule.put(event)
+        return event
+
+    def stop(self, reason=None):
+        """
+        Stop the simulation once the current event (or batch of events) is complete, regardless of
+        the pending events
+        """
+        self.is_stopped = True
+        self.stop_reason = reason
 
     def simulate_until(self, end, display=None):
-        while not self.schedule.is_empty:
+        if self.batch_dispatch:
+            self._dispatch_batches_until(end, display)
+        else:
+            self._dispatch_events_until(end, display)
+
+    def _dispatch_events_until(self, end, display):
+        while not (self.is_stopped or self.schedule.is_empty):
             event = self.schedule.next_event()
             if event.is_scheduled_after(end):
                 break
+            self.schedule.discard(event)
             self.clock.advance_to(event)
-            if display: display.update(self.time_now, end)
+            self.event_count += 1
+            if display: display.update(self.time_now, end, self.event_count)
             event.trigger()
-            self.schedule.discard(event)
-
-
 
+    def _dispatch_batches_until(self, end, display):
+        """
+        Trigger at once all the events due at the same time, so that the clock is advanced and the
+        progress reported only once per distinct time. Events scheduled for that very time while the
+        batch runs are dispatched in a subsequent batch.
+        """
+        reported_time = None
+        while not (self.is_stopped or self.schedule.is_empty):
+            if self.schedule.next_event().is_scheduled_after(end):
+                break
+            batch = self.schedule.take_next_batch()
+            self.clock.advance_to(batch[0])
+            self.event_count += len(batch)
+            if display and self.time_now != reported_time:
+                display.update(self.time_now, end, self.event_count)
+                reported_time = self.time_now
+            for each_event in batch:
+                if not each_event.is_cancelled:
+                    each_event.trigger()
@@ -17,7 +17,7 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-from random import randint
+import random
 
 
 class BackoffStrategy:
@@ -37,8 +37,9 @@ class ConstantBackoff(BackoffStrategy):
 
 class ExponentialBackoff(ConstantBackoff):
 
-    def __init__(self, base_delay):
+    def __init__(self, base_delay, random_stream=random):
         super().__init__(base_delay)
+        self.random_stream = random_stream
 
     def delay(self, attempts):
         if attempts == 0:
@@ -47,6 +48,5 @@ class ExponentialBackoff(ConstantBackoff):
             limit = 2 ** attempts - 1
             return self._pick_up_to(limit) * self.base_delay
 
-    @staticmethod
-    def _pick_up_to(limit):
-        return randint(0, limit)
\ No newline at end of file
+    def _pick_up_to(self, limit):
+        return self.random_stream.randint(0, limit)
\ No newline at end of file
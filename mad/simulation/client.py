@@ -26,6 +26,8 @@ from mad.simulation.workers import Worker
 
 class ClientRequest:
 
+    __slots__ = ("identifier", "operation", "priority", "is_pending", "response_time")
+
     def __init__(self):
         self.identifier = -1
         self.operation = Symbols.CLIENT_OPERATION
@@ -49,6 +51,7 @@ class ClientStub(SimulatedEntity):
         super().__init__(name, environment)
         self.environment.define(Symbols.SELF, self)
         self.environment.define(Symbols.SERVICE, self)
+        self.create_random_streams()
         self._define_operation(body)
         self.period = period
 
@@ -17,29 +17,48 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+from random import Random
+
 from mad.evaluation import Symbols
 
 
 class SimulatedEntity:
     """
-    Factor out commonalities between all simulated entities
+    Factor out commonalities between all simulated entities. The schedule and the listener are
+    resolved once (the listener on first use, as it may be defined after the entity), and then
+    directly referenced rather than looked up in the environment.
     """
 
     def __init__(self, name, environment):
         self.environment = environment
         self.name = name
         self.simulation = self.environment.look_up(Symbols.SIMULATION)
-
-    @property
-    def schedule(self):
-        return self.simulation.schedule
+        self.schedule = self.simulation.schedule if self.simulation is not None else None
+        self._listener = None
 
     @property
     def listener(self):
-        # TODO null-check should be part of the environment
-        listener = self.environment.look_up(Symbols.LISTENER)
-        assert listener is not None, "Error: Simulated entity '{0}' has no listener".format(self.name)
-        return listener
+        if self._listener is None:
+            # TODO null-check should be part of the environment
+            self._listener = self.environment.look_up(Symbols.LISTENER)
+            assert self._listener is not None, "Error: Simulated entity '{0}' has no listener".format(self.name)
+        return self._listener
+
+    def create_random_stream(self, purpose=None):
+        """
+        The stream of random numbers dedicated to this entity, and to the given purpose if any
+        """
+        if self.simulation is None:
+            return Random()
+        path = (self.name,) if purpose is None else (self.name, purpose)
+        return self.simulation.random_streams.stream_for(*path)
+
+    def create_random_streams(self):
+        """
+        (Re)create the streams used to draw failures and back-off delays, from the seed of the simulation
+        """
+        self.random_stream = self.create_random_stream()
+        self.backoff_stream = self.create_random_stream("backoff")
 
     def look_up(self, symbol):
         return self.environment.look_up(symbol)
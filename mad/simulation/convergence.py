@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from math import sqrt
+
+from mad.evaluation import Symbols
+from mad.simulation.commons import SimulatedEntity
+
+
+class BatchMeans:
+    """
+    Estimate the mean of a series of (auto-correlated) observations, and the half-width of its 95 %
+    confidence interval. Consecutive observations are grouped into batches, whose means are treated
+    as independent samples. The given number of first batches are discarded, so that the initial
+    transient (e.g., while queues are still empty) does not bias the estimates.
+    """
+
+    DEFAULT_BATCH_SIZE = 10
+    MINIMUM_BATCH_COUNT = 10
+
+    # 97.5 % quantiles of the Student's t-distribution, indexed by degrees of freedom
+    T_QUANTILES = [None,
+                   12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+                   2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+                   2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+    NORMAL_QUANTILE = 1.960
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, warm_up=0):
+        assert batch_size > 0, "Invalid batch size (found %d)" % batch_size
+        assert warm_up >= 0, "Invalid warm-up (found %d)" % warm_up
+        self.batch_size = batch_size
+        self.warm_up = warm_up
+        self.discarded_count = 0
+        self.batch_count = 0
+        self._batch_total = 0
+        self._batch_length = 0
+        self._mean = 0.
+        self._squared_deviations = 0.
+
+    def observe(self, value):
+        self._batch_total += value
+        self._batch_length += 1
+        if self._batch_length == self.batch_size:
+            self._close_batch(self._batch_total / self.batch_size)
+
+    def _close_batch(self, batch_mean):
+        self._batch_total = 0
+        self._batch_length = 0
+        if self.discarded_count < self.warm_up:
+            self.discarded_count += 1
+            return
+        self.batch_count += 1
+        deviation = batch_mean - self._mean
+        self._mean += deviation / self.batch_count
+        self._squared_deviations += deviation * (batch_mean - self._mean)
+
+    @property
+    def mean(self):
+        if self.batch_count == 0:
+            return None
+        return self._mean
+
+    @property
+    def half_width(self):
+        if self.batch_count < 2:
+            return None
+        variance = self._squared_deviations / (self.batch_count - 1)
+        return self._quantile(self.batch_count - 1) * sqrt(variance / self.batch_count)
+
+    def _quantile(self, degrees_of_freedom):
+        if degrees_of_freedom < len(self.T_QUANTILES):
+            return self.T_QUANTILES[degrees_of_freedom]
+        return self.NORMAL_QUANTILE
+
+    @property
+    def relative_precision(self):
+        """
+        The half-width of the confidence interval, relative to the mean, or None as long as there
+        are too few batches to tell
+        """
+        if self.batch_count < self.MINIMUM_BATCH_COUNT:
+            return None
+        half_width = self.half_width
+        if self._mean == 0:
+            return 0. if half_width == 0 else None
+        return half_width / abs(self._mean)
+
+
+class Estimate:
+    """
+    Estimate one metric of a service, from the window of time elapsed since the previous sample
+    """
+
+    def __init__(self, service, batch_size, warm_up=0):
+        self.service = service.name
+        self.statistics = service.look_up(Symbols.MONITOR).statistics
+        self.estimator = BatchMeans(batch_size, warm_up)
+
+    @property
+    def metric(self):
+        raise NotImplementedError("Estimate::metric is abstract!")
+
+    def sample(self, period):
+        raise NotImplementedError("Estimate::sample is abstract!")
+
+    @property
+    def mean(self):
+        return self.estimator.mean
+
+    @property
+    def relative_precision(self):
+        return self.estimator.relative_precision
+
+    def is_within(self, precision):
+        achieved = self.estimator.relative_precision
+        return achieved is not None and achieved <= precision
+
+
+class ThroughputEstimate(Estimate):
+
+    def __init__(self, service, batch_size, warm_up=0):
+        super().__init__(service, batch_size, warm_up)
+        self._last_count = self.statistics.success_count
+
+    @property
+    def metric(self):
+        return SteadyStateDetector.THROUGHPUT
+
+    def sample(self, period):
+        count = self.statistics.success_count
+        self.estimator.observe((count - self._last_count) / period)
+        self._last_count = count
+
+
+class ResponseTimeEstimate(Estimate):
+    """
+    Windows where no request completes are not sampled, as their response time is undefined
+    """
+
+    def __init__(self, service, batch_size, warm_up=0):
+        super().__init__(service, batch_size, warm_up)
+        self._last_count = self.statistics.success_count
+        self._last_total = self.statistics.total_response_time
+
+    @property
+    def metric(self):
+        return SteadyStateDetector.RESPONSE_TIME
+
+    def sample(self, period):
+        (count, total) = (self.statistics.success_count, self.statistics.total_response_time)
+        if count > self._last_count:
+            self.estimator.observe((total - self._last_total) / (count - self._last_count))
+        (self._last_count, self._last_total) = (count, total)
+
+
+class SteadyStateDetector(SimulatedEntity):
+    """
+    Sample the selected metrics of every service on a fixed period, and stop the simulation as soon
+    as all of them are estimated within the target relative precision. The first 'warm_up' batches of
+    samples are discarded, as the simulation starts empty.
+    """
+
+    NAME = "steady-state"
+    DEFAULT_PERIOD = 10
+    DEFAULT_WARM_UP = 2
+
+    RESPONSE_TIME = "response-time"
+    THROUGHPUT = "throughput"
+    METRICS = {
+        RESPONSE_TIME: ResponseTimeEstimate,
+        THROUGHPUT: ThroughputEstimate
+    }
+
+    def __init__(self, environment, precision, metrics=None, period=DEFAULT_PERIOD, batch_size=BatchMeans.DEFAULT_BATCH_SIZE,
+                 warm_up=DEFAULT_WARM_UP):
+        super().__init__(self.NAME, environment)
+        assert precision > 0, "Invalid target precision (found %f)" % precision
+        self.precision = precision
+        self.period = period
+        self.estimates = [self.METRICS[each_metric](each_service, batch_size, warm_up)
+                          for each_service in self.simulation.services
+                          for each_metric in metrics or sorted(self.METRICS)]
+        self._sampling = self.schedule.every(period, self.sample)
+
+    def sample(self):
+        for each_estimate in self.estimates:
+            each_estimate.sample(self.period)
+        if self.has_converged:
+            self.schedule.stop(Converged(self.schedule.time_now, self.precision, self.estimates))
+
+    @property
+    def has_converged(self):
+        return all(each_estimate.is_within(self.precision) for each_estimate in self.estimates)
+
+    @property
+    def outcome(self):
+        if self.has_converged:
+            return Converged(self.schedule.time_now, self.precision, self.estimates)
+        return NotConverged(self.schedule.time_now, self.precision, self.estimates)
+
+    def dismiss(self):
+        self._sampling.cancel()
+
+
+class Outcome:
+    """
+    How the search for a steady state ended, and with which estimates
+    """
+
+    def __init__(self, time, precision, estimates):
+        self.time = time
+        self.precision = precision
+        self.estimates = estimates
+
+    def accept(self, visitor):
+        raise NotImplementedError("Outcome::accept is abstract!")
+
+
+class Converged(Outcome):
+
+    def accept(self, visitor):
+        visitor.steady_state_reached(self)
+
+
+class NotConverged(Outcome):
+
+    def accept(self, visitor):
+        visitor.steady_state_not_reached(self)
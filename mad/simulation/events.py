@@ -22,97 +22,124 @@ INVALID_LISTENER = "Only 'Listener' objects may register (found '{0!s}')"
 
 class Listener:
     """
-    Events emitted by a service during the the simulation
+    Events emitted by a service during the the simulation. Listeners only override the handlers of
+    the events they care about.
     """
 
     # Task processing
 
     def task_created(self, task):
-        raise NotImplementedError("Listener::task_created is abstract")
+        pass
 
     def task_accepted(self, task):
-        raise NotImplementedError("Listener::tack_accepted is abstract")
+        pass
 
     def task_rejected(self, task):
-        raise NotImplementedError("Listener::task_rejected is abstract")
+        pass
 
     def task_assigned_to(self, task, worker):
-        raise NotImplementedError("Listener::task_assigned_to is abstract")
+        pass
 
     def task_paused(self, task):
-        raise NotImplementedError("Listener::task_paused is abstract")
+        pass
 
     def task_activated(self, task):
-        raise NotImplementedError("Listener::task_activated is abstract")
+        pass
 
     def task_successful(self, task):
-        raise NotImplementedError("Listener::task_successful is abstract")
+        pass
 
     def task_failed(self, task):
-        raise NotImplementedError("Listener::task_failed is abstract")
+        pass
 
     def task_cancelled(self, task):
-        raise NotImplementedError("Listener::task_cancelled is abstract")
+        pass
 
     # TODO should be removed carefully!
     def resuming(self, request):
-        raise NotImplementedError("Listener::timeout_of is abstract")
+        pass
 
     # Outgoing requests
 
     def posting_of(self, service, request):
-        raise NotImplementedError("Listener::posting_of is abstract")
+        pass
 
     def acceptance_of(self, request):
-        raise NotImplementedError("Listener::acceptance_of is abstract")
+        pass
 
     def rejection_of(self, request):
-        raise NotImplementedError("Listener::rejection_of is abstract")
+        pass
 
     def success_of(self, request):
-        raise NotImplementedError("Listener::success_of is abstract")
+        pass
 
     def failure_of(self, request):
-        raise NotImplementedError("Listener::failure_of is abstract")
+        pass
 
     def timeout_of(self, request):
-        raise NotImplementedError("Listener::timeout_of is abstract")
+        pass
 
     # Workers
 
     def worker_created(self, worker):
-        raise NotImplementedError("Listener::worker_created is abstract")
+        pass
 
     def worker_busy(self, worker):
-        raise NotImplementedError("Listener::worker_busy is abstract")
+        pass
 
     def worker_idle(self, worker):
-        raise NotImplementedError("Listener::worker_idle is abstract")
+        pass
 
     def worker_shutdown(self, worker):
-        raise NotImplementedError("Listener::worker_shutdown is abstract")
+        pass
 
 
-class Dispatcher:
+def _overrides(listener, event):
+    return getattr(type(listener), event, None) is not getattr(Listener, event)
+
+
+EVENTS = [each_name for (each_name, each_value) in vars(Listener).items()
+          if callable(each_value) and not each_name.startswith("_")]
+
+
+class Dispatcher(Listener):
     """
-    Simply dispatch events to other listeners that registered
+    Dispatch events to the listeners that registered. The subscribers of each event are sorted out at
+    registration time, and only the listeners that override the handler of an event subscribe to it.
+    Events without subscribers fall back on the no-op handlers inherited from Listener, whereas those
+    with a single subscriber go straight to its handler.
     """
 
     def __init__(self):
-        self._listeners = set()
+        self._listeners = []
+        self._subscribers = {each_event: [] for each_event in EVENTS}
 
     def register(self, listener):
         assert isinstance(listener, Listener), INVALID_LISTENER.format(type(listener))
-        self._listeners.add(listener)
-
-    def __getattr__(self, method_name):
-        def dispatch(*parameters):
-            for each_listener in self._listeners:
-                self.__dispatch(each_listener, method_name, *parameters)
-        return dispatch
-
-    def __dispatch(self, listener, method_name, *parameters):
-        method = getattr(listener, method_name)
-        assert method, "Listener {:s} has no method {:s}".format(listener, method_name)
-        assert hasattr(method, '__call__'), "{:s} is not a callable!".format(method_name)
-        method(*parameters)
+        if listener in self._listeners:
+            return
+        self._listeners.append(listener)
+        for each_event in EVENTS:
+            if _overrides(listener, each_event):
+                self._subscribers[each_event].append(getattr(listener, each_event))
+                self._connect(each_event)
+
+    def _connect(self, event):
+        handlers = self._subscribers[event]
+        if len(handlers) == 1:
+            setattr(self, event, handlers[0])
+        else:
+            setattr(self, event, Broadcast(handlers))
+
+
+class Broadcast:
+    """
+    Pass an event to several handlers
+    """
+
+    def __init__(self, handlers):
+        self.handlers = tuple(handlers)
+
+    def __call__(self, *parameters):
+        for each_handler in self.handlers:
+            each_handler(*parameters)
@@ -17,7 +17,8 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-from mad.scheduling import Scheduler
+from mad.scheduling import Scheduler, HeapEventPool, CalendarEventPool
+from mad.checkpointing import Snapshot
 from mad.environment import Environment
 from mad.evaluation import Symbols, Evaluation, SimulationFactory
 
@@ -31,6 +32,9 @@ from mad.simulation.autoscaling import RuleBasedStrategy, AutoScaler
 from mad.simulation.requests import Request, Trigger, Query
 from mad.simulation.throttling import ThrottlingWrapper, NoThrottling, TailDrop
 from mad.simulation.backoff import ConstantBackoff, ExponentialBackoff
+from mad.simulation.convergence import SteadyStateDetector
+from mad.simulation.watchdog import Watchdog
+from mad.simulation.streams import RandomStreams
 
 
 class Factory(SimulationFactory):
@@ -38,15 +42,15 @@ class Factory(SimulationFactory):
     Instantiate all necessary elements for a simulation
     """
 
-    def create_simulation(self, data_store):
-        return Simulation(data_store)
+    def create_simulation(self, data_store, seed=None, monitoring_period=None, event_pool=None):
+        return Simulation(data_store, seed, monitoring_period, event_pool)
 
     def create_worker_pool(self, environment):
         workers = [ self.create_worker(id, environment) for id in range(1, 2) ]
         return WorkerPoolWrapper(environment, WorkerPool(workers))
 
-    def create_monitor(self, name, environment, period):
-        return Monitor(name, environment, period)
+    def create_monitor(self, name, environment, period, probes=None):
+        return Monitor(name, environment, period, probes)
 
     def create_logger(self, environment):
         return Logger(environment)
@@ -93,31 +97,144 @@ class Factory(SimulationFactory):
     def create_tail_drop(self, environment, capacity, task_pool):
         return ThrottlingWrapper(environment, TailDrop(task_pool, capacity))
 
-    def create_backoff(self, delay):
+    def create_backoff(self, delay, random_stream):
         if delay.strategy == delay.CONSTANT:
             return ConstantBackoff(delay.base_delay)
         elif delay.strategy == delay.EXPONENTIAL:
-            return ExponentialBackoff(delay.base_delay)
+            return ExponentialBackoff(delay.base_delay, random_stream)
         else:
             raise ValueError("Unknown backoff strategy '{0:s}' (options are 'constant' and 'exponential')")
 
 
 class Simulation:
     """
-    Represent the general simulation, including the current schedule and the associated trace
+    Represent the general simulation, including the current schedule and the associated trace. Random
+    numbers are drawn from streams derived from the given seed (see mad.simulation.streams). Monitors
+    sample on the given period, unless their settings say otherwise. Pending events are kept in the
+    given kind of event pool (see mad.scheduling), a binary heap by default. Events are dispatched by
+    batches only from a calendar, whose buckets already group them by time: the heap gains nothing
+    from it. The digest of the model, if known, tells which model a restored simulation was built from.
     """
     # TODO: This should inherits from SimulatedEntity as well
 
-    def __init__(self, storage):
+    HEAP = "heap"
+    CALENDAR = "calendar"
+    EVENT_POOLS = {
+        HEAP: HeapEventPool,
+        CALENDAR: CalendarEventPool
+    }
+
+    def __init__(self, storage, seed=None, monitoring_period=None, event_pool=None):
         self._storage = storage
-        self._scheduler = Scheduler()
+        self.monitoring_period = monitoring_period
+        self.random_streams = RandomStreams(seed)
+        event_pool = event_pool or self.HEAP
+        self._scheduler = Scheduler(event_pool=self.EVENT_POOLS[event_pool](), batch_dispatch=event_pool == self.CALENDAR)
         self.environment = Environment()
         self.environment.define(Symbols.SIMULATION, self)
         self._next_request_id = 1
         self.factory = Factory()
+        self._steady_state = None
+        self._watchdog = None
+        self.model_digest = None
 
-    def run_until(self, end, display=None):
-        self._scheduler.simulate_until(end, display)
+    def run_until(self, end, display=None, checkpoints=None):
+        if checkpoints:
+            checkpoints.run(self, end, display)
+        else:
+            self._scheduler.simulate_until(end, display)
+        self.flush()
+
+    def stop_when_steady(self, precision, metrics=None, warm_up=SteadyStateDetector.DEFAULT_WARM_UP):
+        """
+        Stop the simulation as soon as the given metrics of all services are estimated within the
+        given relative precision, once the given number of batches of samples are discarded. Must be
+        called once the model has been evaluated.
+        """
+        if self._steady_state is not None:
+            self._steady_state.dismiss()
+        self._steady_state = SteadyStateDetector(self.environment, precision, metrics, warm_up=warm_up)
+
+    def watch(self, conditions):
+        """
+        Abort the simulation as soon as one of the given conditions trips (see mad.simulation.watchdog)
+        """
+        for each_condition in conditions:
+            each_condition.verify(self)
+        if self._watchdog is not None:
+            self._watchdog.dismiss()
+        self._watchdog = Watchdog(self.environment, conditions)
+
+    def flush(self):
+        for each_entity in self.services + self.clients:
+            each_entity.look_up(Symbols.MONITOR).flush()
+        self._storage.flush()
+
+    @property
+    def outcome(self):
+        """
+        Why the simulation stopped, or None if it simply reached its end
+        """
+        if self._scheduler.is_stopped:
+            return self._scheduler.stop_reason
+        if self._steady_state is not None:
+            return self._steady_state.outcome
+        return None
+
+    def checkpoint(self, output_stream):
+        Snapshot.of(self).save(output_stream)
+
+    @staticmethod
+    def restore(input_stream, storage):
+        return Snapshot.load(input_stream).restore(storage)
+
+    def fork(self, storages, settings=None):
+        """
+        Create one independent copy of this simulation per given storage, which can then be
+        modified and run separately. Each copy can be configured with its own settings, given as
+        a dictionary of keyword arguments for 'configure' (one per storage).
+        """
+        snapshot = Snapshot.of(self)
+        if settings is None:
+            settings = [{}] * len(storages)
+        assert len(settings) == len(storages), \
+            "Expected one settings per storage (found %d settings for %d storages)" % (len(settings), len(storages))
+        forks = []
+        for (each_storage, each_settings) in zip(storages, settings):
+            fork = snapshot.restore(each_storage)
+            fork.configure(**each_settings)
+            forks.append(fork)
+        return forks
+
+    def configure(self, seed=None, monitoring_period=None):
+        """
+        Override the given settings, for instance once restored from a snapshot. A new seed
+        recreates the random streams of all entities, and a new monitoring period applies from the
+        next sample to the monitors that do not set their own period.
+        """
+        if seed is not None:
+            self.random_streams = RandomStreams(seed)
+            for each_entity in self.services + self.clients:
+                each_entity.create_random_streams()
+        if monitoring_period is not None:
+            self.monitoring_period = monitoring_period
+            for each_entity in self.services + self.clients:
+                monitor = each_entity.look_up(Symbols.MONITOR)
+                if not monitor.has_own_period and monitor.probes:
+                    monitor.change_period(monitoring_period)
+
+    def attach(self, storage):
+        """
+        Direct the log and the reports towards the given storage, for instance once restored from a snapshot
+        """
+        self._storage = storage
+        for each_entity in self.services + self.clients:
+            each_entity.look_up(Symbols.MONITOR).open_report()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_storage"]
+        return state
 
     @property
     def log(self):
@@ -128,7 +245,14 @@ class Simulation:
         return self._scheduler
 
     def evaluate(self, expression, continuation=lambda x: x):
-        return Evaluation(self.environment, expression, self.factory, continuation).result
+        """
+        Evaluate the given model, and then resolve the plans of all operations, so that invocations
+        of unknown services are caught at load time, rather than at the first invocation
+        """
+        result = Evaluation(self.environment, expression, self.factory, continuation).result
+        for each_operation in self.operations:
+            each_operation.resolve()
+        return result
 
     def next_request_id(self):
         id = self._next_request_id
@@ -143,6 +267,13 @@ class Simulation:
     def clients(self):
         return self._find_by_type(ClientStub)
 
+    @property
+    def operations(self):
+        return [each_value
+                for each_entity in self.services + self.clients
+                for each_value in each_entity.environment.bindings.values()
+                if isinstance(each_value, Operation)]
+
     def _find_by_type(self, type):
         return [each_value
                 for each_value in self.environment.bindings.values()
@@ -17,8 +17,10 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-from functools import reduce
+from array import array
+from math import sqrt, nan
 
+from mad.ast.settings import Monitoring
 from mad.evaluation import Symbols
 from mad.simulation.service import Operation
 from mad.simulation.commons import SimulatedEntity
@@ -26,9 +28,19 @@ from mad.simulation.events import Listener
 from mad.simulation.tasks import TaskStatus
 from mad.simulation.workers import WorkerStatus
 from mad.simulation.client import ClientStub
+from mad.simulation.quantiles import QuantileSketch
 
 MISSING_VALUE = "NA"
 
+def is_known(response_time):
+    """
+    The response times of client requests are unknown (i.e., -1)
+    """
+    return response_time >= 0
+
+
+RESPONSE_TIME_QUANTILES = Monitoring.RESPONSE_TIME_QUANTILES
+
 
 class WorkersStatistics(Listener):
 
@@ -101,9 +113,6 @@ class TasksStatistics(Listener):
             error = "Invalid task status (expected CREATED or BLOCKED, found {!s})".format(task.status)
             raise AssertionError(error)
 
-    def task_accepted(self, task):
-        pass
-
     def task_rejected(self, task):
         assert task.status == TaskStatus.CREATED, "Invalid task status (expected CREATED, found {!s})".format(task.status)
         self.created -= 1
@@ -146,33 +155,55 @@ class TasksStatistics(Listener):
         self.running -= 1
         self.failed += 1
 
-    def task_cancelled(self, task):
-        pass
-
-    def failure_of(self, request):
-        pass
-
-    def success_of(self, request):
-        pass
+    def __repr__(self):
+        return "(C={0.created:d}, Rd={0.ready:d}, Rn={0.running:d}, B={0.blocked:d}| " \
+               "S={0.successful:d}, F={0.failed:d})".format(self)
 
-    def posting_of(self, service, request):
-        pass
 
-    def acceptance_of(self, request):
-        pass
+class Accumulator:
+    """
+    Summarise a series of values in constant memory, as their count, sum, sum of squares,
+    minimum and maximum
+    """
 
-    def resuming(self, request):
-        pass
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.total_of_squares = 0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.total_of_squares += value * value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
 
-    def timeout_of(self, request):
-        pass
+    @property
+    def mean(self):
+        if self.count == 0:
+            return None
+        return self.total / self.count
 
-    def rejection_of(self, request):
-        pass
+    @property
+    def variance(self):
+        """
+        The sample variance, or None with less than two values
+        """
+        if self.count < 2:
+            return None
+        deviations = self.total_of_squares - self.total * self.total / self.count
+        return max(0., deviations / (self.count - 1))
 
-    def __repr__(self):
-        return "(C={0.created:d}, Rd={0.ready:d}, Rn={0.running:d}, B={0.blocked:d}| " \
-               "S={0.successful:d}, F={0.failed:d})".format(self)
+    @property
+    def standard_deviation(self):
+        variance = self.variance
+        if variance is None:
+            return None
+        return sqrt(variance)
 
 
 class OperationStatistics:
@@ -181,7 +212,8 @@ class OperationStatistics:
         self.call_count = 0
         self.error_count = 0
         self.rejection_count = 0
-        self.response_times = []
+        self.response_times = Accumulator()
+        self.response_time_sketch = QuantileSketch()
 
     def reset(self):
         self.__init__()
@@ -196,7 +228,9 @@ class OperationStatistics:
         self.error_count += 1
 
     def call_succeed(self, duration):
-        self.response_times.append(duration)
+        self.response_times.add(duration)
+        if is_known(duration):
+            self.response_time_sketch.add(duration)
 
     @property
     def complete_call_count(self):
@@ -204,7 +238,11 @@ class OperationStatistics:
 
     @property
     def success_count(self):
-        return len(self.response_times)
+        return self.response_times.count
+
+    @property
+    def total_response_time(self):
+        return self.response_times.total
 
     @property
     def failure_count(self):
@@ -220,21 +258,24 @@ class OperationStatistics:
 
     @property
     def response_time(self):
-        if len(self.response_times) == 0:
-            return None
-        else:
-            return sum(self.response_times) / len(self.response_times)
+        return self.response_times.mean
 
 
 class Statistics(Listener):
+    """
+    Statistics about the requests received by a service, per operation and for the service as a whole.
+    Service-wide figures are accumulated as events come, rather than summed over operations when read.
+    """
 
     def __init__(self):
         super().__init__()
         self.total_request_count = 0
         self._operations = {}
+        self._service = OperationStatistics()
 
     def reset(self):
         self._operations.clear()
+        self._service = OperationStatistics()
 
     def _get(self, operation_name):
         operation = self._operations.get(operation_name)
@@ -245,50 +286,49 @@ class Statistics(Listener):
 
     @property
     def reliability(self):
-        total = self.complete_request_count
-        if total == 0:
-            return None
-        return self.success_count / total
+        return self._service.reliability
 
     @property
     def complete_request_count(self):
-        counts = (each_operation.complete_call_count for each_operation in self._operations.values())
-        return reduce(lambda x,y: x+y, counts, 0)
+        return self._service.complete_call_count
 
     @property
     def arrival_count(self):
-        counts = (each_operation.call_count for each_operation in self._operations.values())
-        return reduce(lambda x,y: x+y, counts, 0)
+        return self._service.call_count
 
     @property
     def rejection_count(self):
-        counts = (each_operation.rejection_count for each_operation in self._operations.values())
-        return reduce(lambda x,y: x+y, counts, 0)
+        return self._service.rejection_count
 
     @property
     def success_count(self):
-        counts = (each_operation.success_count for each_operation in self._operations.values())
-        return reduce(lambda x,y: x+y, counts, 0)
+        return self._service.success_count
 
     @property
     def failure_count(self):
-        counts = (each_operation.failure_count for each_operation in self._operations.values())
-        return reduce(lambda x,y: x+y, counts, 0)
+        return self._service.failure_count
+
+    @property
+    def total_response_time(self):
+        return self._service.total_response_time
 
     @property
     def response_time(self):
-        (total, count) = (0, 0)
-        for (operation, statistics) in self._operations.items():
-            total += sum(statistics.response_times)
-            count += len(statistics.response_times)
-        if count <= 0:
-            return None
-        else:
-            return total / count
+        return self._service.response_time
+
+    @property
+    def response_time_sketch(self):
+        return self._service.response_time_sketch
+
+    def response_time_quantile(self, q):
+        return self.response_time_sketch.quantile(q)
 
     def response_time_for(self, operation):
         return self._get(operation).response_time
 
+    def response_time_quantile_for(self, operation, q):
+        return self._get(operation).response_time_sketch.quantile(q)
+
     def reliability_for(self, operation):
         return self._get(operation).reliability
 
@@ -300,53 +340,123 @@ class Statistics(Listener):
     def task_created(self, task):
         self.total_request_count += 1
         self._get(task.request.operation).call()
-
-    def task_accepted(self, task):
-        pass
+        self._service.call()
 
     def task_rejected(self, task):
         self._get(task.request.operation).call_rejected()
-
-    def task_assigned_to(self, task, worker):
-        pass
-
-    def task_paused(self, task):
-        pass
-
-    def task_activated(self, task):
-        pass
+        self._service.call_rejected()
 
     def task_failed(self, task):
         self._get(task.request.operation).call_failed()
+        self._service.call_failed()
 
     def task_successful(self, task):
-        self._get(task.request.operation).call_succeed(task.request.response_time)
+        response_time = task.request.response_time
+        self._get(task.request.operation).call_succeed(response_time)
+        self._service.call_succeed(response_time)
 
-    def task_cancelled(self, task):
-        pass
+    # Client side events
 
-    def resuming(self, request):
-        pass
 
-    # Client side events
+class Window:
+    """
+    The requests that arrived, got rejected, failed or succeeded during one monitoring period. As in
+    OperationStatistics, every success accounts for its response time, even if unknown.
+    """
 
-    def posting_of(self, service, request):
-        pass
+    def __init__(self):
+        self.arrival_count = 0
+        self.rejection_count = 0
+        self.failure_count = 0
+        self.success_count = 0
+        self.total_response_time = 0
+        self.arrivals = {}
 
-    def acceptance_of(self, request):
-        pass
+    def arrival_count_of(self, operation):
+        return self.arrivals.get(operation, 0)
 
-    def rejection_of(self, request):
-        pass
+    @property
+    def response_time(self):
+        if self.success_count == 0:
+            return None
+        return self.total_response_time / self.success_count
 
-    def success_of(self, request):
-        pass
+    def add(self, other, sign=1):
+        self.arrival_count += sign * other.arrival_count
+        self.rejection_count += sign * other.rejection_count
+        self.failure_count += sign * other.failure_count
+        self.success_count += sign * other.success_count
+        self.total_response_time += sign * other.total_response_time
+        for (each_operation, each_count) in other.arrivals.items():
+            self.arrivals[each_operation] = self.arrivals.get(each_operation, 0) + sign * each_count
 
-    def failure_of(self, request):
-        pass
+    def remove(self, other):
+        self.add(other, -1)
 
-    def timeout_of(self, request):
-        pass
+
+class WindowedStatistics(Listener):
+    """
+    Count requests over the current monitoring period (a tumbling window), and keep the last complete
+    windows in a ring buffer, together with their sum ('recent'), so that sliding averages cost O(1)
+    """
+
+    DEFAULT_HISTORY = 10
+
+    def __init__(self, history=DEFAULT_HISTORY):
+        assert history > 0, "Invalid history (found %d)" % history
+        self.current = Window()
+        self.recent = Window()
+        self._history = [None] * history
+        self._next = 0
+        self.window_count = 0
+
+    def close(self):
+        """
+        Push the current window into the history, evicting the oldest one if the history is full,
+        and open a new window
+        """
+        evicted = self._history[self._next]
+        if evicted is not None:
+            self.recent.remove(evicted)
+        else:
+            self.window_count += 1
+        self._history[self._next] = self.current
+        self._next = (self._next + 1) % len(self._history)
+        self.recent.add(self.current)
+        self.current = Window()
+
+    def sliding_average(self, measure):
+        """
+        The average of the given measure (e.g., 'lambda window: window.arrival_count') over the complete
+        windows in the history, or None if none is complete yet
+        """
+        if self.window_count == 0:
+            return None
+        return measure(self.recent) / self.window_count
+
+    @property
+    def last(self):
+        """
+        The last complete window, or None if none is complete yet
+        """
+        return self._history[self._next - 1]
+
+    # Event handlers
+
+    def task_created(self, task):
+        self.current.arrival_count += 1
+        operation = task.request.operation
+        self.current.arrivals[operation] = self.current.arrivals.get(operation, 0) + 1
+
+    def task_rejected(self, task):
+        self.current.rejection_count += 1
+
+    def task_failed(self, task):
+        self.current.failure_count += 1
+
+    def task_successful(self, task):
+        self.current.success_count += 1
+        self.current.total_response_time += task.request.response_time
 
 
 class Probe:
@@ -356,27 +466,75 @@ class Probe:
         self.width = width
         self.format = format
         self.probe = probe
+        self.is_numeric = not format.endswith("s}")
+        self._is_integral = format.endswith("d}")
 
     def formatted(self, context):
-        return ("{:>%d}" % self.width).format(self._as_text(context))
+        return self.text_of(self.sample(context))
 
-    def _as_text(self, context):
-        value = self.measure(context)
-        if value is None:
+    def text_of(self, sample):
+        return ("{:>%d}" % self.width).format(self._as_text(sample))
+
+    def _as_text(self, sample):
+        if sample is None or sample != sample:
             return "{:s}".format(MISSING_VALUE)
-        else:
-            return self.format.format(value)
+        if self._is_integral:
+            sample = int(sample)
+        return self.format.format(sample)
+
+    def sample(self, context):
+        """
+        The measure, where NaN stands for missing numeric values
+        """
+        value = self.measure(context)
+        if value is None and self.is_numeric:
+            return nan
+        return value
 
     def measure(self, context):
         return self.probe(context)
 
 
+class Samples:
+    """
+    The raw values measured by the given probes, one growable column per probe. Numeric columns
+    are arrays of doubles, where NaN stands for missing values. Other columns are plain lists.
+    """
+
+    def __init__(self, probes):
+        self._probes = probes
+        self._columns = [array("d") if each_probe.is_numeric else [] for each_probe in probes]
+        self.size = 0
+
+    def record(self, context):
+        for (each_probe, each_column) in zip(self._probes, self._columns):
+            each_column.append(each_probe.sample(context))
+        self.size += 1
+
+    def column(self, name):
+        for (each_probe, each_column) in zip(self._probes, self._columns):
+            if each_probe.name == name:
+                return each_column
+        raise KeyError("No probe named '{0:s}'".format(name))
+
+    def rows(self, start, end):
+        """
+        The rows in the given range, formatted as text
+        """
+        for index in range(start, end):
+            yield {each_probe.name: each_probe.text_of(each_column[index])
+                   for (each_probe, each_column) in zip(self._probes, self._columns)}
+
+
 class Monitor(SimulatedEntity):
     """
     Monitors the various metrics from other components of the services (task pool, worker pool, etc.) and reports on
-    a fixed period
+    a fixed period. Samples are kept in memory and only formatted into the report by chunks. Only the given probes
+    are sampled, if any, and the time always comes first. Without any probe, the monitor neither samples nor reports.
     """
     DEFAULT_PERIOD = 10
+    CHUNK_SIZE = 100
+    TIME = "time"
 
     DEFAULT_PROBES = [
         Probe("time", 6, "{:d}", lambda self: self.schedule.time_now),
@@ -389,23 +547,64 @@ class Monitor(SimulatedEntity):
         Probe("reliability", 10, "{:5.2f}", lambda self: self._reliability()),
         Probe("throughput", 10, "{:5.2f}", lambda self: self._throughput()),
         Probe("response time", 10, "{:5.2f}", lambda self: self._response_time())
+    ] + [
+        Probe("response time " + each_name, 10, "{:5.2f}",
+              lambda self, q=each_quantile: self.statistics.response_time_quantile(q))
+        for (each_name, each_quantile) in RESPONSE_TIME_QUANTILES
     ]
 
-    def __init__(self, name, environment, period):
+    def __init__(self, name, environment, period, probes=None):
         super().__init__(name, environment)
-        self.period = period or self.DEFAULT_PERIOD
+        self.has_own_period = period is not None
+        self.period = period or self.simulation.monitoring_period or self.DEFAULT_PERIOD
+        self._next_period = None
+        self._tick = None
         self.probes = list(self.DEFAULT_PROBES)
         self._add_custom_probes()
-        self.report = self._create_report(self._header_format())
+        self.available_probes = self.probes
+        if probes is not None:
+            self.probes = self._select(probes)
+        self.samples = Samples(self.probes)
+        self._reported = 0
+        self.report = None
         self.statistics = Statistics()
         self.tasks = TasksStatistics()
+        self.windows = WindowedStatistics()
         self.listener.register(self.tasks)
         self.listener.register(self.statistics)
-        self.schedule.every(self.period, self.monitor)
+        self.listener.register(self.windows)
+        if self.probes:
+            self.open_report()
+            self._tick = self.schedule.every(self.period, self.monitor)
+
+    def find_probe(self, name):
+        """
+        The probe with the given name, among all those available, whether it is sampled or not. As
+        rates are measured over the last complete window, the monitor then closes its windows on its
+        period, even if it samples nothing.
+        """
+        for each_probe in self.available_probes:
+            if each_probe.name == name:
+                if self._tick is None:
+                    self._tick = self.schedule.every(self.period, self.windows.close)
+                return each_probe
+        raise ValueError("Unknown probe '{0:s}'".format(name))
+
+    def _select(self, names):
+        if not names:
+            return []
+        available = {each_probe.name: each_probe for each_probe in self.probes}
+        unknown = [each_name for each_name in names if each_name not in available]
+        if unknown:
+            raise ValueError("Unknown probes {0:s}".format(", ".join(unknown)))
+        if self.TIME not in names:
+            names = [self.TIME] + list(names)
+        return [available[each_name] for each_name in names]
 
     def _add_custom_probes(self):
         for each_operation in self._all_operations():
             self._add_response_time(each_operation)
+            self._add_response_time_quantiles(each_operation)
             self._add_reliability(each_operation)
             self._add_arrival_rate(each_operation)
 
@@ -416,6 +615,14 @@ class Monitor(SimulatedEntity):
                           lambda self: self.statistics.response_time_for(operation.name))
         self.probes.append(response_time)
 
+    def _add_response_time_quantiles(self, operation):
+        for (each_name, each_quantile) in RESPONSE_TIME_QUANTILES:
+            quantile = Probe("response time {0:s} {1:s}".format(each_name, operation.name),
+                             10,
+                             "{:5.2f}",
+                             lambda self, q=each_quantile: self.statistics.response_time_quantile_for(operation.name, q))
+            self.probes.append(quantile)
+
     def _add_reliability(self, operation):
         reliability = Probe("reliability " + operation.name,
                           10,
@@ -427,7 +634,7 @@ class Monitor(SimulatedEntity):
         arrival_rate = Probe("arrival rate " + operation.name,
                           10,
                           "{:5.2f}",
-                          lambda self: self.statistics.request_count_for(operation.name) / self.period)
+                          lambda self: self._rate_of(lambda window: window.arrival_count_of(operation.name)))
         self.probes.append(arrival_rate)
 
     def _all_operations(self):
@@ -437,22 +644,51 @@ class Monitor(SimulatedEntity):
 
     def set_probes(self, probes):
         assert len(probes) > 0, "Invalid monitoring: No probes given!"
+        self.flush()
         self.probes = probes
+        self.samples = Samples(probes)
+        self._reported = 0
         self.report = self._create_report(self._header_format())
 
     def _create_report(self, format):
         name = self.look_up(Symbols.SERVICE).name
         return self.simulation._storage.report_for(name, format)
 
+    def open_report(self):
+        if self.probes:
+            self.report = self._create_report(self._header_format())
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["report"]
+        return state
+
     def _header_format(self):
         return [(each_probe.name, "%s") for each_probe in self.probes]
 
+    def change_period(self, period):
+        """
+        Sample on the given period once the current sample is taken, so that the pending window is
+        measured over the period it was opened with
+        """
+        self._next_period = period
+
     def monitor(self):
-        observations = {}
-        for each_probe in self.probes:
-            observations[each_probe.name] = each_probe.formatted(self)
-        self.report(**observations)
-        #self.statistics.reset()
+        self.windows.close()
+        self.samples.record(self)
+        if self._next_period is not None:
+            self.period = self._tick.period = self._next_period
+            self._next_period = None
+        if self.samples.size - self._reported >= self.CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        """
+        Write into the report the samples that are not yet there
+        """
+        if self._reported < self.samples.size:
+            self.report.write(self.samples, self._reported, self.samples.size)
+        self._reported = self.samples.size
 
     def _queue_length(self):
         return self.tasks.active
@@ -471,17 +707,26 @@ class Monitor(SimulatedEntity):
 
         return worker_pool.capacity
 
+    def _rate_of(self, count):
+        """
+        The given count per unit of time, over the last complete window (the current one is still being filled)
+        """
+        window = self.windows.last
+        if window is None:
+            return None
+        return count(window) / self.period
+
     def _arrival_rate(self):
-        return self.statistics.arrival_count / self.period
+        return self._rate_of(lambda window: window.arrival_count)
 
     def _rejection_rate(self):
-        return self.statistics.rejection_count / self.period
+        return self._rate_of(lambda window: window.rejection_count)
 
     def _reliability(self):
         return self.statistics.reliability
 
     def _throughput(self):
-        return self.statistics.success_count
+        return self._rate_of(lambda window: window.success_count)
 
     def _response_time(self):
         return self.statistics.response_time
@@ -506,15 +751,7 @@ class Logger(SimulatedEntity, Listener):
         SimulatedEntity.__init__(self, Symbols.LOGGER, environment)
         Listener.__init__(self)
         self.listener.register(self)
-
-    def resuming(self, request):
-        pass
-
-    def task_accepted(self, task):
-        pass
-
-    def task_rejected(self, task):
-        pass
+        self._caller = None
 
     def task_created(self, request):
         self._log(self.REQUEST_RECEIVED, request=request.identifier)
@@ -534,9 +771,6 @@ class Logger(SimulatedEntity, Listener):
     def task_successful(self, request):
         self._log(self.SUCCESS_REPLIED, request=request.identifier)
 
-    def task_cancelled(self, task):
-        pass
-
     def failure_of(self, request):
         self._log(self.REQUEST_FAILURE, request=request.identifier)
 
@@ -556,6 +790,6 @@ class Logger(SimulatedEntity, Listener):
         self._log(self.REQUEST_TIMEOUT, request=request.identifier)
 
     def _log(self, message, **values):
-        now = self.schedule.time_now
-        caller = self.look_up(Symbols.SELF)
-        self.simulation.log.record(now, caller.name, message.format(**values))
+        if self._caller is None:
+            self._caller = self.look_up(Symbols.SELF)
+        self.simulation.log.record(self.schedule.time_now, self._caller.name, message.format(**values))
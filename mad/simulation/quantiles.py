@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from bisect import insort
+from math import ceil, log
+
+
+class QuantileSketch:
+    """
+    Estimate the quantiles of a series of non-negative values without storing them. Values fall into
+    buckets whose bounds grow geometrically, so that any quantile is known within the given relative
+    error. Memory is bounded: beyond the given number of buckets, the lowest buckets are collapsed,
+    which only affects the precision of the lowest quantiles. Sketches built with the same relative
+    error can be merged, for instance across services or across replications of a simulation.
+    """
+
+    DEFAULT_RELATIVE_ERROR = 0.01
+    DEFAULT_MAXIMUM_BUCKET_COUNT = 2048
+
+    def __init__(self, relative_error=DEFAULT_RELATIVE_ERROR, maximum_bucket_count=DEFAULT_MAXIMUM_BUCKET_COUNT):
+        assert 0 < relative_error < 1, "Invalid relative error (found %f)" % relative_error
+        assert maximum_bucket_count > 0, "Invalid bucket count (found %d)" % maximum_bucket_count
+        self.relative_error = relative_error
+        self.maximum_bucket_count = maximum_bucket_count
+        self._gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = log(self._gamma)
+        self._buckets = {}
+        self._indexes = []
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value):
+        assert value >= 0, "Only non-negative values can be sketched (found %s)" % str(value)
+        self.count += 1
+        if value == 0:
+            self._zero_count += 1
+            return
+        self._increment(ceil(log(value) / self._log_gamma), 1)
+        if len(self._buckets) > self.maximum_bucket_count:
+            self._collapse()
+
+    def merge(self, other):
+        """
+        Add the values summarised by the given sketch to this one
+        """
+        if other.relative_error != self.relative_error:
+            raise ValueError("Cannot merge sketches with different relative errors ({0} and {1})".format(
+                self.relative_error, other.relative_error))
+        self.count += other.count
+        self._zero_count += other._zero_count
+        for (each_index, each_count) in other._buckets.items():
+            self._increment(each_index, each_count)
+        while len(self._buckets) > self.maximum_bucket_count:
+            self._collapse()
+        return self
+
+    @staticmethod
+    def merge_all(sketches, relative_error=DEFAULT_RELATIVE_ERROR):
+        merged = QuantileSketch(relative_error)
+        for each_sketch in sketches:
+            merged.merge(each_sketch)
+        return merged
+
+    def quantile(self, q):
+        """
+        The value below which lies the given fraction q (e.g., 0.99) of the values, or None if empty
+        """
+        assert 0 <= q <= 1, "Invalid quantile (found %f)" % q
+        if self.count == 0:
+            return None
+        rank = max(1, ceil(q * self.count))
+        seen = self._zero_count
+        if seen >= rank:
+            return 0
+        for each_index in self._indexes:
+            seen += self._buckets[each_index]
+            if seen >= rank:
+                return self._value_of(each_index)
+        return self._value_of(self._indexes[-1])
+
+    def _value_of(self, index):
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def _increment(self, index, count):
+        if index in self._buckets:
+            self._buckets[index] += count
+        else:
+            self._buckets[index] = count
+            insort(self._indexes, index)
+
+    def _collapse(self):
+        (lowest, second) = self._indexes[:2]
+        self._buckets[second] += self._buckets.pop(lowest)
+        del self._indexes[0]
@@ -19,7 +19,7 @@
 
 from enum import Enum
 
-from mad.evaluation import Error, Success
+from mad.evaluation import SUCCEEDED, FAILED
 
 
 class RequestStatus(Enum):
@@ -29,6 +29,9 @@ class RequestStatus(Enum):
 class Request:
     TRANSMISSION_DELAY = 1
 
+    __slots__ = ("task", "operation", "priority", "continuation", "identifier", "status",
+                 "_response_time", "_emission_time", "_timeout")
+
     def __init__(self, task, operation, priority, continuation):
         assert task, "Invalid task (found None)"
         self.task = task
@@ -39,6 +42,7 @@ class Request:
         self.status = RequestStatus.PENDING
         self._response_time = None
         self._emission_time = None
+        self._timeout = None
 
     @property
     def sender(self):
@@ -59,7 +63,19 @@ class Request:
     def send_to(self, service):
         self.sender.listener.posting_of(service.name, self)
         self._emission_time = self.sender.schedule.time_now
-        service.schedule.after(self.TRANSMISSION_DELAY, lambda: service.process(self))
+        service.schedule.after(self.TRANSMISSION_DELAY, service.process, self)
+
+    def time_out_after(self, delay, on_timeout, *arguments):
+        """
+        Trigger the given action (with the given arguments) after the given delay, unless the request
+        is complete in the meantime
+        """
+        self._timeout = self.sender.schedule.after(delay, on_timeout, *arguments)
+
+    def _cancel_timeout(self):
+        if self._timeout:
+            self._timeout.cancel()
+            self._timeout = None
 
     def accept(self):
         self.sender.schedule.after(self.TRANSMISSION_DELAY, self.on_accept)
@@ -67,6 +83,7 @@ class Request:
     def reject(self):
         if self.is_pending:
             self.status = RequestStatus.ERROR
+            self._cancel_timeout()
             self.sender.schedule.after(self.TRANSMISSION_DELAY, self.on_reject)
 
     def reply(self, task, status):
@@ -84,16 +101,19 @@ class Request:
             self.status = RequestStatus.OK
             assert self._response_time is None, "Response time are updated multiple times!"
             self._response_time = self.sender.schedule.time_now - self._emission_time
+            self._cancel_timeout()
             self.sender.schedule.after(self.TRANSMISSION_DELAY, self.on_success)
 
     def reply_error(self):
         if self.is_pending:
             self.status = RequestStatus.ERROR
+            self._cancel_timeout()
             self.sender.schedule.after(self.TRANSMISSION_DELAY, self.on_error)
 
     def discard(self):
         if self.is_pending:
             self.status = RequestStatus.ERROR
+            self._cancel_timeout()
 
     def on_reject(self):
         pass
@@ -110,8 +130,12 @@ class Request:
     def finalise(self, task, status):
         pass
 
+    def resume(self, worker, status):
+        return self.continuation(status)
+
 
 class Query(Request):
+    __slots__ = ()
 
     def __init__(self, task, operation, priority, continuation):
         super().__init__(task, operation, priority, continuation)
@@ -121,32 +145,33 @@ class Query(Request):
 
     def on_reject(self):
         self.task.service.listener.rejection_of(self)
-        self.task.resume_with(lambda worker: self.continuation(Error()))
+        self.task.resume_with(self.resume, FAILED)
 
     def on_success(self):
         self.task.service.listener.success_of(self)
-        self.task.resume_with(lambda worker: self.continuation(Success()))
+        self.task.resume_with(self.resume, SUCCEEDED)
 
     def on_error(self):
         self.task.service.listener.failure_of(self)
-        self.task.resume_with(lambda worker: self.continuation(Error()))
+        self.task.resume_with(self.resume, FAILED)
 
     def finalise(self, task, status):
-        task.compute(1, lambda: self.reply(task, status))
+        task.compute(1, self.reply, task, status)
 
 
 class Trigger(Request):
+    __slots__ = ()
 
     def __init__(self, task, operation, priority, continuation):
         super().__init__(task, operation, priority, continuation)
 
     def on_reject(self):
         self.task.service.listener.rejection_of(self)
-        self.task.resume_with(lambda worker: self.continuation(Error()))
+        self.task.resume_with(self.resume, FAILED)
 
     def on_accept(self):
         self.task.service.listener.acceptance_of(self)
-        self.task.resume_with(lambda worker: self.continuation(Success()))
+        self.task.resume_with(self.resume, SUCCEEDED)
 
     def finalise(self, task, status):
         self.reply(task, status)
@@ -17,7 +17,8 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 from mad.ast.actions import Think
-from mad.evaluation import Symbols, Evaluation
+from mad.evaluation import Symbols
+from mad.compilation import Compiler, Frame, run
 from mad.simulation.commons import SimulatedEntity
 from mad.simulation.workers import WorkerPool, Worker
 from mad.simulation.tasks import Task
@@ -25,22 +26,37 @@ from mad.simulation.tasks import Task
 
 class Operation(SimulatedEntity):
     """
-    Represent an operation exposed by a service
+    Represent an operation exposed by a service. The symbols its body refers to (e.g., the
+    services it invokes) are resolved once all services are defined (see Simulation.evaluate).
     """
 
     def __init__(self, name, parameters, body, environment):
         super().__init__(name, environment)
         self.parameters = parameters
         self.body = body
+        self.plan = Compiler().compile(body)
+        self.service = None
 
     def __repr__(self):
         return "operation:%s" % (str(self.body))
 
-    def invoke(self, task, arguments, continuation=lambda r: r, worker=None):
-        environment = self.environment.create_local_environment(worker.environment)
-        environment.define(Symbols.TASK, task)
-        environment.define_each(self.parameters, arguments)
-        return Evaluation(environment, self.body, self.factory, task.finalise).result
+    def resolve(self):
+        self.service = self.environment.look_up(Symbols.SELF)
+        self.plan.resolve(self.environment)
+
+    def invoke(self, task, arguments, continuation=None):
+        """
+        Run the body of the operation on behalf of the given task, with the given arguments bound to
+        the parameters. Once the body completes, its status goes to the given continuation, or
+        finalises the task by default.
+        """
+        assert len(arguments) == len(self.parameters), \
+            "Invalid arguments (expected {0!s}, found {1!s})".format(self.parameters, arguments)
+        if continuation is None:
+            continuation = task.finalise
+        bindings = dict(zip(self.parameters, arguments)) if self.parameters else None
+        frame = Frame(self.environment, task, self.service, self.factory, bindings)
+        return run(self.plan, frame, continuation)
 
 
 class Service(SimulatedEntity):
@@ -49,6 +65,7 @@ class Service(SimulatedEntity):
         super().__init__(name, environment)
         self.environment.define(Symbols.SELF, self)
         self.environment.define(Symbols.SERVICE, self)
+        self.create_random_streams()
         self.tasks = self.environment.look_up(Symbols.QUEUE)
         self.workers = self.environment.look_up(Symbols.WORKER_POOL)
 
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from random import Random
+
+
+class RandomStreams:
+    """
+    Independent streams of random numbers, one per simulated entity and purpose (e.g., the failures
+    of a service, or its back-off delays), all derived from a single seed. Given the same seed, a
+    model yields the same simulation, whatever the order in which entities draw numbers. Without
+    seed, streams are seeded by the operating system, and simulations cannot be reproduced.
+    """
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        self._streams = {}
+
+    def stream_for(self, *path):
+        key = "/".join(path)
+        if key not in self._streams:
+            self._streams[key] = Random(self._seed_of(key))
+        return self._streams[key]
+
+    def _seed_of(self, key):
+        if self.seed is None:
+            return None
+        return "{0:d}/{1:s}".format(self.seed, key)
@@ -199,11 +199,15 @@ class TaskStatus(Enum):
 
 class Task:
 
+    __slots__ = ("service", "worker", "request", "status", "_on_resume", "_arguments")
+
     def __init__(self, service, request=None):
         self.service = service
         self.worker = None
         self.request = request
         self.status = TaskStatus.CREATED
+        self._on_resume = None
+        self._arguments = ()
 
     @property
     def priority(self):
@@ -247,15 +251,27 @@ class Task:
         else:
             self.service.listener.task_assigned_to(self, worker)
             self.status = TaskStatus.RUNNING
-            self._execute(worker)
+            if self._on_resume is None:
+                self._execute(worker)
+            else:
+                self._resume(worker)
 
     def _execute(self, worker):
         """
-        This method is ASSIGNED during the evaluation to control how to resume it once it has been paused
+        Start the operation requested. Once paused, the task resumes with the handler given to 'resume_with' instead.
         """
         self._assert_status_is(TaskStatus.RUNNING)
         operation = worker.look_up(self.operation)
-        operation.invoke(self, [], worker=worker)
+        operation.invoke(self, [])
+
+    def _resume(self, worker):
+        """
+        Call the handler given to 'resume_with' and forget it, as it usually refers back to this task
+        """
+        (on_resume, arguments) = (self._on_resume, self._arguments)
+        self._on_resume = None
+        self._arguments = ()
+        on_resume(worker, *arguments)
 
     def pause(self):
         self._assert_status_is(TaskStatus.RUNNING)
@@ -264,14 +280,15 @@ class Task:
         self.service.pause(self)
         self.service.release(self.worker)
 
-    def resume_with(self, on_resume):
+    def resume_with(self, on_resume, *arguments):
         self._assert_status_is(TaskStatus.BLOCKED)
-        self._execute = on_resume
+        self._on_resume = on_resume
+        self._arguments = arguments
         self.service.activate(self)
 
-    def compute(self, duration, continuation):
+    def compute(self, duration, continuation, *arguments):
         assert self.worker is not None, "Cannot compute, no worker attached!"
-        self.worker.compute(duration, continuation)
+        self.worker.compute(duration, continuation, *arguments)
 
     def finalise(self, status):
         self.request.finalise(self, status)
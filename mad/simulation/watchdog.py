@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from operator import lt, le, gt, ge
+from sys import platform
+
+try:
+    from resource import getrusage, RUSAGE_SELF
+except ImportError: # Not available on Windows
+    getrusage = None
+
+from mad.evaluation import Symbols
+from mad.simulation.commons import SimulatedEntity
+
+
+class Watchdog(SimulatedEntity):
+    """
+    Check the given conditions on a fixed period, and abort the simulation as soon as one of them
+    trips, flushing the results gathered so far
+    """
+
+    NAME = "watchdog"
+    DEFAULT_PERIOD = 10
+
+    def __init__(self, environment, conditions, period=DEFAULT_PERIOD):
+        super().__init__(self.NAME, environment)
+        self.conditions = conditions
+        self._checking = self.schedule.every(period, self.check)
+
+    def check(self):
+        for each_condition in self.conditions:
+            symptom = each_condition.check(self.simulation)
+            if symptom is not None:
+                self.schedule.stop(Diverged(self.schedule.time_now, symptom))
+                self.simulation.flush()
+                return
+
+    def dismiss(self):
+        self._checking.cancel()
+
+
+class Condition:
+    """
+    A symptom of divergence, checked periodically by the watchdog
+    """
+
+    def check(self, simulation):
+        """
+        Return a description of the symptom if the condition trips, or None otherwise
+        """
+        raise NotImplementedError("Condition::check is abstract!")
+
+    def verify(self, simulation):
+        """
+        Raise a ValueError if the condition does not apply to the given simulation
+        """
+        pass
+
+
+class QueueGrowth(Condition):
+    """
+    Trip when the queue of a service has grown at every one of the last checks
+    """
+
+    SYMPTOM = "queue of '{service:s}' grew over {window:d} checks in a row ({length:d} tasks)"
+
+    def __init__(self, window):
+        assert window > 0, "Invalid window (found %d)" % window
+        self.window = window
+        self._last_lengths = {}
+        self._growths = {}
+
+    def check(self, simulation):
+        for each_service in simulation.services:
+            length = each_service.look_up(Symbols.MONITOR).tasks.active
+            if length > self._last_lengths.get(each_service.name, length):
+                self._growths[each_service.name] = self._growths.get(each_service.name, 0) + 1
+            else:
+                self._growths[each_service.name] = 0
+            self._last_lengths[each_service.name] = length
+            if self._growths[each_service.name] >= self.window:
+                return self.SYMPTOM.format(service=each_service.name, window=self.window, length=length)
+        return None
+
+
+class EventLimit(Condition):
+    """
+    Trip when too many events are pending at once
+    """
+
+    SYMPTOM = "{count:d} pending events (limit is {limit:d})"
+
+    def __init__(self, limit):
+        self.limit = limit
+
+    def check(self, simulation):
+        count = simulation.schedule.pending_event_count
+        if count > self.limit:
+            return self.SYMPTOM.format(count=count, limit=self.limit)
+        return None
+
+
+class MemoryLimit(Condition):
+    """
+    Trip when the memory used by the process (i.e., its peak resident set size) exceeds the given
+    number of megabytes. Never trips where this cannot be measured.
+    """
+
+    SYMPTOM = "{usage:d} MB of memory used (limit is {limit:d} MB)"
+
+    def __init__(self, limit, measure=None):
+        self.limit = limit
+        self.measure = measure or memory_usage
+
+    def check(self, simulation):
+        usage = self.measure()
+        if usage is not None and usage > self.limit:
+            return self.SYMPTOM.format(usage=usage, limit=self.limit)
+        return None
+
+
+def memory_usage():
+    """
+    The peak resident set size of the process, in megabytes, or None if unknown
+    """
+    if getrusage is None:
+        return None
+    usage = getrusage(RUSAGE_SELF).ru_maxrss
+    if platform == "darwin":
+        return usage // (1024 * 1024)
+    return usage // 1024
+
+
+class ProbeCondition(Condition):
+    """
+    Trip when the value of a given probe, in the monitor of a given service, compares to the given
+    threshold (e.g., when the response time of the service 'DB' exceeds 100)
+    """
+
+    OPERATORS = {
+        "<": lt,
+        "<=": le,
+        ">": gt,
+        ">=": ge
+    }
+
+    SYMPTOM = "{service:s}/{probe:s} {operator:s} {threshold} (found {value})"
+
+    def __init__(self, service, probe, operator, threshold):
+        if operator not in self.OPERATORS:
+            raise ValueError("Unknown operator '{0:s}'".format(operator))
+        self.service = service
+        self.probe = probe
+        self.operator = operator
+        self.threshold = threshold
+
+    def check(self, simulation):
+        monitor = self._monitor_of(simulation)
+        value = self._probe_of(monitor).measure(monitor)
+        if value is not None and self.OPERATORS[self.operator](value, self.threshold):
+            return self.SYMPTOM.format(service=self.service, probe=self.probe, operator=self.operator,
+                                       threshold=self.threshold, value=value)
+        return None
+
+    def verify(self, simulation):
+        """
+        Raise a ValueError if the service or the probe does not exist
+        """
+        self._probe_of(self._monitor_of(simulation))
+
+    def _monitor_of(self, simulation):
+        service = simulation.environment.look_up(self.service)
+        if service is None or service not in simulation.services + simulation.clients:
+            raise ValueError("Unknown service '{0:s}'".format(self.service))
+        return service.look_up(Symbols.MONITOR)
+
+    def _probe_of(self, monitor):
+        return monitor.find_probe(self.probe)
+
+
+class Diverged:
+    """
+    The outcome of a simulation aborted by the watchdog
+    """
+
+    def __init__(self, time, symptom):
+        self.time = time
+        self.symptom = symptom
+
+    def accept(self, visitor):
+        visitor.simulation_diverged(self)
@@ -87,6 +87,8 @@ class WorkerPoolDecorator(WorkerPool):
         self.delegate = delegate
 
     def __getattr__(self, name):
+        if name.startswith("__") or name == "delegate":
+            raise AttributeError(name)
         return getattr(self.delegate, name)
 
 
@@ -121,7 +123,6 @@ class Worker(SimulatedEntity):
 
     def __init__(self, identifier, environment):
         super().__init__("Worker %d" % identifier, environment)
-        self.environment.define(Symbols.WORKER, self)
         self.identifier = identifier
 
     def boot_up(self):
@@ -132,8 +133,8 @@ class Worker(SimulatedEntity):
         # TODO: notify the listener that the thread is active
         pass
 
-    def compute(self, duration, continuation):
-        self.simulation.schedule.after(duration, continuation)
+    def compute(self, duration, continuation, *arguments):
+        self.simulation.schedule.after(duration, continuation, *arguments)
 
     def release(self):
         # TODO change the meaning of this operation (it should be called by the service/scheduler)
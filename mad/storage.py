@@ -31,6 +31,14 @@ class FileSystem:
             makedirs(dirname(location), exist_ok=True)
         return open(location, "w")
 
+    def open_binary_input_stream(self, location):
+        return open(location, "rb")
+
+    def open_binary_output_stream(self, location):
+        if not exists(location):
+            makedirs(dirname(location), exist_ok=True)
+        return open(location, "wb")
+
 
 class DataStorage:
 
@@ -38,6 +46,7 @@ class DataStorage:
         self.parser = parser
         self.log = log
         self.report_factory = factory
+        self.reports = []
 
     def model(self):
         return self.parser.parse()
@@ -46,5 +55,21 @@ class DataStorage:
         return self.log
 
     def report_for(self, name, format):
-        return self.report_factory(name, format)
+        report = self.report_factory(name, format)
+        self.reports.append(report)
+        return report
+
+    def flush(self):
+        """
+        Push the log and the reports written so far to their output streams
+        """
+        self.log.flush()
+        for each_report in self.reports:
+            each_report.flush()
+
+    def close(self):
+        """
+        Release the resources held by the storage, once the simulation is over
+        """
+        pass
 
@@ -17,18 +17,24 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-from re import search
-from datetime import datetime
+from re import search, match
+from datetime import datetime, timedelta
+from hashlib import sha256
+from time import monotonic
 
 from mad.storage import DataStorage
+from mad.database import Database, DatabaseStorage
 from mad.validation.engine import Validator, InvalidModel
 
 from mad.parsing import Parser, MADSyntaxError
 
 from mad.simulation.factory import Simulation
+from mad.simulation.convergence import SteadyStateDetector
+from mad.simulation.watchdog import QueueGrowth, EventLimit, MemoryLimit, ProbeCondition
+from mad.checkpointing import Checkpoints
 
 from mad.log import FileLog
-from mad.monitoring import CSVReport
+from mad.monitoring import CSVReport, ColumnarReport
 
 
 class Messages:
@@ -45,20 +51,74 @@ class Messages:
 
     MODEL_COPIED = "Model copied into '{location:s}'\n"
 
-    SIMULATION_PROGRESS = "\rSimulation {progress:.2f} %"
+    SIMULATION_RESUMED = "Simulation resumed from '{location:s}' at t={time:d}\n"
+
+    SIMULATION_PROGRESS = "\rSimulation {progress:.2f} % (t={time:d}, {event_rate:.0f} events/s, " \
+                          "{time_ratio:.1f} time units/s, ETA {eta:s})   "
+
+    UNKNOWN_ETA = "--:--:--"
+
+    NOT_AVAILABLE = "n/a"
+
+    STEADY_STATE_REACHED = "\n\nSimulation stopped at t={time:d}: Steady state reached " \
+                           "(target relative precision {precision:.2%})\n"
+
+    STEADY_STATE_NOT_REACHED = "\n\nSteady state not reached at t={time:d} " \
+                               "(target relative precision {precision:.2%})\n"
+
+    SIMULATION_DIVERGED = "\n\nSimulation aborted: Diverged at t={time:d} ({symptom:s})\n"
+
+    ESTIMATE = " - {service:s} {metric:s}: {mean:s} (relative precision {precision:s})\n"
 
     RESULTS_AVAILABLE = "\n\nSee results in directory: ./{location:s}/\n"
 
+    RESULTS_STORED = "\n\nSee results in database '{location:s}' (run {run:d})\n"
+
     INVALID_PARAMETER_COUNT = "Error: Expected 2 parameters (found {count:d})\.n"
 
     INVALID_SIMULATION_LENGTH = "\nError: Invalid simulation length '{length:s}'.\n"
 
     INVALID_SIMULATION_FILE = "\nError: Invalid simulation file '{file:s}'.\n"
 
-    USAGE = "USAGE: python -m mad <mad-file> <length>\n" \
+    INVALID_OPTION_VALUE = "\nError: Invalid value '{value:s}' for option '{option:s}'.\n"
+
+    UNKNOWN_OPTION = "\nError: Unknown option '{option:s}'.\n"
+
+    MODEL_MISMATCH = "\nError: The model '{model:s}' is not the one the snapshot '{snapshot:s}' was taken from.\n"
+
+    USAGE = "USAGE: python -m mad <mad-file> <length> [options]\n" \
             "where:\n" \
             " - <mad-file> is the location of the simulation model (a MAD file);\n" \
-            " - <length> is the maximum length of the simulation.\n"
+            " - <length> is the maximum length of the simulation.\n" \
+            "options:\n" \
+            " --batch             do not report the progress of the simulation (e.g., in scripts);\n" \
+            " --checkpoint=<T>    save a snapshot of the simulation every <T> units of time;\n" \
+            " --seed=<N>          seed the random numbers, so that the simulation is reproducible;\n" \
+            " --monitoring-period=<T>\n" \
+            "                     sample the services every <T> units of time (10 by default),\n" \
+            "                     unless their monitoring settings say otherwise;\n" \
+            " --precision=<P>     stop once the metrics of all services are estimated within\n" \
+            "                     the relative precision <P> (e.g., 0.05), with 95 % confidence;\n" \
+            " --metrics=<M,...>   the metrics checked by --precision, among 'response-time' and\n" \
+            "                     'throughput' (both by default);\n" \
+            " --max-queue-growth=<N>\n" \
+            "                     abort once the queue of a service grew over <N> checks in a row;\n" \
+            " --max-events=<N>    abort once more than <N> events are pending;\n" \
+            " --max-memory=<MB>   abort once the process uses more than <MB> megabytes of memory;\n" \
+            " --abort-when=<S>/<P><op><V>\n" \
+            "                     abort once the probe <P> of service <S> compares to <V>,\n" \
+            "                     for instance --abort-when=\"DB/response time>100\";\n" \
+            " --resume=<file>     resume the simulation from the given snapshot, taken from the\n" \
+            "                     same model, with the given seed and monitoring period if any.\n" \
+            "                     Snapshots contain code, which runs when they are loaded: only\n" \
+            "                     resume from snapshots that come from a trusted source;\n" \
+            " --report-format=<F> write the reports as 'csv' text (default) or in a 'binary'\n" \
+            "                     columnar layout (see mad.monitoring.ColumnarReport);\n" \
+            " --database=<file>   store the run, its trace and its reports into the given SQLite\n" \
+            "                     database (see mad.database.Database), rather than in files;\n" \
+            " --event-pool=<P>    keep the pending events in a binary 'heap' (default) or in a\n" \
+            "                     'calendar' (see mad.scheduling.CalendarEventPool), which is\n" \
+            "                     faster when many events are pending.\n"
 
     INVALID_MODEL = "Error, the model is invalid\n"
 
@@ -76,6 +136,8 @@ class Messages:
 
     ERROR_UNKNOWN_SERVICE = ERROR + "Unknown service '{service}'\n"
 
+    ERROR_UNKNOWN_PROBE = ERROR + "Unknown probe '{probe}' in the monitoring of '{service}'\n"
+
     SEVERITY_ERROR = "error"
 
     SEVERITY_WARNING = "warning"
@@ -105,6 +167,10 @@ class Controller:
         except InvalidCommandLine as error:
             self._report_invalid_command_line(error)
 
+        finally:
+            if self.storage is not None:
+                self.storage.close()
+
     def _report_invalid_syntax(self, error):
         self.display.invalid_model()
         self.display.invalid_syntax(error)
@@ -121,15 +187,34 @@ class Controller:
         return Arguments(command_line)
 
     def _load(self, arguments):
-        self.storage = DataStorage(
-            Parser(self.file_system, arguments._file_name),
-            FileLog(self.file_system.open_output_stream(arguments.log_file), Arguments.LOG_FORMAT),
-            lambda name, format: CSVReport(self.file_system.open_output_stream(arguments.report_for(name)), format))
+        parser = Parser(self.file_system, arguments._file_name)
+        if arguments.database is not None:
+            self.storage = self._database_storage(parser, arguments)
+        else:
+            self.storage = DataStorage(
+                parser,
+                FileLog(self.file_system.open_output_stream(arguments.log_file), Arguments.LOG_FORMAT),
+                self._report_factory(arguments))
         self.display.model_loaded(arguments)
         expression = self.storage.model()
-        self.copy_model(arguments)
+        if arguments.database is None:
+            self.copy_model(arguments)
         return expression
 
+    def _database_storage(self, parser, arguments):
+        from mad import __version__ as MAD_VERSION
+        source = self.file_system.open_input_stream(arguments._file_name).read()
+        database = Database(arguments.database)
+        run = database.new_run(arguments._model_name, source, arguments._time_limit, arguments.seed, MAD_VERSION)
+        return DatabaseStorage(parser, database, run)
+
+    def _report_factory(self, arguments):
+        if arguments.report_format == Arguments.BINARY:
+            return lambda name, format: \
+                ColumnarReport(self.file_system.open_binary_output_stream(arguments.report_for(name)), format)
+        return lambda name, format: \
+            CSVReport(self.file_system.open_output_stream(arguments.report_for(name)), format)
+
     def copy_model(self, arguments):
         source = self.file_system.open_input_stream(arguments._file_name)
         copy = self.file_system.open_output_stream(arguments.model_copy)
@@ -144,20 +229,101 @@ class Controller:
                 each_warning.accept(self.display)
 
     def _simulate(self, expression, arguments):
-        simulation = Simulation(self.storage)
-        simulation.evaluate(expression)
-        simulation.run_until(arguments._time_limit, self.display)
-        self.display.simulation_complete(arguments)
+        if arguments.snapshot:
+            simulation = self._resume(arguments)
+        else:
+            simulation = Simulation(self.storage, arguments.seed, arguments.monitoring_period, arguments.event_pool)
+            simulation.evaluate(expression)
+            simulation.model_digest = self._model_digest(arguments)
+        if arguments.precision is not None:
+            simulation.stop_when_steady(arguments.precision, arguments.metrics)
+        self._watch(simulation, arguments)
+        display = None if arguments.is_batch else self.display
+        simulation.run_until(arguments._time_limit, display, self._checkpoints(arguments))
+        if simulation.outcome is not None:
+            simulation.outcome.accept(self.display)
+        if arguments.database is not None:
+            self.display.results_stored(arguments, self.storage.run)
+        else:
+            self.display.simulation_complete(arguments)
+        return simulation
+
+    @staticmethod
+    def _watch(simulation, arguments):
+        conditions = []
+        if arguments.max_queue_growth is not None:
+            conditions.append(QueueGrowth(arguments.max_queue_growth))
+        if arguments.max_events is not None:
+            conditions.append(EventLimit(arguments.max_events))
+        if arguments.max_memory is not None:
+            conditions.append(MemoryLimit(arguments.max_memory))
+        if arguments.abort_when is not None:
+            conditions.append(ProbeCondition(*arguments.abort_when))
+        if not conditions:
+            return
+        try:
+            simulation.watch(conditions)
+        except ValueError:
+            raise InvalidOptionValue(Arguments.ABORT_WHEN, arguments._options[Arguments.ABORT_WHEN])
+
+    def _resume(self, arguments):
+        snapshot = self.file_system.open_binary_input_stream(arguments.snapshot)
+        simulation = Simulation.restore(snapshot, self.storage)
+        if simulation.model_digest not in (None, self._model_digest(arguments)):
+            raise ModelMismatch(arguments._file_name, arguments.snapshot)
+        simulation.configure(arguments.seed, arguments.monitoring_period)
+        self.display.simulation_resumed(arguments, simulation)
         return simulation
 
+    def _model_digest(self, arguments):
+        source = self.file_system.open_input_stream(arguments._file_name).read()
+        return sha256(source.encode("utf-8")).hexdigest()
+
+    def _checkpoints(self, arguments):
+        if arguments.checkpoint_period is None:
+            return None
+        return Checkpoints(
+            arguments.checkpoint_period,
+            lambda: self.file_system.open_binary_output_stream(arguments.checkpoint_file))
+
+
+class Progress:
+    """
+    Estimate the pace of the simulation, from the wall-clock time elapsed since it was first observed
+    """
+
+    def __init__(self, wall_time, simulation_time, event_count):
+        self._start = (wall_time, simulation_time, event_count)
+        self.event_rate = 0.
+        self.time_ratio = 0.
+
+    def observe(self, wall_time, simulation_time, event_count):
+        (start_wall_time, start_simulation_time, start_event_count) = self._start
+        elapsed = wall_time - start_wall_time
+        if elapsed > 0:
+            self.event_rate = (event_count - start_event_count) / elapsed
+            self.time_ratio = (simulation_time - start_simulation_time) / elapsed
+
+    def remaining_time(self, simulation_time, end):
+        if self.time_ratio <= 0:
+            return None
+        return timedelta(seconds=round(max(0, end - simulation_time) / self.time_ratio))
+
 
 class Display:
     """
-    Abstract the display where that report and format the progress of the simulation
+    Abstract the display where that report and format the progress of the simulation.
+    The progress is refreshed at most once per 'refresh_period' (in seconds of wall-clock time).
     """
 
-    def __init__(self, output):
+    REFRESH_PERIOD = 0.25
+
+    def __init__(self, output, refresh_period=REFRESH_PERIOD, wall_clock=monotonic):
         self.output = output
+        self.refresh_period = refresh_period
+        self.wall_clock = wall_clock
+        self._progress = None
+        self._last_refresh = None
 
     def _new_line(self):
         self.output.write("\n")
@@ -187,13 +353,56 @@ class Display:
     def model_copied(self, arguments):
         self._format(Messages.MODEL_COPIED, location=arguments.model_copy)
 
-    def update(self, current_time, end):
-        progress = current_time / end * 100
-        self._format(Messages.SIMULATION_PROGRESS, progress=progress)
+    def simulation_resumed(self, arguments, simulation):
+        self._format(Messages.SIMULATION_RESUMED, location=arguments.snapshot, time=simulation.schedule.time_now)
+
+    def update(self, current_time, end, event_count=0):
+        now = self.wall_clock()
+        if self._progress is None:
+            self._progress = Progress(now, current_time, event_count)
+        elif now - self._last_refresh < self.refresh_period and current_time < end:
+            return
+        self._last_refresh = now
+        self._progress.observe(now, current_time, event_count)
+        remaining_time = self._progress.remaining_time(current_time, end)
+        self._format(Messages.SIMULATION_PROGRESS,
+                     progress=current_time / end * 100,
+                     time=current_time,
+                     event_rate=self._progress.event_rate,
+                     time_ratio=self._progress.time_ratio,
+                     eta=str(remaining_time) if remaining_time is not None else Messages.UNKNOWN_ETA)
+
+    def steady_state_reached(self, outcome):
+        self._format(Messages.STEADY_STATE_REACHED, time=outcome.time, precision=outcome.precision)
+        self._show_estimates(outcome)
+
+    def steady_state_not_reached(self, outcome):
+        self._format(Messages.STEADY_STATE_NOT_REACHED, time=outcome.time, precision=outcome.precision)
+        self._show_estimates(outcome)
+
+    def simulation_diverged(self, outcome):
+        self._format(Messages.SIMULATION_DIVERGED, time=outcome.time, symptom=outcome.symptom)
+
+    def _show_estimates(self, outcome):
+        for each_estimate in outcome.estimates:
+            self._format(Messages.ESTIMATE,
+                         service=each_estimate.service,
+                         metric=each_estimate.metric,
+                         mean=self._as_text("{:.2f}", each_estimate.mean),
+                         precision=self._as_text("{:.2%}", each_estimate.relative_precision))
+
+    @staticmethod
+    def _as_text(format, value):
+        if value is None:
+            return Messages.NOT_AVAILABLE
+        return format.format(value)
 
     def simulation_complete(self, project):
         self._format(Messages.RESULTS_AVAILABLE, location=project._output_directory)
 
+    def results_stored(self, project, run):
+        self._format(Messages.RESULTS_STORED, location=project.database, run=run)
+
     def invalid_syntax(self, error):
         self._format(Messages.INVALID_SYNTAX, line=error.line_number, hint=error.hint)
 
@@ -220,6 +429,13 @@ class Display:
             service=error.service,
             operation=error.operation)
 
+    def unknown_probe(self, error):
+        self._format(
+            Messages.ERROR_UNKNOWN_PROBE,
+            severity=self._severity_of(error),
+            service=error.service,
+            probe=error.probe)
+
     def duplicate_identifier(self, error):
         self._format(Messages.ERROR_DUPLICATE_IDENTIFIER,
                      severity=self._severity_of(error),
@@ -242,6 +458,18 @@ class Display:
         self._format(Messages.INVALID_SIMULATION_FILE, file=str(error.file_name))
         self._show_usage()
 
+    def invalid_option_value(self, error):
+        self._format(Messages.INVALID_OPTION_VALUE, option=error.option, value=error.value)
+        self._show_usage()
+
+    def unknown_option(self, error):
+        self._format(Messages.UNKNOWN_OPTION, option=error.option)
+        self._show_usage()
+
+    def model_mismatch(self, error):
+        self._format(Messages.MODEL_MISMATCH, model=error.model, snapshot=error.snapshot)
+        self._show_usage()
+
     def wrong_number_of_arguments(self, error):
         self._format(Messages.INVALID_PARAMETER_COUNT, count=error.argument_count)
         self._show_usage()
@@ -256,21 +484,217 @@ class Arguments:
     """
 
     BASE_NAME = r"([^\\/]+)\.(\w+)$"
+    OPTION = r"^--([\w-]+)(?:=(.*))?$"
+    PROBE_CONDITION = r"^([^/]+)/(.+?)\s*(<=|>=|<|>)\s*(-?\d+(?:\.\d*)?)$"
+    BATCH = "batch"
+    CHECKPOINT = "checkpoint"
+    RESUME = "resume"
+    SEED = "seed"
+    PRECISION = "precision"
+    METRICS = "metrics"
+    MAX_QUEUE_GROWTH = "max-queue-growth"
+    MAX_EVENTS = "max-events"
+    MAX_MEMORY = "max-memory"
+    ABORT_WHEN = "abort-when"
+    REPORT_FORMAT = "report-format"
+    DATABASE = "database"
+    MONITORING_PERIOD = "monitoring-period"
+    EVENT_POOL = "event-pool"
+    OPTIONS = [BATCH, CHECKPOINT, RESUME, SEED, PRECISION, METRICS, MAX_QUEUE_GROWTH, MAX_EVENTS, MAX_MEMORY, ABORT_WHEN,
+               REPORT_FORMAT, DATABASE, MONITORING_PERIOD, EVENT_POOL]
+    CSV = "csv"
+    BINARY = "binary"
+    REPORT_FORMATS = [CSV, BINARY]
+    EVENT_POOLS = [Simulation.HEAP, Simulation.CALENDAR]
+    CHECKPOINT_FILE = "checkpoint.snapshot"
     LOG_FILE = "trace.log"
     LOG_FORMAT = "%5d %-20s %-s\n"
     PATH_TO_LOG_FILE = "{directory:s}/{log_file:s}"
     OUTPUT_DIRECTORY = "{name:s}_{identifier:s}"
     REPORT = "{directory:s}/{entity:s}.log"
+    BINARY_REPORT = "{directory:s}/{entity:s}.bin"
     PATH_TO_MODEL_COPY = "{directory:s}/{file:s}"
 
     def __init__(self, arguments):
-        if len(arguments) != 2:
-            raise WrongNumberOfArguments(len(arguments))
-        self._arguments = arguments
+        self._options = self._extract_options(arguments)
+        self._arguments = [each for each in arguments if not self._is_option(each)]
+        if len(self._arguments) != 2:
+            raise WrongNumberOfArguments(len(self._arguments))
         self._file_name = self._extract_file_name()
         self._time_limit = self._extract_length()
+        self._checkpoint_period = self._extract_checkpoint_period()
+        self._snapshot = self._extract_snapshot()
+        self._seed = self._extract_seed()
+        self._precision = self._extract_precision()
+        self._metrics = self._extract_metrics()
+        self._max_queue_growth = self._optional_positive_integer(self.MAX_QUEUE_GROWTH)
+        self._max_events = self._optional_positive_integer(self.MAX_EVENTS)
+        self._max_memory = self._optional_positive_integer(self.MAX_MEMORY)
+        self._abort_when = self._extract_probe_condition()
+        self._report_format = self._extract_report_format()
+        self._database = self._extract_database()
+        self._monitoring_period = self._optional_positive_integer(self.MONITORING_PERIOD)
+        self._event_pool = self._extract_event_pool()
         self.__output_directory = None
 
+    @staticmethod
+    def _is_option(argument):
+        return isinstance(argument, str) and argument.startswith("--")
+
+    def _extract_options(self, arguments):
+        options = {}
+        for each_argument in filter(self._is_option, arguments):
+            option = match(self.OPTION, each_argument)
+            if option is None or option.group(1) not in self.OPTIONS:
+                raise UnknownOption(each_argument)
+            options[option.group(1)] = option.group(2)
+        return options
+
+    @property
+    def is_batch(self):
+        return self.BATCH in self._options
+
+    def _extract_checkpoint_period(self):
+        return self._optional_positive_integer(self.CHECKPOINT)
+
+    def _optional_positive_integer(self, option):
+        if option not in self._options:
+            return None
+        return self._positive_integer(option)
+
+    def _positive_integer(self, option):
+        value = self._options[option]
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise InvalidOptionValue(option, value)
+        if number <= 0:
+            raise InvalidOptionValue(option, value)
+        return number
+
+    def _extract_seed(self):
+        if self.SEED not in self._options:
+            return None
+        value = self._options[self.SEED]
+        try:
+            seed = int(value)
+        except (TypeError, ValueError):
+            raise InvalidOptionValue(self.SEED, value)
+        if seed < 0:
+            raise InvalidOptionValue(self.SEED, value)
+        return seed
+
+    def _extract_precision(self):
+        if self.PRECISION not in self._options:
+            return None
+        value = self._options[self.PRECISION]
+        try:
+            precision = float(value)
+        except (TypeError, ValueError):
+            raise InvalidOptionValue(self.PRECISION, value)
+        if precision <= 0:
+            raise InvalidOptionValue(self.PRECISION, value)
+        return precision
+
+    def _extract_metrics(self):
+        if self.METRICS not in self._options:
+            return None
+        value = self._options[self.METRICS]
+        metrics = (value or "").split(",")
+        if any(each_metric not in SteadyStateDetector.METRICS for each_metric in metrics):
+            raise InvalidOptionValue(self.METRICS, value)
+        return metrics
+
+    def _extract_probe_condition(self):
+        if self.ABORT_WHEN not in self._options:
+            return None
+        value = self._options[self.ABORT_WHEN]
+        condition = match(self.PROBE_CONDITION, value or "")
+        if condition is None:
+            raise InvalidOptionValue(self.ABORT_WHEN, value)
+        (service, probe, operator, threshold) = condition.groups()
+        return (service, probe, operator, float(threshold))
+
+    def _extract_report_format(self):
+        value = self._options.get(self.REPORT_FORMAT, self.CSV)
+        if value not in self.REPORT_FORMATS:
+            raise InvalidOptionValue(self.REPORT_FORMAT, value)
+        return value
+
+    def _extract_event_pool(self):
+        value = self._options.get(self.EVENT_POOL, Simulation.HEAP)
+        if value not in self.EVENT_POOLS:
+            raise InvalidOptionValue(self.EVENT_POOL, value)
+        return value
+
+    def _extract_database(self):
+        if self.DATABASE in self._options and not self._options[self.DATABASE]:
+            raise InvalidOptionValue(self.DATABASE, self._options[self.DATABASE])
+        return self._options.get(self.DATABASE)
+
+    def _extract_snapshot(self):
+        if self.RESUME in self._options and not self._options[self.RESUME]:
+            raise InvalidOptionValue(self.RESUME, self._options[self.RESUME])
+        return self._options.get(self.RESUME)
+
+    @property
+    def checkpoint_period(self):
+        return self._checkpoint_period
+
+    @property
+    def seed(self):
+        return self._seed
+
+    @property
+    def precision(self):
+        return self._precision
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    @property
+    def max_queue_growth(self):
+        return self._max_queue_growth
+
+    @property
+    def max_events(self):
+        return self._max_events
+
+    @property
+    def max_memory(self):
+        return self._max_memory
+
+    @property
+    def abort_when(self):
+        return self._abort_when
+
+    @property
+    def report_format(self):
+        return self._report_format
+
+    @property
+    def monitoring_period(self):
+        return self._monitoring_period
+
+    @property
+    def event_pool(self):
+        return self._event_pool
+
+    @property
+    def database(self):
+        return self._database
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    @property
+    def checkpoint_file(self):
+        return self.PATH_TO_LOG_FILE.format(
+            directory=self._output_directory,
+            log_file=self.CHECKPOINT_FILE)
+
     def _extract_file_name(self):
         file_name = self._arguments[0]
         if not isinstance(file_name, str):
@@ -311,7 +735,8 @@ class Arguments:
         return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
     def report_for(self, entity):
-        return self.REPORT.format(
+        template = self.BINARY_REPORT if self._report_format == self.BINARY else self.REPORT
+        return template.format(
             directory=self._output_directory,
             entity=entity
         )
@@ -341,6 +766,35 @@ class InvalidSimulationLength(InvalidCommandLine):
         visitor.invalid_simulation_length(self)
 
 
+class UnknownOption(InvalidCommandLine):
+
+    def __init__(self, option):
+        self.option = option
+
+    def accept(self, visitor):
+        visitor.unknown_option(self)
+
+
+class InvalidOptionValue(InvalidCommandLine):
+
+    def __init__(self, option, value):
+        self.option = option
+        self.value = str(value)
+
+    def accept(self, visitor):
+        visitor.invalid_option_value(self)
+
+
+class ModelMismatch(InvalidCommandLine):
+
+    def __init__(self, model, snapshot):
+        self.model = model
+        self.snapshot = snapshot
+
+    def accept(self, visitor):
+        visitor.model_mismatch(self)
+
+
 class WrongNumberOfArguments(InvalidCommandLine):
 
     def __init__(self, argument_count):
@@ -18,6 +18,7 @@
 #
 
 from mad.validation.issues import *
+from mad.ast.settings import Monitoring
 
 
 class Operation:
@@ -191,7 +192,8 @@ class Validator:
             each_expression.accept(self)
 
     def of_settings(self, settings):
-        pass
+        if settings.monitoring.probes:
+            self._check_probes_exist(self.symbols.service.name, settings.monitoring.probes)
 
     def of_ignore_error(self, ignore_error):
         ignore_error.expression.accept(self)
@@ -217,6 +219,14 @@ class Validator:
                 self._report(warning)
         self.checks.append(check)
 
+    def _check_probes_exist(self, service, probes):
+        def check(symbols):
+            available = Monitoring.probe_names(symbols.entities[service].operations)
+            for each_probe in probes:
+                if each_probe not in available:
+                    self._report(UnknownProbe(service, each_probe))
+        self.checks.append(check)
+
     def _check_has_operation(self, service, operation):
         def check(symbols):
             if symbols.miss_operation(service, operation):
@@ -73,6 +73,16 @@ class UnknownService(ServiceIssue):
         visitor.unknown_service(self)
 
 
+class UnknownProbe(ServiceIssue):
+
+    def __init__(self, service, probe):
+        super().__init__(self.ERROR, service)
+        self.probe = probe
+
+    def accept(self, visitor):
+        visitor.unknown_probe(self)
+
+
 class DuplicateIdentifier(SemanticIssue):
 
     def __init__(self, identifier):
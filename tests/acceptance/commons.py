@@ -71,6 +71,34 @@ class MadAcceptanceTests(TestCase):
     def _verify_invalid_simulation_file(self, wrong_file):
         self._verify_output(Messages.INVALID_SIMULATION_FILE, file=str(wrong_file))
 
+    def _verify_unknown_option(self, option):
+        self._verify_output(Messages.UNKNOWN_OPTION, option=option)
+
+    def _verify_invalid_option_value(self, option, value):
+        self._verify_output(Messages.INVALID_OPTION_VALUE, option=option, value=value)
+
+    def _verify_resumed(self, at):
+        self._verify_output(Messages.SIMULATION_RESUMED, location=self._checkpoint_file(), time=at)
+
+    def _checkpoint_file(self):
+        directory = Arguments.OUTPUT_DIRECTORY.format(name=self.MODEL_NAME, identifier=self.IDENTIFIER)
+        return Arguments.PATH_TO_LOG_FILE.format(directory=directory, log_file=Arguments.CHECKPOINT_FILE)
+
+    def _verify_checkpoint(self):
+        self.assertTrue(self.file_system.has_file(self._checkpoint_file()),
+                        "Missing checkpoint '%s'.\n Existing files are %s" % (self._checkpoint_file(), str(self.file_system.opened_files.keys())))
+
+    def _verify_steady_state_reached(self, precision):
+        time = self.simulation.schedule.time_now
+        self._verify_output(Messages.STEADY_STATE_REACHED, time=time, precision=precision)
+
+    def _verify_diverged(self):
+        outcome = self.simulation.outcome
+        self._verify_output(Messages.SIMULATION_DIVERGED, time=outcome.time, symptom=outcome.symptom)
+
+    def _verify_no_progress(self):
+        self._verify_output_excludes("\rSimulation")
+
     def _verify_usage(self):
         self._verify_output(Messages.USAGE)
 
@@ -54,6 +54,40 @@ class ErrorsTests(MadAcceptanceTests):
         self._verify_invalid_parameter_count(len(invalid_command_line))
         self._verify_usage()
 
+    def test_unknown_option(self):
+        self.file_system.define("test.mad", "whatever, as it will not be parsed!")
+
+        invalid_command_line = ["test.mad", 1000, "--foo"]
+        self._execute(invalid_command_line)
+
+        self._verify_opening()
+        self._verify_unknown_option("--foo")
+        self._verify_usage()
+
+    def test_invalid_checkpoint_period(self):
+        self.file_system.define("test.mad", "whatever, as it will not be parsed!")
+
+        invalid_command_line = ["test.mad", 1000, "--checkpoint=often"]
+        self._execute(invalid_command_line)
+
+        self._verify_opening()
+        self._verify_invalid_option_value("checkpoint", "often")
+        self._verify_usage()
+
+    def test_abort_condition_on_unknown_probe(self):
+        self.file_system.define("test.mad", "service DB {"
+                                            "   operation Select {"
+                                            "      think 10"
+                                            "   }"
+                                            "}")
+
+        invalid_command_line = ["test.mad", 1000, "--abort-when=DB/latency>100"]
+        self._execute(invalid_command_line)
+
+        self._verify_opening()
+        self._verify_invalid_option_value("abort-when", "DB/latency>100")
+        self._verify_usage()
+
     def test_error_empty_service(self):
         self.file_system.define("test.mad", "service DB { \n"
                                             "   settings { \n"
@@ -183,3 +183,83 @@ class SuccessfulTests(MadAcceptanceTests):
         self._verify_reports_for(["DB"])
         self._verify_log()
         self._verify_model_copy()
+
+    def test_batch_mode(self):
+        self.file_system.define("test.mad", "service DB {"
+                                            "   operation Select {"
+                                            "      think 10"
+                                            "   }"
+                                            "}"
+                                            "client Browser {"
+                                            "   every 20 {"
+                                            "      query DB/Select"
+                                            "   }"
+                                            "}")
+
+        self._execute([self.LOCATION, 100, "--batch"])
+
+        self._verify_opening()
+        self._verify_valid_model()
+        self._verify_no_progress()
+        self._verify_successful_task_count("Browser", 4)
+        self._verify_reports_for(["DB"])
+
+    def test_stop_once_steady(self):
+        self.file_system.define("test.mad", "service DB {"
+                                            "   operation Select {"
+                                            "      think 10"
+                                            "   }"
+                                            "}"
+                                            "client Browser {"
+                                            "   every 20 {"
+                                            "      query DB/Select"
+                                            "   }"
+                                            "}")
+
+        self._execute([self.LOCATION, 10000, "--batch", "--precision=0.05"])
+
+        self._verify_valid_model()
+        self._verify_steady_state_reached(0.05)
+        self.assertLess(self.simulation.schedule.time_now, 10000)
+        self._verify_reports_for(["DB"])
+
+    def test_abort_diverging_simulation(self):
+        self.file_system.define("test.mad", "service DB {"
+                                            "   operation Select {"
+                                            "      think 10"
+                                            "   }"
+                                            "}"
+                                            "client Browser {"
+                                            "   every 5 {"
+                                            "      query DB/Select"
+                                            "   }"
+                                            "}")
+
+        self._execute([self.LOCATION, 10000, "--batch", "--max-queue-growth=5"])
+
+        self._verify_valid_model()
+        self._verify_diverged()
+        self.assertLess(self.simulation.schedule.time_now, 10000)
+        self._verify_reports_for(["DB"])
+
+    def test_checkpoint_and_resume(self):
+        model = "service DB {" \
+                "   operation Select {" \
+                "      think 10" \
+                "   }" \
+                "}" \
+                "client Browser {" \
+                "   every 20 {" \
+                "      query DB/Select" \
+                "   }" \
+                "}"
+        self.file_system.define("test.mad", model)
+        self._execute([self.LOCATION, 100, "--checkpoint=50"])
+        self._verify_checkpoint()
+
+        self.file_system.define("test.mad", model)
+        self._execute([self.LOCATION, 200, "--resume=" + self._checkpoint_file()])
+
+        self._verify_valid_model()
+        self._verify_resumed(at=50)
+        self._verify_successful_task_count("Browser", 9)
@@ -73,6 +73,30 @@ class AutoscalingSettingsTest(TestCase):
         evaluation.of_autoscaling.assert_called_once_with(settings)
 
 
+class MonitoringSettingsTest(TestCase):
+
+    def test_default_monitoring_samples_all_probes_on_the_default_period(self):
+        monitoring = Settings().monitoring
+        self.assertIsNone(monitoring.period)
+        self.assertIsNone(monitoring.probes)
+        self.assertFalse(monitoring.is_disabled)
+
+    def test_monitoring_without_probes_is_disabled(self):
+        self.assertTrue(Monitoring(probes=[]).is_disabled)
+
+    def test_reject_invalid_period(self):
+        for each_period in [0, -5, "wrong"]:
+            with self.assertRaises(ValueError):
+                Monitoring(period=each_period)
+
+    def test_evaluation(self):
+        monitoring = Monitoring()
+        evaluation = MagicMock(Evaluation)
+        monitoring.accept(evaluation)
+
+        evaluation.of_monitoring.assert_called_once_with(monitoring)
+
+
 class FIFOTests(TestCase):
 
      def test_accept(self):
@@ -17,11 +17,12 @@
 # along with MAD.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-from io import StringIO
+from io import StringIO, BytesIO
 
 from mad.log import Log, Event
 from mad.storage import DataStorage
 from mad.monitoring import CSVReport
+from mad.simulation.requests import Query, Trigger
 
 
 class InMemoryDataStorage(DataStorage):
@@ -43,6 +44,25 @@ class InMemoryDataStorage(DataStorage):
             self._opened_reports[entity] = CSVReport(StringIO(), format)
         return self._opened_reports[entity]
 
+    def flush(self):
+        self.log.flush()
+        for each_report in self._opened_reports.values():
+            each_report.flush()
+
+
+class FakeQuery(Query):
+    """
+    A query whose handlers (e.g., 'on_success') can be replaced, unlike regular queries, which are slotted
+    """
+    pass
+
+
+class FakeTrigger(Trigger):
+    """
+    A trigger whose handlers (e.g., 'on_success') can be replaced, unlike regular triggers, which are slotted
+    """
+    pass
+
 
 class InMemoryFileSystem:
 
@@ -55,6 +75,7 @@ class InMemoryFileSystem:
     def open_input_stream(self, location):
         if location not in self.opened_files:
             raise FileNotFoundError(location)
+        self.opened_files[location].seek(0)
         return self.opened_files[location]
 
     def open_output_stream(self, location):
@@ -62,6 +83,15 @@ class InMemoryFileSystem:
             self.opened_files[location] = StringIO()
         return self.opened_files[location]
 
+    def open_binary_input_stream(self, location):
+        if location not in self.opened_files:
+            raise FileNotFoundError(location)
+        return BytesIO(self.opened_files[location].content)
+
+    def open_binary_output_stream(self, location):
+        self.opened_files[location] = InMemoryBinaryFile()
+        return self.opened_files[location]
+
     def has_file(self, file):
         for any_location in self.opened_files:
             if any_location.endswith(file):
@@ -69,6 +99,20 @@ class InMemoryFileSystem:
         return False
 
 
+class InMemoryBinaryFile(BytesIO):
+    """
+    Keep the content of the file once it is closed
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.content = b""
+
+    def close(self):
+        self.content = self.getvalue()
+        super().close()
+
+
 class InMemoryLog(Log):
     """
     Hold the history of events in a list for later processing
@@ -19,10 +19,9 @@
 
 from unittest import TestCase
 from mock import MagicMock
-from tests.fakes import InMemoryDataStorage
+from tests.fakes import InMemoryDataStorage, FakeQuery, FakeTrigger
 
 from mad.simulation.factory import Simulation
-from mad.simulation.requests import Query, Trigger
 from mad.simulation.tasks import Task, TaskStatus
 
 
@@ -49,7 +48,7 @@ class ServiceTests(TestCase):
         self.simulation.run_until(end)
 
     def query(self, service_name, operation, on_success=lambda:None, on_error=lambda:None):
-        request = Query(self.a_running_task(), operation, 1, lambda s:None)
+        request = FakeQuery(self.a_running_task(), operation, 1, lambda s:None)
         request.on_success = on_success
         request.on_error = on_error
         self.send(request, service_name)
@@ -61,7 +60,7 @@ class ServiceTests(TestCase):
         return task
 
     def trigger(self, service_name, operation, on_success=lambda:None, on_error=lambda:None):
-        request = Trigger(self.a_running_task(), operation, 1, lambda s:None)
+        request = FakeTrigger(self.a_running_task(), operation, 1, lambda s:None)
         request.on_success = on_success
         request.on_error = on_error
         self.send(request, service_name)
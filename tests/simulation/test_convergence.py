@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from unittest import TestCase
+
+from tests.simulation.commons import ServiceTests
+
+from mad.evaluation import Symbols
+from mad.ast.commons import Sequence
+from mad.ast.definitions import DefineService, DefineOperation, DefineClientStub
+from mad.ast.actions import Think, Query
+from mad.simulation.convergence import BatchMeans, SteadyStateDetector, Converged, NotConverged
+
+
+class BatchMeansTests(TestCase):
+
+    def test_batches_are_averaged(self):
+        estimator = BatchMeans(batch_size=2)
+        for each_value in [1, 3, 5, 7, 9]:
+            estimator.observe(each_value)
+
+        self.assertEqual(2, estimator.batch_count)
+        self.assertEqual(4, estimator.mean)
+
+    def test_half_width(self):
+        estimator = BatchMeans(batch_size=1)
+        for each_value in [2, 4, 6]:
+            estimator.observe(each_value)
+
+        self.assertAlmostEqual(4.303 * 2 / 3 ** 0.5, estimator.half_width, places=6)
+
+    def test_precision_is_unknown_with_too_few_batches(self):
+        estimator = BatchMeans(batch_size=1)
+        for each_value in range(BatchMeans.MINIMUM_BATCH_COUNT - 1):
+            estimator.observe(10)
+
+        self.assertIsNone(estimator.relative_precision)
+
+    def test_constant_series_are_perfectly_precise(self):
+        estimator = BatchMeans(batch_size=1)
+        for each_value in range(BatchMeans.MINIMUM_BATCH_COUNT):
+            estimator.observe(10)
+
+        self.assertEqual(0., estimator.relative_precision)
+
+    def test_relative_precision(self):
+        estimator = BatchMeans(batch_size=1)
+        for each_value in range(BatchMeans.MINIMUM_BATCH_COUNT):
+            estimator.observe(10 + (-1) ** each_value)
+
+        self.assertAlmostEqual(estimator.half_width / 10, estimator.relative_precision)
+
+    def test_warm_up_batches_are_discarded(self):
+        estimator = BatchMeans(batch_size=5, warm_up=2)
+        for each_value in self._series_with_transient(length=10, then=100):
+            estimator.observe(each_value)
+
+        self.assertEqual(2, estimator.discarded_count)
+        self.assertEqual(20, estimator.batch_count)
+        self.assertEqual(10., estimator.mean)
+        self.assertEqual(0., estimator.relative_precision)
+
+    def test_transients_bias_estimates_without_warm_up(self):
+        estimator = BatchMeans(batch_size=5)
+        for each_value in self._series_with_transient(length=10, then=100):
+            estimator.observe(each_value)
+
+        self.assertLess(estimator.mean, 10.)
+        self.assertGreater(estimator.relative_precision, 0.)
+
+    @staticmethod
+    def _series_with_transient(length, then):
+        """
+        A series that ramps up from 0 to 10, and stays at 10 afterwards (like a queue, empty at first)
+        """
+        return [10. * each_index / length for each_index in range(length)] + [10.] * then
+
+
+class SteadyStateDetectorTests(ServiceTests):
+
+    def setUp(self):
+        super().setUp()
+        self.evaluate(
+            Sequence(
+                DefineService("DB",
+                    DefineOperation("Select", Think(10))
+                ),
+                DefineClientStub("Browser", 20,
+                    Query("DB", "Select")
+                )
+            )
+        )
+
+    def test_simulation_stops_once_steady(self):
+        self.simulation.stop_when_steady(0.05)
+
+        self.simulate_until(10000)
+
+        self.assertLess(self.simulation.schedule.time_now, 10000)
+        self.assertIsInstance(self.simulation.outcome, Converged)
+        for each_estimate in self.simulation.outcome.estimates:
+            self.assertLessEqual(each_estimate.relative_precision, 0.05)
+
+    def test_estimates_of_selected_metrics(self):
+        self.simulation.stop_when_steady(0.05, [SteadyStateDetector.RESPONSE_TIME])
+
+        self.simulate_until(10000)
+
+        (estimate,) = self.simulation.outcome.estimates
+        self.assertEqual("DB", estimate.service)
+        self.assertEqual(SteadyStateDetector.RESPONSE_TIME, estimate.metric)
+        self.assertEqual(self.look_up("DB").look_up(Symbols.MONITOR).statistics.response_time, estimate.mean)
+
+    def test_warm_up_is_discarded(self):
+        self.simulation.stop_when_steady(0.05, warm_up=3)
+
+        self.simulate_until(10000)
+
+        for each_estimate in self.simulation.outcome.estimates:
+            self.assertEqual(3, each_estimate.estimator.discarded_count)
+
+    def test_simulation_that_ends_before_steady_state(self):
+        self.simulation.stop_when_steady(0.05)
+
+        self.simulate_until(100)
+
+        self.assertEqual(100, self.simulation.schedule.time_now)
+        self.assertIsInstance(self.simulation.outcome, NotConverged)
+
+    def test_simulation_without_steady_state_detection(self):
+        self.simulate_until(100)
+
+        self.assertIsNone(self.simulation.outcome)
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
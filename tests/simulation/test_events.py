@@ -54,6 +54,37 @@ class DispatcherTests(TestCase):
 
         listener.task_created.assert_called_once_with(FAKE_REQUEST)
 
+    def test_dispatch_without_listener(self):
+        self.dispatcher.task_created(FAKE_TASK)
+        self.dispatcher.task_assigned_to(FAKE_TASK, FAKE_WORKER)
+
+    def test_only_listeners_that_override_a_handler_subscribe(self):
+        class TaskCounter(Listener):
+
+            def __init__(self):
+                self.count = 0
+
+            def task_created(self, task):
+                self.count += 1
+
+        counter = TaskCounter()
+        self.dispatcher.register(counter)
+        self.dispatcher.register(Listener())
+
+        self.dispatcher.task_created(FAKE_TASK)
+
+        self.assertEqual(1, counter.count)
+        self.assertEqual([counter.task_created], self.dispatcher._subscribers["task_created"])
+        self.assertEqual([], self.dispatcher._subscribers["task_accepted"])
+
+    def test_dispatch_to_several_listeners(self):
+        listeners = [self._fake_listener() for _ in range(3)]
+
+        self.dispatcher.success_of(FAKE_REQUEST)
+
+        for each_listener in listeners:
+            each_listener.success_of.assert_called_once_with(FAKE_REQUEST)
+
     def test_dispatch(self):
         invocations = [
             ("task_created", [FAKE_TASK]),
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from gc import collect, disable, enable
+from sys import getsizeof
+from tracemalloc import start, stop, get_traced_memory
+
+from tests.simulation.commons import ServiceTests
+
+from mad.ast.commons import Sequence
+from mad.ast.definitions import DefineService, DefineOperation, DefineClientStub
+from mad.ast.actions import Think, Query, Trigger, Fail, Retry, IgnoreError
+from mad.compilation import Frame, ProgramCounter
+from mad.environment import Environment
+from mad.evaluation import Success, Error, Paused, Busy, SUCCEEDED, FAILED, PAUSED, BUSY
+from mad.scheduling import Event
+from mad.simulation.client import ClientRequest
+from mad.simulation.requests import Query as QueryRequest
+from mad.simulation.tasks import Task
+
+
+class Unslotted:
+    """
+    A reference object, which holds its attributes in a dictionary
+    """
+    pass
+
+
+class CompactnessTests(ServiceTests):
+
+    def test_hot_objects_have_no_dictionary(self):
+        for each_object in self._hot_objects():
+            self.assertFalse(hasattr(each_object, "__dict__"), "%s has a __dict__" % type(each_object).__name__)
+
+    def test_hot_objects_are_smaller_than_their_unslotted_counterparts(self):
+        for each_object in self._hot_objects():
+            reference = self._unslotted_copy_of(each_object)
+            self.assertLess(self._footprint_of(each_object), self._footprint_of(reference),
+                            "%s is not smaller than its unslotted counterpart" % type(each_object).__name__)
+
+    @staticmethod
+    def _footprint_of(any_object):
+        size = getsizeof(any_object)
+        if hasattr(any_object, "__dict__"):
+            size += getsizeof(any_object.__dict__)
+        return size
+
+    def _hot_objects(self):
+        task = Task(self.fake_client(), ClientRequest())
+        frame = Frame(Environment(), task, None, None)
+        return [
+            task,
+            task.request,
+            QueryRequest(self.a_running_task(), "Select", 1, lambda status: None),
+            Event(10, lambda: None),
+            Environment().create_local_environment(),
+            frame,
+            ProgramCounter(None, 1, frame, lambda status: None),
+            Success(), Error(), Paused(), Busy()
+        ]
+
+    @staticmethod
+    def _unslotted_copy_of(hot_object):
+        copy = Unslotted()
+        for each_class in type(hot_object).__mro__:
+            for each_slot in each_class.__dict__.get("__slots__", ()):
+                if hasattr(hot_object, each_slot):
+                    setattr(copy, each_slot, getattr(hot_object, each_slot))
+        return copy
+
+    def test_results_without_value_are_shared(self):
+        self.assertTrue(SUCCEEDED.is_successful)
+        self.assertIsNone(SUCCEEDED.value)
+        self.assertTrue(FAILED.is_erroneous)
+        self.assertTrue(PAUSED.is_paused)
+        self.assertTrue(BUSY.is_busy())
+
+
+class MemoryBenchmark(ServiceTests):
+    """
+    Measure the memory held by each pending request, when a client floods a service that never completes
+    """
+
+    IN_FLIGHT_REQUESTS = 2000
+    MAXIMUM_BYTES_PER_REQUEST = 1024
+
+    def test_bytes_per_in_flight_request(self):
+        self.evaluate(
+            Sequence(
+                DefineService("DB",
+                    DefineOperation("Select", Think(10 * self.IN_FLIGHT_REQUESTS))
+                ),
+                DefineClientStub("Browser", 1,
+                    Query("DB", "Select")
+                )
+            )
+        )
+        self.simulate_until(10)
+        self.simulation.log.entries.clear()
+
+        collect()
+        start()
+        try:
+            (before, _) = get_traced_memory()
+            self.simulate_until(10 + self.IN_FLIGHT_REQUESTS)
+            self.simulation.log.entries.clear()
+            collect()
+            (after, _) = get_traced_memory()
+        finally:
+            stop()
+
+        bytes_per_request = (after - before) / self.IN_FLIGHT_REQUESTS
+        self.assertLess(bytes_per_request, self.MAXIMUM_BYTES_PER_REQUEST)
+
+
+class ReferenceCycleTests(ServiceTests):
+    """
+    Completed requests must be freed by reference counting alone, without the cyclic garbage collector
+    """
+
+    def test_completed_requests_leave_no_garbage_cycles(self):
+        self.evaluate(
+            Sequence(
+                DefineService("DB",
+                    DefineOperation("Select", Sequence(Think(2), Fail(0.3)))
+                ),
+                DefineService("Front",
+                    DefineOperation("checkout",
+                        Sequence(
+                            IgnoreError(Query("DB", "Select", timeout=3)),
+                            Retry(Query("DB", "Select"), limit=3),
+                            Trigger("DB", "Select")
+                        )
+                    )
+                ),
+                DefineClientStub("Browser", 5,
+                    Query("Front", "checkout")
+                )
+            )
+        )
+        self.simulate_until(100)
+
+        collect()
+        disable()
+        try:
+            self.simulate_until(5000)
+            unreachable = collect()
+        finally:
+            enable()
+
+        self.assertEqual(0, unreachable)
@@ -18,14 +18,20 @@
 #
 
 from unittest import TestCase
-from mock import MagicMock, patch
+from mock import MagicMock, patch, call
+from io import StringIO
 
 from tests.fakes import InMemoryDataStorage
 
 from mad.log import Log
+from mad.ast.commons import Sequence
+from mad.ast.definitions import DefineService, DefineOperation
+from mad.ast.settings import Monitoring
+from mad.ast.actions import Think
+from mad.monitoring import CSVReport
 from mad.evaluation import Symbols
 from mad.simulation.factory import Factory
-from mad.simulation.monitoring import OperationStatistics, TasksStatistics, WorkersStatistics, Monitor, Probe, Statistics, Logger
+from mad.simulation.monitoring import Accumulator, WindowedStatistics, OperationStatistics, TasksStatistics, WorkersStatistics, Monitor, Probe, Samples, Statistics, Logger
 from mad.simulation.events import Dispatcher
 from mad.simulation.requests import Request
 from mad.simulation.tasks import Task, TaskStatus
@@ -254,6 +260,95 @@ class TasksStatisticsTests(TestCase):
                              "Wrong count of {:s} tasks (expected {!s} but found {!s}!)".format(label, expected_value, property))
 
 
+class AccumulatorTests(TestCase):
+
+    def setUp(self):
+        self.accumulator = Accumulator()
+
+    def test_empty_accumulator(self):
+        self.assertEqual(0, self.accumulator.count)
+        self.assertIsNone(self.accumulator.mean)
+        self.assertIsNone(self.accumulator.variance)
+        self.assertIsNone(self.accumulator.minimum)
+        self.assertIsNone(self.accumulator.maximum)
+
+    def test_summary(self):
+        values = [4, 8, 2, 6]
+        for each_value in values:
+            self.accumulator.add(each_value)
+
+        self.assertEqual(4, self.accumulator.count)
+        self.assertEqual(20, self.accumulator.total)
+        self.assertEqual(5, self.accumulator.mean)
+        self.assertEqual(2, self.accumulator.minimum)
+        self.assertEqual(8, self.accumulator.maximum)
+        self.assertAlmostEqual(20 / 3, self.accumulator.variance)
+        self.assertAlmostEqual((20 / 3) ** 0.5, self.accumulator.standard_deviation)
+
+    def test_constant_values_have_no_variance(self):
+        for each_value in range(100):
+            self.accumulator.add(0.1)
+
+        self.assertGreaterEqual(self.accumulator.variance, 0.)
+        self.assertAlmostEqual(0., self.accumulator.variance)
+
+
+class WindowedStatisticsTests(TestCase):
+
+    def setUp(self):
+        self.windows = WindowedStatistics(history=3)
+
+    def test_counts_of_the_current_window(self):
+        self._arrivals("foo", "foo", "bar")
+        self.windows.task_successful(a_task(response_time=4))
+        self.windows.task_successful(a_task(response_time=6))
+        self.windows.task_rejected(a_task())
+
+        self.assertEqual(3, self.windows.current.arrival_count)
+        self.assertEqual(2, self.windows.current.arrival_count_of("foo"))
+        self.assertEqual(1, self.windows.current.rejection_count)
+        self.assertEqual(5, self.windows.current.response_time)
+
+    def test_closing_opens_a_new_window(self):
+        self._arrivals("foo")
+        self.windows.close()
+
+        self.assertEqual(0, self.windows.current.arrival_count)
+        self.assertEqual(1, self.windows.last.arrival_count)
+
+    def test_recent_windows_are_summed(self):
+        for each_count in [1, 2, 3, 4, 5]:
+            self._arrivals(*["foo"] * each_count)
+            self.windows.close()
+
+        self.assertEqual(3, self.windows.window_count)
+        self.assertEqual(3 + 4 + 5, self.windows.recent.arrival_count)
+        self.assertEqual(3 + 4 + 5, self.windows.recent.arrival_count_of("foo"))
+        self.assertEqual(5, self.windows.last.arrival_count)
+
+    def test_sliding_average(self):
+        self.assertIsNone(self.windows.sliding_average(lambda window: window.arrival_count))
+
+        for each_count in [1, 2, 3, 4, 5]:
+            self._arrivals(*["foo"] * each_count)
+            self.windows.close()
+
+        self.assertEqual(4, self.windows.sliding_average(lambda window: window.arrival_count))
+
+    def test_unknown_response_times_are_counted_as_in_operation_statistics(self):
+        operation = OperationStatistics()
+        for each_response_time in [4, -1, 6]:
+            self.windows.task_successful(a_task(response_time=each_response_time))
+            operation.call_succeed(each_response_time)
+
+        self.assertEqual(operation.success_count, self.windows.current.success_count)
+        self.assertEqual(operation.response_time, self.windows.current.response_time)
+
+    def _arrivals(self, *operations):
+        for each_operation in operations:
+            self.windows.task_created(a_task(operation=each_operation))
+
+
 class OperationStatisticsTests(TestCase):
 
     def setUp(self):
@@ -293,6 +388,8 @@ class OperationStatisticsTests(TestCase):
 
         expectation = sum(durations) / len(durations)
         self.assertEqual(expectation, self.operation.response_time)
+        self.assertEqual(4, self.operation.response_times.minimum)
+        self.assertEqual(8, self.operation.response_times.maximum)
 
     def test_reset(self):
         self.operation.call()
@@ -330,7 +427,7 @@ class StatisticsTests(TestCase):
         self.statistics.task_created(a_request())
         self.statistics.rejection_of(a_request())
         self.statistics.task_failed(a_request())
-        self.statistics.task_successful(a_request(10))
+        self.statistics.task_successful(a_task(response_time=10))
         self.statistics.reset()
 
         self.assertEqual(0, self.statistics.arrival_count)
@@ -344,20 +441,20 @@ class StatisticsTests(TestCase):
         self.assertEqual(1, self.statistics.failure_count)
 
     def test_success_count(self):
-        self.statistics.task_successful(a_request())
-        self.statistics.task_successful(a_request())
-        self.statistics.task_successful(a_request())
-        self.statistics.task_successful(a_request())
+        self.statistics.task_successful(a_task())
+        self.statistics.task_successful(a_task())
+        self.statistics.task_successful(a_task())
+        self.statistics.task_successful(a_task())
         self.statistics.rejection_of(a_request())
         self.statistics.task_failed(a_request())
 
         self.assertEqual(4, self.statistics.success_count)
 
     def test_reliability(self):
-        self.statistics.task_successful(a_request())
-        self.statistics.task_successful(a_request())
-        self.statistics.task_successful(a_request())
-        self.statistics.task_successful(a_request())
+        self.statistics.task_successful(a_task())
+        self.statistics.task_successful(a_task())
+        self.statistics.task_successful(a_task())
+        self.statistics.task_successful(a_task())
         self.statistics.task_rejected(a_request())
         self.statistics.task_failed(a_request())
 
@@ -407,6 +504,34 @@ class StatisticsTests(TestCase):
         self.assertEqual(4.0, self.statistics.response_time_for("bar"))
         self.assertEqual(10, self.statistics.response_time_for("quz"))
 
+    def test_service_figures_cover_all_operations(self):
+        for (each_operation, each_response_time) in [("foo", 10), ("bar", 20), ("quz", 30)]:
+            self.statistics.task_created(a_task(operation=each_operation))
+            self.statistics.task_successful(a_task(operation=each_operation, response_time=each_response_time))
+        self.statistics.task_created(a_task(operation="foo"))
+        self.statistics.task_rejected(a_task(operation="foo"))
+        self.statistics.task_created(a_task(operation="bar"))
+        self.statistics.task_failed(a_task(operation="bar"))
+
+        self.assertEqual(5, self.statistics.arrival_count)
+        self.assertEqual(3, self.statistics.success_count)
+        self.assertEqual(1, self.statistics.rejection_count)
+        self.assertEqual(2, self.statistics.failure_count)
+        self.assertEqual(5, self.statistics.complete_request_count)
+        self.assertEqual(3 / 5, self.statistics.reliability)
+        self.assertEqual(20, self.statistics.response_time)
+        self.assertEqual(0.5, self.statistics.reliability_for("foo"))
+
+    def test_response_time_quantiles(self):
+        for each_response_time in range(1, 101):
+            operation = "foo" if each_response_time % 2 == 0 else "bar"
+            self.statistics.task_successful(a_task(operation=operation, response_time=each_response_time))
+
+        self.assertAlmostEqual(50, self.statistics.response_time_quantile(0.5), delta=1)
+        self.assertAlmostEqual(99, self.statistics.response_time_quantile(0.99), delta=1)
+        self.assertAlmostEqual(100, self.statistics.response_time_quantile_for("foo", 0.99), delta=1)
+        self.assertIsNone(self.statistics.response_time_quantile_for("quz", 0.5))
+
     def _success_of_tasks(self, response_times=[3, 4, 5, 6]):
         for each_response_time in response_times:
             task = a_task(response_time=each_response_time)
@@ -437,6 +562,51 @@ class ProbeTests(TestCase):
 
         self.assertEqual("   NA", text)
 
+    def test_missing_numeric_value_is_sampled_as_nan(self):
+        probe = Probe("text", 5, "{:d}", lambda x: None)
+
+        sample = probe.sample(None)
+
+        self.assertNotEqual(sample, sample)
+        self.assertEqual("   NA", probe.text_of(sample))
+
+    def test_integral_samples_are_formatted_as_integers(self):
+        probe = Probe("text", 5, "{:d}", lambda x: 5)
+
+        self.assertEqual("    5", probe.text_of(5.0))
+
+
+class SamplesTests(TestCase):
+
+    def setUp(self):
+        self.counter = 0
+        self.samples = Samples([Probe("count", 3, "{:d}", lambda self: self.counter),
+                                Probe("weather", 6, "{:s}", lambda self: "sunny")])
+
+    def test_record_appends_one_sample_per_column(self):
+        for self.counter in range(3):
+            self.samples.record(self)
+
+        self.assertEqual(3, self.samples.size)
+        self.assertEqual([0., 1., 2.], list(self.samples.column("count")))
+        self.assertEqual(["sunny"] * 3, self.samples.column("weather"))
+
+    def test_numeric_columns_are_arrays(self):
+        self.assertEqual("d", self.samples.column("count").typecode)
+
+    def test_unknown_column(self):
+        with self.assertRaises(KeyError):
+            self.samples.column("temperature")
+
+    def test_rows_are_formatted(self):
+        for self.counter in range(3):
+            self.samples.record(self)
+
+        rows = list(self.samples.rows(1, 3))
+
+        self.assertEqual([{"count": "  1", "weather": " sunny"},
+                          {"count": "  2", "weather": " sunny"}], rows)
+
 
 class MonitorTests(TestCase):
 
@@ -445,16 +615,25 @@ class MonitorTests(TestCase):
         self.storage = InMemoryDataStorage(None)
         self.simulation = self.factory.create_simulation(self.storage)
 
-    def test_cumulaive_success_calculation(self):
+    def test_throughput_calculation(self):
         period = 10
         self.monitor = self._create_monitor(period)
 
         (success, rejection, error) = (10, 3, 4)
         self._run_scenario(success, rejection, error)
 
-        expected = success
+        expected = success / period
         self.assertEqual(expected, self.monitor._throughput())
 
+    def test_rates_only_account_for_the_current_period(self):
+        period = 10
+        self.monitor = self._create_monitor(period)
+        self._run_scenario(20, 10, 0)
+        self._run_scenario(5, 0, 0)
+
+        self.assertEqual(5 / period, self.monitor._throughput())
+        self.assertEqual(0, self.monitor._rejection_rate())
+
     def test_reliability_with_only_errors(self):
         period = 10
         self.monitor = self._create_monitor(period)
@@ -465,13 +644,31 @@ class MonitorTests(TestCase):
         expected = 0.
         self.assertEqual(expected, self.monitor._throughput())
 
+    def test_rates_are_measured_over_the_last_complete_window(self):
+        period = 10
+        self.monitor = self._create_monitor(period)
+        self._run_scenario(20, 10, 0)
+
+        self.monitor.windows.task_successful(a_task())
+
+        self.assertEqual(20 / period, self.monitor._throughput())
+        self.assertEqual(10 / period, self.monitor._rejection_rate())
+
+    def test_rates_are_unknown_until_a_window_is_complete(self):
+        self.monitor = self._create_monitor(10)
+        self.monitor.windows.task_successful(a_task())
+
+        self.assertIsNone(self.monitor._throughput())
+
     def _run_scenario(self, total, rejected, errors):
-        for i in range(total):
-            self.monitor.statistics.task_successful(a_request())
-        for i in range(rejected):
-            self.monitor.statistics.task_rejected(a_request())
-        for i in range(errors):
-            self.monitor.statistics.task_failed(a_request())
+        for each_statistics in [self.monitor.statistics, self.monitor.windows]:
+            for i in range(total):
+                each_statistics.task_successful(a_task())
+            for i in range(rejected):
+                each_statistics.task_rejected(a_task())
+            for i in range(errors):
+                each_statistics.task_failed(a_task())
+        self.monitor.windows.close()
 
     def test_runs_with_the_proper_period(self):
         with patch.object(Monitor, 'monitor') as trigger:
@@ -484,22 +681,97 @@ class MonitorTests(TestCase):
             expected_call_count = int(test_duration / period)
             self.assertEqual(expected_call_count, trigger.call_count)
 
+    def test_response_time_quantile_probes(self):
+        monitor = self._create_monitor()
+        for each_response_time in [10, 20, 30]:
+            monitor.statistics.task_successful(a_task(response_time=each_response_time))
+
+        probes = {each_probe.name: each_probe for each_probe in monitor.probes}
+
+        self.assertAlmostEqual(20, probes["response time p50"].measure(monitor), delta=0.2)
+        self.assertAlmostEqual(30, probes["response time p99.9"].measure(monitor), delta=0.3)
+
     def test_setting_probes(self):
-        fake_report = MagicMock()
-        self.storage.report_for = MagicMock(return_value=fake_report)
+        output = StringIO()
         monitor = self._create_monitor()
+        self.storage.report_for = lambda name, format: CSVReport(output, format)
         monitor.set_probes([Probe("time", 5, "{:d}", lambda self: 10),
                             Probe("weather", 10, "{:s}", lambda self: "cloudy")])
 
         monitor.monitor()
+        monitor.flush()
+
+        self.assertEqual("time, weather\n   10,     cloudy\n", output.getvalue())
+
+    def test_samples_are_reported_by_chunks(self):
+        fake_report = MagicMock()
+        self.storage.report_for = MagicMock(return_value=fake_report)
+        monitor = self._create_monitor()
+        monitor.set_probes([Probe("time", 5, "{:d}", lambda self: 10)])
+
+        for _ in range(Monitor.CHUNK_SIZE - 1):
+            monitor.monitor()
+        fake_report.write.assert_not_called()
+
+        monitor.monitor()
+        fake_report.write.assert_called_once_with(monitor.samples, 0, Monitor.CHUNK_SIZE)
+
+    def test_flush_only_reports_new_samples(self):
+        fake_report = MagicMock()
+        self.storage.report_for = MagicMock(return_value=fake_report)
+        monitor = self._create_monitor()
+        monitor.set_probes([Probe("time", 5, "{:d}", lambda self: 10)])
+
+        monitor.monitor()
+        monitor.flush()
+        monitor.monitor()
+        monitor.flush()
+
+        self.assertEqual([call(monitor.samples, 0, 1), call(monitor.samples, 1, 2)],
+                         fake_report.write.call_args_list)
+
+    def test_selecting_probes(self):
+        monitor = self._create_monitor(probes=["throughput", "queue"])
+
+        self.assertEqual(["time", "throughput", "queue"], [each.name for each in monitor.probes])
+        with self.assertRaises(KeyError):
+            monitor.samples.column("utilisation")
+
+    def test_selecting_unknown_probes(self):
+        with self.assertRaises(ValueError):
+            self._create_monitor(probes=["latency"])
+
+    def test_disabled_monitor_neither_samples_nor_reports(self):
+        self.storage.report_for = MagicMock()
+        monitor = self._create_monitor(probes=[])
+
+        self.simulation.run_until(200)
+
+        self.storage.report_for.assert_not_called()
+        self.assertEqual(0, monitor.samples.size)
+
+    def test_default_period_comes_from_the_simulation(self):
+        self.simulation.monitoring_period = 25
+        monitor = self._create_monitor(period=None)
+        self.assertEqual(25, monitor.period)
+
+    def test_period_defaults_to_ten(self):
+        monitor = self._create_monitor(period=None)
+        self.assertEqual(Monitor.DEFAULT_PERIOD, monitor.period)
+
+    def test_probe_names(self):
+        db = self.simulation.evaluate(
+            DefineService("DB", Sequence(DefineOperation("Select", Think(5)), DefineOperation("Insert", Think(5))))
+        ).value
+        monitor = db.look_up(Symbols.MONITOR)
 
-        fake_report.assert_called_once_with(time="   10", weather="    cloudy")
+        self.assertEqual([each.name for each in monitor.probes], Monitoring.probe_names(["Select", "Insert"]))
 
-    def _create_monitor(self, period=50):
+    def _create_monitor(self, period=50, probes=None):
         environment = self.simulation.environment.create_local_environment()
         environment.define(Symbols.LISTENER, Dispatcher())
         self._create_fake_service(environment)
-        monitor = Monitor(Symbols.MONITOR, environment, period)
+        monitor = Monitor(Symbols.MONITOR, environment, period, probes)
         self.simulation.environment.define(Symbols.MONITOR, monitor)
         return monitor
 
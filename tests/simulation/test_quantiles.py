@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from random import Random
+from unittest import TestCase
+
+from mad.simulation.quantiles import QuantileSketch
+
+
+class QuantileSketchTests(TestCase):
+
+    def test_empty_sketch(self):
+        sketch = QuantileSketch()
+
+        self.assertEqual(0, sketch.count)
+        self.assertIsNone(sketch.quantile(0.5))
+
+    def test_quantiles_are_within_the_relative_error(self):
+        values = [Random(42).expovariate(0.01) for _ in range(10000)]
+        sketch = self._sketch_of(values)
+
+        for each_quantile in [0.5, 0.95, 0.99, 0.999]:
+            expected = sorted(values)[int(each_quantile * (len(values) - 1))]
+            self.assertAlmostEqual(expected, sketch.quantile(each_quantile), delta=0.01 * expected)
+
+    def test_zeros(self):
+        sketch = self._sketch_of([0, 0, 0, 10])
+
+        self.assertEqual(0, sketch.quantile(0.5))
+        self.assertAlmostEqual(10, sketch.quantile(1.), delta=0.1)
+
+    def test_memory_is_bounded(self):
+        sketch = QuantileSketch(maximum_bucket_count=10)
+        for each_value in range(1, 10000):
+            sketch.add(each_value)
+
+        self.assertEqual(10, len(sketch._buckets))
+        self.assertAlmostEqual(9999, sketch.quantile(1.), delta=100)
+
+    def test_buckets_are_kept_in_order(self):
+        random = Random(42)
+        sketch = QuantileSketch(maximum_bucket_count=50)
+        values = [random.expovariate(0.01) for _ in range(5000)]
+        for each_value in values:
+            sketch.add(each_value)
+
+        self.assertEqual(sorted(sketch._buckets), sketch._indexes)
+        self.assertAlmostEqual(max(values), sketch.quantile(1.), delta=0.01 * max(values))
+
+    def test_merging(self):
+        (low, high) = (list(range(1, 501)), list(range(501, 1001)))
+        merged = QuantileSketch.merge_all([self._sketch_of(low), self._sketch_of(high)])
+        whole = self._sketch_of(low + high)
+
+        self.assertEqual(1000, merged.count)
+        for each_quantile in [0.5, 0.95, 0.99]:
+            self.assertEqual(whole.quantile(each_quantile), merged.quantile(each_quantile))
+
+    def test_merging_sketches_with_different_precision(self):
+        with self.assertRaises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.05))
+
+    @staticmethod
+    def _sketch_of(values):
+        sketch = QuantileSketch()
+        for each_value in values:
+            sketch.add(each_value)
+        return sketch
@@ -60,3 +60,33 @@ class RequestTests(TestCase):
         with self.assertRaises(AssertionError):
             request.response_time
 
+    def test_timeout_is_cancelled_on_success(self):
+        (request, timeout) = self._a_request_with_timeout()
+
+        request.reply_success()
+
+        timeout.cancel.assert_called_once_with()
+
+    def test_timeout_is_cancelled_on_error(self):
+        (request, timeout) = self._a_request_with_timeout()
+
+        request.reply_error()
+
+        timeout.cancel.assert_called_once_with()
+
+    def test_timeout_is_cancelled_on_rejection(self):
+        (request, timeout) = self._a_request_with_timeout()
+
+        request.reject()
+
+        timeout.cancel.assert_called_once_with()
+
+    def _a_request_with_timeout(self):
+        sender = MagicMock()
+        type(sender.schedule).time_now = PropertyMock(return_value=10)
+        timeout = MagicMock()
+        request = Query(Task(sender), "foo_operation", 1, lambda s: None)
+        request.send_to(MagicMock())
+        sender.schedule.after = MagicMock(return_value=timeout)
+        request.time_out_after(5, lambda: None)
+        return (request, timeout)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from unittest import TestCase
+
+from tests.fakes import InMemoryDataStorage
+
+from mad.ast.commons import Sequence
+from mad.ast.definitions import DefineService, DefineOperation, DefineClientStub
+from mad.ast.actions import Think, Fail, Query, Retry, Delay
+from mad.simulation.factory import Simulation
+from mad.simulation.streams import RandomStreams
+
+
+class RandomStreamsTests(TestCase):
+
+    def test_same_seed_yields_the_same_numbers(self):
+        first, second = RandomStreams(42), RandomStreams(42)
+
+        self.assertEqual(self._draw(first.stream_for("DB")), self._draw(second.stream_for("DB")))
+
+    def test_streams_do_not_depend_on_the_order_of_creation(self):
+        first, second = RandomStreams(42), RandomStreams(42)
+        first.stream_for("Browser")
+
+        self.assertEqual(self._draw(first.stream_for("DB")), self._draw(second.stream_for("DB")))
+
+    def test_entities_have_distinct_streams(self):
+        streams = RandomStreams(42)
+
+        self.assertNotEqual(self._draw(streams.stream_for("DB")), self._draw(streams.stream_for("DB", "backoff")))
+
+    def test_the_same_entity_always_gets_the_same_stream(self):
+        streams = RandomStreams(42)
+
+        self.assertIs(streams.stream_for("DB"), streams.stream_for("DB"))
+
+    def test_seeds_yield_different_numbers(self):
+        self.assertNotEqual(self._draw(RandomStreams(1).stream_for("DB")),
+                            self._draw(RandomStreams(2).stream_for("DB")))
+
+    @staticmethod
+    def _draw(stream):
+        return [stream.random() for _ in range(10)]
+
+
+class ReproducibilityTests(TestCase):
+
+    def test_simulations_with_the_same_seed_are_identical(self):
+        self.assertEqual(self._simulate(seed=42), self._simulate(seed=42))
+
+    def test_simulations_with_different_seeds_differ(self):
+        self.assertNotEqual(self._simulate(seed=1), self._simulate(seed=2))
+
+    @staticmethod
+    def _simulate(seed):
+        storage = InMemoryDataStorage(None)
+        simulation = Simulation(storage, seed)
+        simulation.evaluate(
+            Sequence(
+                DefineService("DB",
+                    DefineOperation("Select", Sequence(Think(2), Fail(0.5)))
+                ),
+                DefineClientStub("Browser", 5,
+                    Retry(Query("DB", "Select"), limit=3, delay=Delay(5, Delay.EXPONENTIAL))
+                )
+            )
+        )
+        simulation.run_until(500)
+        return [str(each_entry) for each_entry in storage.log]
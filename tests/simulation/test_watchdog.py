@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from mock import MagicMock
+
+from tests.simulation.commons import ServiceTests
+
+from mad.ast.commons import Sequence
+from mad.ast.definitions import DefineService, DefineOperation, DefineClientStub
+from mad.ast.actions import Think, Query
+from mad.ast.settings import Settings, Monitoring
+from mad.simulation.watchdog import QueueGrowth, EventLimit, MemoryLimit, ProbeCondition, Diverged
+
+
+class WatchdogTests(ServiceTests):
+
+    def define_model(self, think_time, monitoring=None):
+        self.evaluate(
+            Sequence(
+                DefineService("DB",
+                    Sequence(Settings(monitoring=monitoring), DefineOperation("Select", Think(think_time)))
+                ),
+                DefineClientStub("Browser", 5,
+                    Query("DB", "Select")
+                )
+            )
+        )
+
+    def test_overloaded_simulation_diverges(self):
+        self.define_model(think_time=10)
+        self.simulation.watch([QueueGrowth(5)])
+
+        self.simulate_until(10000)
+
+        self.verify_diverged("queue of 'DB'")
+
+    def test_simulation_within_limits_runs_until_the_end(self):
+        self.define_model(think_time=2)
+        self.simulation.watch([QueueGrowth(5), EventLimit(1000), ProbeCondition("DB", "response time", ">", 10)])
+
+        self.simulate_until(1000)
+
+        self.assertEqual(1000, self.simulation.schedule.time_now)
+        self.assertIsNone(self.simulation.outcome)
+
+    def test_too_many_pending_events(self):
+        self.define_model(think_time=10)
+        self.simulation.watch([EventLimit(3)])
+
+        self.simulate_until(10000)
+
+        self.verify_diverged("pending events")
+
+    def test_memory_over_budget(self):
+        self.define_model(think_time=2)
+        self.simulation.watch([MemoryLimit(100, measure=MagicMock(return_value=120))])
+
+        self.simulate_until(1000)
+
+        self.verify_diverged("120 MB")
+
+    def test_probe_condition(self):
+        self.define_model(think_time=10)
+        self.simulation.watch([ProbeCondition("DB", "response time", ">", 100)])
+
+        self.simulate_until(10000)
+
+        self.verify_diverged("DB/response time > 100")
+
+    def test_probe_condition_reads_the_last_complete_window(self):
+        self.define_model(think_time=2)
+        condition = ProbeCondition("DB", "arrival rate", "<", 0.1)
+        self.simulation.watch([condition])
+
+        self.simulate_until(25)
+
+        self.assertIsNone(condition.check(self.simulation))
+        self.assertIsNone(self.simulation.outcome)
+
+    def test_probe_condition_on_a_probe_that_is_not_sampled(self):
+        self.define_model(think_time=10, monitoring=Monitoring(probes=["throughput"]))
+        self.simulation.watch([ProbeCondition("DB", "queue", ">", 5)])
+
+        self.simulate_until(10000)
+
+        self.verify_diverged("DB/queue > 5")
+
+    def test_probe_condition_on_a_rate_without_monitoring(self):
+        self.define_model(think_time=2, monitoring=Monitoring(probes=[]))
+        self.simulation.watch([ProbeCondition("DB", "arrival rate", ">", 0.1)])
+
+        self.simulate_until(10000)
+
+        self.verify_diverged("DB/arrival rate > 0.1")
+
+    def test_probe_condition_on_an_unknown_probe(self):
+        self.define_model(think_time=10)
+        with self.assertRaises(ValueError):
+            self.simulation.watch([ProbeCondition("DB", "latency", ">", 100)])
+
+    def test_partial_results_are_flushed(self):
+        self.define_model(think_time=10)
+        flushed_at = []
+        self.simulation._storage.flush = MagicMock(
+            side_effect=lambda: flushed_at.append(self.simulation.schedule.time_now))
+        self.simulation.watch([QueueGrowth(5)])
+
+        self.simulate_until(10000)
+
+        self.assertEqual(self.simulation.outcome.time, flushed_at[0])
+
+    def verify_diverged(self, symptom):
+        outcome = self.simulation.outcome
+        self.assertIsInstance(outcome, Diverged)
+        self.assertEqual(self.simulation.schedule.time_now, outcome.time)
+        self.assertLess(outcome.time, 10000)
+        self.assertIn(symptom, outcome.symptom)
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from io import BytesIO, StringIO
+from unittest import TestCase
+
+from mock import MagicMock
+
+from tests.fakes import InMemoryDataStorage, InMemoryFileSystem
+
+from mad.evaluation import Symbols
+from mad.parsing import Parser
+from mad.checkpointing import Checkpoints
+from mad.simulation.factory import Simulation
+from mad.ui import Controller, Arguments
+
+
+MODEL = "service DB {" \
+        "   settings {" \
+        "      autoscaling {" \
+        "          period: 10" \
+        "          limits: [1, 3]" \
+        "      }" \
+        "   }" \
+        "   operation Select {" \
+        "      think 4" \
+        "   }" \
+        "}" \
+        "service Front {" \
+        "   operation checkout {" \
+        "      retry (limit: 3, delay: exponential(2)) {" \
+        "          query DB/Select {timeout: 6}" \
+        "      }" \
+        "      invoke DB/Select" \
+        "   }" \
+        "}" \
+        "client Browser {" \
+        "   every 3 {" \
+        "      query Front/checkout" \
+        "   }" \
+        "}"
+
+
+class CheckpointingTests(TestCase):
+
+    def setUp(self):
+        file_system = InMemoryFileSystem()
+        file_system.define("test.mad", MODEL)
+        self.model = Parser(file_system, "test.mad").parse()
+
+    def test_restored_simulations_behave_as_the_original(self):
+        original = self._simulate(until=100)
+        snapshot = BytesIO()
+        original.checkpoint(snapshot)
+
+        original.run_until(300)
+        restored = Simulation.restore(BytesIO(snapshot.getvalue()), InMemoryDataStorage(None))
+        restored.run_until(300)
+
+        self.assertNotEqual([], self._trace_of(restored))
+        self.assertEqual(self._trace_of(original, after=100), self._trace_of(restored))
+        self.assertEqual(self._successes_of(original, "Browser"), self._successes_of(restored, "Browser"))
+
+    def test_forks_are_independent(self):
+        original = self._simulate(until=100)
+
+        (fork,) = original.fork([InMemoryDataStorage(None)])
+        fork.run_until(300)
+
+        self.assertLessEqual(original.schedule.time_now, 100)
+        self.assertEqual(300, fork.schedule.time_now)
+        self.assertIsNot(original.environment.look_up("DB"), fork.environment.look_up("DB"))
+
+    def test_forks_can_be_configured_differently(self):
+        original = self._simulate(until=100)
+
+        (first, second) = original.fork([InMemoryDataStorage(None), InMemoryDataStorage(None)],
+                                        [{"seed": 1, "monitoring_period": 5}, {"seed": 2, "monitoring_period": 20}])
+        first.run_until(160)
+        second.run_until(160)
+
+        self.assertEqual([110., 115., 120.], self._sample_times_of(first, "DB", after=100)[:3])
+        self.assertEqual([110., 130., 150.], self._sample_times_of(second, "DB", after=100)[:3])
+        self.assertEqual((1, 2), (first.random_streams.seed, second.random_streams.seed))
+
+    def test_forks_with_the_same_seed_behave_the_same(self):
+        original = self._simulate(until=100)
+
+        forks = original.fork([InMemoryDataStorage(None), InMemoryDataStorage(None)], [{"seed": 3}, {"seed": 3}])
+        for each_fork in forks:
+            each_fork.run_until(300)
+
+        self.assertEqual(self._trace_of(forks[0]), self._trace_of(forks[1]))
+
+    def test_restored_simulations_report_in_the_new_storage(self):
+        original = self._simulate(until=100)
+        storage = InMemoryDataStorage(None)
+
+        (fork,) = original.fork([storage])
+        fork.run_until(200)
+
+        self.assertTrue(len(storage.log) > 0)
+        self.assertIn("DB", storage._opened_reports)
+
+    def test_checkpoints_are_saved_periodically(self):
+        saved = []
+        def open_snapshot():
+            saved.append(MagicMock())
+            return saved[-1]
+        simulation = self._simulate(until=0)
+
+        simulation.run_until(250, checkpoints=Checkpoints(100, open_snapshot))
+
+        self.assertEqual(2, len(saved))
+        self.assertEqual(250, simulation.schedule.time_now)
+
+    def _simulate(self, until):
+        simulation = Simulation(InMemoryDataStorage(None))
+        simulation.evaluate(self.model)
+        simulation.run_until(until)
+        return simulation
+
+    @staticmethod
+    def _trace_of(simulation, after=-1):
+        return [(each.time, each.context, each.message) for each in simulation.log if each.time > after]
+
+    @staticmethod
+    def _sample_times_of(simulation, entity, after):
+        times = simulation.environment.look_up(entity).look_up(Symbols.MONITOR).samples.column("time")
+        return [each_time for each_time in times if each_time > after]
+
+    @staticmethod
+    def _successes_of(simulation, entity):
+        return simulation.environment.look_up(entity).look_up(Symbols.MONITOR).tasks.successful
+
+
+class ResumeTests(TestCase):
+
+    def setUp(self):
+        self.file_system = InMemoryFileSystem()
+        self.file_system.define("test.mad", MODEL)
+        self._execute("test.mad", "100", "--checkpoint=50", "--seed=1")
+        [self.snapshot] = [each_location for each_location in self.file_system.opened_files
+                           if each_location.endswith(Arguments.CHECKPOINT_FILE)]
+
+    def test_resuming_with_new_settings(self):
+        simulation = self._execute("test.mad", "100", "--resume=" + self.snapshot, "--seed=2", "--monitoring-period=5")
+
+        self.assertEqual(2, simulation.random_streams.seed)
+        self.assertEqual(5, simulation.environment.look_up("DB").look_up(Symbols.MONITOR).period)
+
+    def test_resuming_with_another_model_is_rejected(self):
+        self.file_system.define("other.mad", MODEL.replace("think 4", "think 5"))
+        output = StringIO()
+
+        simulation = Controller(output, self.file_system).execute("other.mad", "100", "--resume=" + self.snapshot)
+
+        self.assertIsNone(simulation)
+        self.assertIn("is not the one the snapshot", output.getvalue())
+
+    def _execute(self, *command_line):
+        return Controller(StringIO(), self.file_system).execute(*command_line)
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
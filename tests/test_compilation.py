@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from sys import getrecursionlimit
+from unittest import TestCase
+from mock import MagicMock
+from random import Random
+
+from mad.environment import Environment
+from mad.ast.commons import Sequence
+from mad.ast.actions import Think, Fail, Query, IgnoreError, Retry
+from mad.compilation import Compiler, Frame, run, Block, ThinkStep, FailStep, QueryStep, IgnoreErrorStep, RetryStep
+
+
+class CompilerTests(TestCase):
+
+    def test_sequences_are_flattened(self):
+        plan = Compiler().compile(Sequence(Think(5), Sequence(Think(3), Fail()), Query("DB", "Select")))
+
+        self.assertIsInstance(plan, Block)
+        self.assertEqual([ThinkStep, ThinkStep, FailStep, QueryStep], [type(each) for each in plan.steps])
+
+    def test_sequences_of_a_single_action(self):
+        plan = Compiler().compile(Sequence(Think(5)))
+
+        self.assertIsInstance(plan, ThinkStep)
+        self.assertEqual(5, plan.duration)
+
+    def test_nested_expressions(self):
+        plan = Compiler().compile(IgnoreError(Retry(Query("DB", "Select", timeout=10), limit=3)))
+
+        self.assertIsInstance(plan, IgnoreErrorStep)
+        self.assertIsInstance(plan.body, RetryStep)
+        self.assertEqual(3, plan.body.limit)
+        self.assertEqual(10, plan.body.body.timeout)
+
+    def test_invocations_are_resolved_once_and_for_all(self):
+        database = MagicMock()
+        environment = Environment()
+        environment.define("DB", database)
+        plan = Compiler().compile(Sequence(Think(5), IgnoreError(Query("DB", "Select"))))
+
+        plan.resolve(environment)
+
+        self.assertIs(database, plan.steps[1].body.recipient)
+
+    def test_invocations_of_unknown_services_cannot_be_resolved(self):
+        plan = Compiler().compile(Query("DB", "Select"))
+
+        with self.assertRaises(ValueError):
+            plan.resolve(Environment())
+
+
+class StepTests(TestCase):
+
+    def setUp(self):
+        self.task = MagicMock()
+        sender = MagicMock()
+        sender.random_stream = Random(0)
+        self.frame = Frame(Environment(), self.task, sender, MagicMock())
+        self.continuation = MagicMock()
+
+    def test_blocks_stop_at_the_first_error(self):
+        plan = Compiler().compile(Sequence(Fail(), Think(5)))
+
+        run(plan, self.frame, self.continuation)
+
+        self.assertTrue(self.continuation.call_args[0][0].is_erroneous)
+        self.task.compute.assert_not_called()
+
+    def test_blocks_proceed_with_the_next_step(self):
+        plan = Compiler().compile(Sequence(Think(5), Think(3)))
+
+        run(plan, self.frame, self.continuation)
+        (duration, next_step, status) = self.task.compute.call_args[0]
+        next_step(status)
+
+        self.assertEqual(5, duration)
+        self.assertEqual(3, self.task.compute.call_args[0][0])
+        self.assertIs(self.continuation, self.task.compute.call_args[0][1])
+
+    def test_errors_are_ignored(self):
+        plan = Compiler().compile(IgnoreError(Fail()))
+
+        run(plan, self.frame, self.continuation)
+
+        self.assertTrue(self.continuation.call_args[0][0].is_successful)
+
+    def test_plans_are_reusable(self):
+        plan = Compiler().compile(Sequence(Think(5), Think(3)))
+
+        for each_invocation in range(2):
+            run(plan, self.frame, self.continuation)
+
+        self.assertEqual(2, self.task.compute.call_count)
+        self.assertEqual([5, 5], [each_call[0][0] for each_call in self.task.compute.call_args_list])
+
+    def test_long_sequences_do_not_overflow_the_stack(self):
+        plan = Compiler().compile(Sequence(*[Fail(0.) for _ in range(10 * getrecursionlimit())]))
+
+        run(plan, self.frame, self.continuation)
+
+        self.assertTrue(self.continuation.call_args[0][0].is_successful)
+
+    def test_deeply_nested_expressions_do_not_overflow_the_stack(self):
+        step = FailStep(1.)
+        for _ in range(10 * getrecursionlimit()):
+            step = IgnoreErrorStep(step)
+        plan = Block([step, ThinkStep(5)])
+
+        run(plan, self.frame, self.continuation)
+
+        self.assertEqual(5, self.task.compute.call_args[0][0])
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+
+#
+# This file is part of MAD.
+#
+# MAD is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MAD is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MAD.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from unittest import TestCase
+from io import StringIO
+from hashlib import sha256
+from mock import MagicMock
+from os.path import join
+from shutil import rmtree
+from sqlite3 import ProgrammingError
+from tempfile import mkdtemp
+
+from tests.fakes import InMemoryFileSystem
+
+from mad.database import Database, DatabaseStorage
+from mad.simulation.monitoring import Probe, Samples
+from mad.ui import Controller, Arguments
+
+
+MODEL = "service DB {" \
+        "  operation Select {" \
+        "      think 5" \
+        "   }" \
+        "}"
+
+
+class DatabaseTests(TestCase):
+
+    def setUp(self):
+        self.database = Database(":memory:")
+        self.addCleanup(self.database.close)
+
+    def test_new_run(self):
+        run = self.database.new_run("test", MODEL, 25, 42, "1.0")
+
+        (model, model_hash, length, seed) = self._query(
+            "SELECT model, model_hash, length, seed FROM runs WHERE id = ?", run)[0]
+        self.assertEqual(("test", 25, 42), (model, length, seed))
+        self.assertEqual(sha256(MODEL.encode("utf-8")).hexdigest(), model_hash)
+
+    def test_runs_are_numbered(self):
+        first = self.database.new_run("test", MODEL)
+        second = self.database.new_run("test", MODEL)
+
+        self.assertNotEqual(first, second)
+
+    def test_summaries(self):
+        run = self.database.new_run("test", MODEL)
+        self.database.insert_metrics([(run, "DB", 10, "queue", 1.),
+                                      (run, "DB", 20, "queue", 3.),
+                                      (run, "DB", 30, "queue", float("nan"))])
+
+        self.database.summarise(run)
+        self.database.summarise(run)
+
+        self.assertEqual([("DB", "queue", 2, 2., 1., 3.)],
+                         self._query("SELECT service, probe, count, mean, minimum, maximum "
+                                     "FROM summaries WHERE run = ?", run))
+
+    def test_reopening_keeps_the_runs(self):
+        self.database.new_run("test", MODEL)
+        self.database.connection.executescript(Database.SCHEMA)
+
+        self.assertEqual(1, self._query("SELECT count(*) FROM runs")[0][0])
+
+    def _query(self, sql, *parameters):
+        return self.database.connection.execute(sql, parameters).fetchall()
+
+
+class DatabaseStorageTests(TestCase):
+
+    def setUp(self):
+        self.database = Database(":memory:")
+        self.addCleanup(self.database.close)
+        self.run = self.database.new_run("test", MODEL)
+        self.storage = DatabaseStorage(None, self.database, self.run)
+        self.counter = 0
+        self.samples = Samples([Probe("time", 3, "{:d}", lambda self: 10 * self.counter),
+                                Probe("queue", 3, "{:d}", lambda self: self.counter)])
+        for self.counter in range(1, 4):
+            self.samples.record(self)
+
+    def test_reports_are_inserted_when_flushed(self):
+        report = self.storage.report_for("DB", [("time", "%s"), ("queue", "%s")])
+        report.write(self.samples, 0, 3)
+        self.assertEqual([], self._metrics())
+
+        self.storage.flush()
+
+        self.assertEqual([(10., "queue", 1.), (20., "queue", 2.), (30., "queue", 3.)],
+                         [each for each in self._metrics() if each[1] == "queue"])
+
+    def test_reports_are_inserted_by_batches(self):
+        report = self.storage.report_for("DB", [("queue", "%s")])
+        report.BATCH_SIZE = 2
+
+        report.write(self.samples, 0, 3)
+
+        self.assertEqual(3, len(self._metrics()))
+
+    def test_unknown_probes_are_skipped(self):
+        report = self.storage.report_for("DB", [("time", "%s"), ("queue", "%s"), ("weather", "%s")])
+        report.write(self.samples, 0, 3)
+        self.storage.flush()
+
+        self.assertEqual({"queue"}, {probe for (_, probe, _) in self._metrics()})
+
+    def test_time_is_not_stored_as_a_metric(self):
+        report = self.storage.report_for("DB", [("time", "%s"), ("queue", "%s")])
+        report.write(self.samples, 0, 3)
+        self.storage.flush()
+
+        self.assertEqual(3, len(self._metrics()))
+        self.assertNotIn("time", {probe for (_, probe, _) in self._metrics()})
+
+    def test_trace_is_inserted_when_flushed(self):
+        self.storage.log.record(10, "DB", "Hello!")
+        self.storage.flush()
+
+        self.assertEqual([(10, "DB", "Hello!")],
+                         self.database.connection.execute(
+                             "SELECT time, context, message FROM trace WHERE run = ?", (self.run,)).fetchall())
+
+    def test_close_summarises_the_run(self):
+        report = self.storage.report_for("DB", [("queue", "%s")])
+        report.write(self.samples, 0, 3)
+        self.storage.flush()
+        self.assertEqual([], self._summaries())
+        close = self.database.close
+        self.database.close = MagicMock()
+
+        self.storage.close()
+
+        self.assertEqual([("queue", 3, 2.)], self._summaries())
+        self.database.close.assert_called_once_with()
+        close()
+
+    def _summaries(self):
+        return self.database.connection.execute(
+            "SELECT probe, count, mean FROM summaries WHERE run = ?", (self.run,)).fetchall()
+
+    def _metrics(self):
+        return self.database.connection.execute(
+            "SELECT time, probe, value FROM metrics WHERE run = ? AND service = 'DB' ORDER BY probe, time",
+            (self.run,)).fetchall()
+
+
+class ControllerTests(TestCase):
+
+    def setUp(self):
+        self.file_system = InMemoryFileSystem()
+        self.file_system.define("test.mad", MODEL)
+        directory = mkdtemp()
+        self.addCleanup(rmtree, directory)
+        self.location = join(directory, "runs.db")
+
+    def test_results_are_stored_in_the_database(self):
+        self._execute("test.mad", "25")
+
+        database = Database(self.location)
+        self.addCleanup(database.close)
+        connection = database.connection
+        self.assertEqual([("test", MODEL)], connection.execute("SELECT model, source FROM runs").fetchall())
+        self.assertEqual([(10.,), (20.,)],
+                         connection.execute("SELECT DISTINCT time FROM metrics "
+                                            "WHERE service = 'DB' ORDER BY time").fetchall())
+        self.assertFalse(self.file_system.has_file("DB.log"))
+        self.assertFalse(self.file_system.has_file("trace.log"))
+
+    def test_database_is_closed_once_the_simulation_is_over(self):
+        controller = self._execute("test.mad", "25")
+
+        self._verify_closed(controller)
+
+    def test_database_is_closed_when_the_simulation_is_aborted(self):
+        controller = self._execute("test.mad", "25", "--max-events=1")
+
+        self._verify_closed(controller)
+
+    def test_database_is_closed_when_the_simulation_is_resumed(self):
+        self._execute("test.mad", "25", "--checkpoint=10")
+        [snapshot] = [each_location for each_location in self.file_system.opened_files
+                      if each_location.endswith(Arguments.CHECKPOINT_FILE)]
+
+        controller = self._execute("test.mad", "50", "--resume=" + snapshot)
+
+        self._verify_closed(controller)
+
+    def test_database_is_closed_when_the_model_is_invalid(self):
+        self.file_system.define("test.mad", "service DB { operation Select { query Unknown/op } }")
+
+        controller = self._execute("test.mad", "25")
+
+        self._verify_closed(controller)
+
+    def _execute(self, *command_line):
+        controller = Controller(StringIO(), self.file_system)
+        controller.execute(*(command_line + ("--database=" + self.location,)))
+        return controller
+
+    def _verify_closed(self, controller):
+        with self.assertRaises(ProgrammingError):
+            controller.storage.database.connection.execute("SELECT count(*) FROM runs")
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
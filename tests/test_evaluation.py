@@ -26,8 +26,9 @@ from mad.environment import Environment
 from mad.ast.commons import Sequence
 from mad.ast.actions import *
 from mad.ast.settings import *
+from mad.ast.definitions import DefineService, DefineOperation
 
-from mad.evaluation import Evaluation, Symbols, Success
+from mad.evaluation import Evaluation, Symbols, Success, FAILED
 from mad.simulation.factory import Simulation, Factory
 from mad.simulation.tasks import LIFOTaskPool, FIFOTaskPool
 from mad.simulation.autoscaling import AutoScaler
@@ -38,22 +39,17 @@ class EvaluationTest(TestCase):
     def test_evaluation_of_sequence_stops_at_the_first_failure(self):
         environment = Environment()
 
+        fail = MagicMock(Expression)
+        fail.accept = lambda evaluation: evaluation.continuation(FAILED)
         succeed = MagicMock(Expression)
         succeed.accept = MagicMock(return_value=Success())
 
         def check_result(status):
             self.assertTrue(status.is_erroneous)
 
-        Evaluation(environment, Sequence(Fail(), succeed), Factory(), continuation=check_result).result
+        Evaluation(environment, Sequence(fail, succeed), Factory(), continuation=check_result).result
         succeed.accept.assert_not_called()
 
-    def test_evaluation_of_fail(self):
-        environment = Environment()
-
-        result = Evaluation(environment, Fail(), Factory()).result
-
-        self.assertTrue(result.is_erroneous)
-
     def test_evaluation_of_fifo(self):
         environment = Environment()
         queue = FIFO()
@@ -94,5 +90,17 @@ class EvaluationTest(TestCase):
         self.assertEqual(PERIOD, autoscaler.period)
         self.assertEqual((3, 5), autoscaler.limits)
 
+    def test_evaluation_of_monitoring_settings(self):
+        simulation = Simulation(InMemoryDataStorage(None))
+        simulation.evaluate(
+            DefineService("DB", Sequence(
+                Settings(monitoring=Monitoring(period=25, probes=["queue", "response time Select"])),
+                DefineOperation("Select", Think(5)))))
+
+        monitor = simulation.environment.look_up("DB").look_up(Symbols.MONITOR)
+
+        self.assertEqual(25, monitor.period)
+        self.assertEqual(["time", "queue", "response time Select"], [each.name for each in monitor.probes])
+
 
 
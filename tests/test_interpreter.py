@@ -20,7 +20,7 @@
 
 from unittest import TestCase
 from mock import MagicMock, patch
-from tests.fakes import InMemoryDataStorage
+from tests.fakes import InMemoryDataStorage, FakeQuery
 
 from mad.ast.commons import *
 from mad.ast.definitions import *
@@ -28,8 +28,9 @@ from mad.ast.actions import *
 from mad.simulation.factory import Simulation
 from mad.simulation.service import Service, Operation
 from mad.evaluation import Symbols, Error
-from mad.simulation.requests import RequestStatus, Query as SQuery
+from mad.simulation.requests import RequestStatus
 from mad.simulation.tasks import Task
+from mad.compilation import NO_ARGUMENTS
 
 
 class TestInterpreter(TestCase):
@@ -457,6 +458,53 @@ class TestInterpreter(TestCase):
         self.send_request("DB", "Select", on_success=test_failed)
         self.simulate_until(20)
 
+    def test_operations_pass_their_status_to_the_given_continuation(self):
+        db = self.evaluate(
+            DefineService("DB",
+                DefineOperation("Select", Fail())
+            )
+        ).value
+        task = MagicMock(Task)
+        continuation = MagicMock()
+
+        db.look_up("Select").invoke(task, [], continuation)
+
+        self.assertTrue(continuation.call_args[0][0].is_erroneous)
+        task.finalise.assert_not_called()
+
+    def test_operations_are_resolved_once_the_model_is_evaluated(self):
+        db = self.define("DB", self.fake_service())
+        front_end = self.evaluate(DefineService("Front-end", DefineOperation("checkout", Query("DB", "op")))).value
+
+        self.assertIs(db, front_end.look_up("checkout").plan.recipient)
+
+    def test_invocations_of_unknown_services_are_caught_at_load_time(self):
+        with self.assertRaises(ValueError):
+            self.evaluate(DefineService("Front-end", DefineOperation("checkout", Query("DB", "op"))))
+
+    def test_operations_bind_their_arguments_to_their_parameters(self):
+        db = self.evaluate(DefineService("DB", DefineOperation("Select", Think(5)))).value
+        operation = db.look_up("Select")
+        operation.parameters = ["table"]
+
+        with patch("mad.simulation.service.run") as run:
+            operation.invoke(MagicMock(Task), ["users"])
+
+        (_, frame, _) = run.call_args[0]
+        self.assertEqual({"table": "users"}, frame.arguments)
+
+    def test_operations_without_parameters_share_an_empty_mapping(self):
+        db = self.evaluate(DefineService("DB", DefineOperation("Select", Think(5)))).value
+        operation = db.look_up("Select")
+
+        with patch("mad.simulation.service.run") as run:
+            operation.invoke(MagicMock(Task), [])
+            operation.invoke(MagicMock(Task), [])
+
+        (first, second) = [each_call[0][1] for each_call in run.call_args_list]
+        self.assertIs(NO_ARGUMENTS, first.arguments)
+        self.assertIs(NO_ARGUMENTS, second.arguments)
+
     def test_ignore_error(self):
         db1 = self.define("DB1", self.service_that_always_fails())
         db2 = self.define("DB2", self.fake_service())
@@ -537,7 +585,7 @@ class TestInterpreter(TestCase):
         self.assertEqual(monitor.tasks.successful, 2)
 
     def fake_request(self, operation, on_success=lambda: None, on_error=lambda: None):
-        request = SQuery(Task(self.fake_client()), operation, 1, lambda s: None)
+        request = FakeQuery(Task(self.fake_client()), operation, 1, lambda s: None)
         request.on_error = on_error
         request.on_success = on_success
         return request
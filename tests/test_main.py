@@ -28,6 +28,7 @@ from mad.ast.commons import *
 from mad.ast.definitions import *
 from mad.ast.actions import *
 from mad.log import Event
+from mad.scheduling import CalendarEventPool
 from mad.simulation.factory import Simulation
 from mad.simulation.monitoring import Logger
 
@@ -201,6 +202,7 @@ class TestMain(TestCase):
     def evaluate(self, expression):
         simulation = Simulation(InMemoryDataStorage(None))
         simulation.evaluate(expression)
+        self.assertFalse(simulation.schedule.batch_dispatch)
         return simulation
 
     def run_until(self, simulation, limit):
@@ -230,6 +232,27 @@ class TestMain(TestCase):
                 "Context mismatch (expected context is %s)\n%s" % (expected.context, str(actual)))
 
 
+class TestMainWithCalendarEventPool(TestMain):
+    """
+    The very same traces, with the pending events kept in a calendar rather than in a heap
+    """
+
+    def evaluate(self, expression):
+        simulation = Simulation(InMemoryDataStorage(None), event_pool=Simulation.CALENDAR)
+        simulation.evaluate(expression)
+        self.assertIsInstance(simulation.schedule.schedule, CalendarEventPool)
+        self.assertTrue(simulation.schedule.batch_dispatch)
+        return simulation
+
+    def test_event_pool_is_selected_on_the_command_line(self):
+        file_system = InMemoryFileSystem()
+        file_system.define("test.mad", "service DB { operation Select { think 5 } }")
+
+        simulation = Controller(StringIO(), file_system).execute("test.mad", "25", "--event-pool=calendar")
+
+        self.assertIsInstance(simulation.schedule.schedule, CalendarEventPool)
+
+
 if __name__ == "__main__":
     import unittest.main as main
     main()
\ No newline at end of file
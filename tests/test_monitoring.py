@@ -18,12 +18,16 @@
 #
 
 from unittest import TestCase
-from mock import MagicMock
+from mock import MagicMock, patch
 from tests.fakes import InMemoryFileSystem
 
-from io import StringIO
+from io import StringIO, BytesIO
+from math import isnan
+from os import remove
+from tempfile import NamedTemporaryFile
 
-from mad.monitoring import CSVReport
+from mad.monitoring import CSVReport, ColumnarReport, ColumnarFile
+from mad.simulation.monitoring import Probe, Samples
 from mad.ui import Controller, Arguments
 
 
@@ -57,6 +61,22 @@ class MonitoringTests(TestCase):
         data = self.file_system.opened_files["test_1/DB.log"].getvalue().split("\n")
         self.assertEqual(4, len(data), data) # header line, + Monitoring at 10, 20 + newline
 
+    def test_binary_reports(self):
+        Arguments._identifier = lambda s: "1"
+        self.file_system.define(
+            self.MAD_FILE,
+            "service DB {"
+            "  operation Select {"
+            "      think 5"
+            "   }"
+            "}")
+
+        controller = Controller(StringIO(), self.file_system)
+        controller.execute("test.mad", "25", "--report-format=binary")
+
+        self.assertTrue(self.file_system.opened_files["test_1/DB.bin"].getvalue().startswith(b"MADCOLS1"))
+        self.assertFalse(self.file_system.has_file("DB.log"))
+
 
 class ReportTests(TestCase):
 
@@ -74,3 +94,101 @@ class ReportTests(TestCase):
                        " 10,   6\n"
 
         self.assertEqual(expected_csv, output.getvalue())
+
+
+class ColumnarReportTests(TestCase):
+
+    def setUp(self):
+        self.counter = 0
+        self.samples = Samples([Probe("time", 3, "{:d}", lambda self: self.counter),
+                                Probe("queue", 3, "{:d}", lambda self: None if self.counter == 1 else 2 * self.counter)])
+        for self.counter in range(3):
+            self.samples.record(self)
+
+    def test_round_trip(self):
+        location = self._write(lambda report: report.write(self.samples, 0, 3))
+
+        with ColumnarFile(location) as data:
+            self.assertEqual(["time", "queue"], data.names)
+            self.assertEqual(3, data.row_count)
+            self.assertEqual([0., 1., 2.], list(data.column("time")))
+            queue = data.column("queue")
+            self.assertEqual(0., queue[0])
+            self.assertTrue(isnan(queue[1]))
+            self.assertEqual(4., queue[2])
+
+    def test_single_block_columns_are_not_copied(self):
+        location = self._write(lambda report: report.write(self.samples, 0, 3))
+
+        with ColumnarFile(location) as data:
+            column = data.column("time")
+            self.assertIsInstance(column, memoryview)
+
+    def test_views_are_released_when_closed(self):
+        location = self._write(lambda report: report.write(self.samples, 0, 3))
+
+        with ColumnarFile(location) as data:
+            times = data.column("time")
+            blocks = list(data.blocks("queue"))
+
+        with self.assertRaises(ValueError):
+            times[0]
+        with self.assertRaises(ValueError):
+            blocks[0][0]
+
+    def test_several_blocks(self):
+        def write_by_blocks(report):
+            report.write(self.samples, 0, 2)
+            report.flush()
+            report.write(self.samples, 2, 3)
+        location = self._write(write_by_blocks)
+
+        with ColumnarFile(location) as data:
+            self.assertEqual([2, 1], [len(each_block) for each_block in data.blocks("time")])
+            self.assertEqual([0., 1., 2.], list(data.column("time")))
+
+    def test_round_trip_on_big_endian_hosts(self):
+        with patch("mad.monitoring.byteorder", "big"):
+            def write_by_blocks(report):
+                report.write(self.samples, 0, 2)
+                report.flush()
+                report.write(self.samples, 2, 3)
+            location = self._write(write_by_blocks)
+
+            with ColumnarFile(location) as data:
+                self.assertEqual([[0., 1.], [2.]], [list(each_block) for each_block in data.blocks("time")])
+                self.assertEqual([0., 1., 2.], list(data.column("time")))
+
+    def test_missing_columns_are_filled_with_nan(self):
+        location = self._write(lambda report: report.write(self.samples, 0, 3),
+                               fields=[("time", "%s"), ("weather", "%s")])
+
+        with ColumnarFile(location) as data:
+            self.assertTrue(all(isnan(each_value) for each_value in data.column("weather")))
+
+    def test_samples_are_buffered_until_flushed(self):
+        output = BytesIO()
+        report = ColumnarReport(output, [("time", "%s")])
+        header = output.getvalue()
+
+        report.write(self.samples, 0, 3)
+        self.assertEqual(header, output.getvalue())
+
+        report.flush()
+        self.assertEqual(len(header) + 4 + 3 * 8, len(output.getvalue()))
+
+    def test_rejects_other_files(self):
+        location = self._write(lambda report: None)
+        with open(location, "wb") as output:
+            output.write(b"time, queue\n")
+
+        with self.assertRaises(ValueError):
+            ColumnarFile(location)
+
+    def _write(self, fill, fields=(("time", "%s"), ("queue", "%s"))):
+        with NamedTemporaryFile(suffix=".bin", delete=False) as output:
+            report = ColumnarReport(output, list(fields))
+            fill(report)
+            report.flush()
+        self.addCleanup(remove, output.name)
+        return output.name
@@ -146,6 +146,24 @@ class CorrectExpressionTests(ParserTests):
              {"throttling": TailDropSettings(capacity=50)},
              "throttling"),
 
+            ("monitoring {"
+             "  period: 50"
+             "  probes: [queue, response-time, \"response time p99.9\"]"
+             "}",
+             {"monitoring": Monitoring(period=50, probes=["queue", "response time", "response time p99.9"])},
+             "monitoring"),
+
+            ("monitoring {"
+             "  probes: [queue-blocked, response-time-get-user, response-time-p95-get-user, arrival-rate-get-user]"
+             "}",
+             {"monitoring": Monitoring(probes=["queue blocked", "response time get-user",
+                                               "response time p95 get-user", "arrival rate get-user"])},
+             "monitoring"),
+
+            ("monitoring: none",
+             {"monitoring": Monitoring(probes=[])},
+             "monitoring"),
+
             ("settings {"
              "  queue: FIFO"
              "  autoscaling {"
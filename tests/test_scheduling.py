@@ -18,8 +18,9 @@
 #
 
 from unittest import TestCase
+from mock import MagicMock, call
 
-from mad.scheduling import Scheduler
+from mad.scheduling import Scheduler, Event, EventPool, HeapEventPool, CalendarEventPool
 
 
 class DummyAction:
@@ -43,8 +44,11 @@ class SchedulerTest(TestCase):
     Specification of the scheduler component
     """
 
+    def create_scheduler(self, initial_time=0):
+        return Scheduler(initial_time)
+
     def test_scheduling_an_action_at_a_given_time(self):
-        schedule = Scheduler()
+        schedule = self.create_scheduler()
         action = DummyAction(schedule)
         schedule.at(10, action)
 
@@ -54,14 +58,14 @@ class SchedulerTest(TestCase):
         self.verify_calls([10], action)
 
     def test_scheduling_action_in_the_past_is_forbidden(self):
-        schedule = Scheduler(20)
+        schedule = self.create_scheduler(20)
         action = DummyAction(schedule)
 
         with self.assertRaises(ValueError):
             schedule.at(10, action)
 
     def test_scheduling_an_action_after_a_delay(self):
-        schedule = Scheduler()
+        schedule = self.create_scheduler()
         action = DummyAction(schedule)
         schedule.after(5, action)
 
@@ -70,14 +74,24 @@ class SchedulerTest(TestCase):
         self.assertEqual(5, schedule.time_now)
         self.verify_calls([5], action)
 
+    def test_scheduling_an_action_with_arguments(self):
+        schedule = self.create_scheduler()
+        calls = []
+        schedule.at(5, calls.append, "at")
+        schedule.after(10, calls.append, "after")
+
+        schedule.simulate_until(20)
+
+        self.assertEqual(["at", "after"], calls)
+
     def test_scheduling_an_object_is_forbidden(self):
-        schedule = Scheduler()
+        schedule = self.create_scheduler()
         action = "This is not a callable!"
         with self.assertRaises(ValueError):
             schedule.at(10, action)
 
     def test_scheduling_twice_an_action_at_a_given_time(self):
-        schedule = Scheduler()
+        schedule = self.create_scheduler()
         action = DummyAction(schedule)
         schedule.at(5, action)
         schedule.at(5, action)
@@ -88,7 +102,7 @@ class SchedulerTest(TestCase):
         self.verify_calls([5, 5], action)
 
     def test_scheduling_an_action_with_a_given_period(self):
-        schedule = Scheduler()
+        schedule = self.create_scheduler()
         action = DummyAction(schedule)
         schedule.every(5, action)
 
@@ -98,7 +112,7 @@ class SchedulerTest(TestCase):
         self.verify_calls([5, 10, 15, 20], action)
 
     def test_simulation_orders_events(self):
-        schedule = Scheduler()
+        schedule = self.create_scheduler()
         action = DummyAction(schedule)
         schedule.at(10, action)
         schedule.at(5, action)
@@ -108,16 +122,283 @@ class SchedulerTest(TestCase):
         self.verify_calls([5, 10], action)
 
     def test_scheduling_at_a_non_integer_time(self):
-        schedule = Scheduler()
+        schedule = self.create_scheduler()
         action = DummyAction(schedule)
 
         with self.assertRaises(ValueError):
             schedule.at("now", action)
 
+    def test_simulation_preserves_insertion_order_of_simultaneous_events(self):
+        schedule = self.create_scheduler()
+        calls = []
+        for index in range(10):
+            schedule.at(5, lambda index=index: calls.append(index))
+
+        schedule.simulate_until(20)
+
+        self.assertEqual(list(range(10)), calls)
+
+    def test_events_scheduled_now_are_triggered_after_pending_ones(self):
+        schedule = self.create_scheduler()
+        calls = []
+        def first():
+            calls.append("first")
+            schedule.after(0, lambda: calls.append("third"))
+        schedule.at(5, first)
+        schedule.at(5, lambda: calls.append("second"))
+
+        schedule.simulate_until(20)
+
+        self.assertEqual(["first", "second", "third"], calls)
+
+    def test_simulation_stops_before_events_due_after_the_end(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        schedule.at(5, action)
+        schedule.at(25, action)
+
+        schedule.simulate_until(20)
+        self.verify_calls([5], action)
+
+        schedule.at(22, action)
+        schedule.simulate_until(30)
+        self.verify_calls([5, 22, 25], action)
+
+    def test_cancelling_a_scheduled_action(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        event = schedule.at(5, action)
+        schedule.at(10, action)
+
+        event.cancel()
+        schedule.simulate_until(20)
+
+        self.verify_calls([10], action)
+
+    def test_cancelling_an_action_that_already_ran(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        event = schedule.at(5, action)
+
+        schedule.simulate_until(20)
+        event.cancel()
+
+        self.verify_calls([5], action)
+        self.assertTrue(schedule.schedule.is_empty)
+
+    def test_cancelling_many_actions(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        events = [schedule.at(time, action) for time in range(1, 500)]
+
+        for each_event in events[:-1]:
+            each_event.cancel()
+        schedule.simulate_until(1000)
+
+        self.verify_calls([499], action)
+        self.assertTrue(schedule.schedule.is_empty)
+
+    def test_counting_pending_events(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        events = [schedule.at(time, action) for time in [5, 10, 10, 2000]]
+
+        events[1].cancel()
+        schedule.simulate_until(5)
+
+        self.assertEqual(2, schedule.pending_event_count)
+
+    def test_cancelling_a_periodic_action(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        recurrence = schedule.every(5, action)
+        schedule.at(12, recurrence.cancel)
+
+        schedule.simulate_until(20)
+
+        self.verify_calls([5, 10], action)
+
+    def test_cancelling_a_periodic_action_from_within(self):
+        schedule = self.create_scheduler()
+        calls = []
+        def action():
+            calls.append(schedule.time_now)
+            if len(calls) == 2:
+                recurrence.cancel()
+        recurrence = schedule.every(5, action)
+
+        schedule.simulate_until(20)
+
+        self.assertEqual([5, 10], calls)
+        self.assertTrue(schedule.schedule.is_empty)
+
+    def test_changing_the_period_of_a_periodic_action(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        recurrence = schedule.every(5, action)
+        schedule.at(7, lambda: setattr(recurrence, "period", 2))
+
+        schedule.simulate_until(20)
+
+        self.verify_calls([5, 10, 12, 14, 16, 18, 20], action)
+
+    def test_periodic_actions_reuse_the_same_event(self):
+        schedule = self.create_scheduler()
+        recurrence = schedule.every(5, DummyAction(schedule))
+
+        schedule.simulate_until(20)
+
+        self.assertIs(recurrence, schedule.schedule.next_event())
+        self.assertEqual(25, recurrence.time)
+
+    def test_scheduling_with_an_invalid_period(self):
+        schedule = self.create_scheduler()
+        with self.assertRaises(ValueError):
+            schedule.every(0, DummyAction(schedule))
+
+    def test_stopping_the_simulation(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        schedule.at(5, schedule.stop, "converged")
+        schedule.at(10, action)
+
+        schedule.simulate_until(20)
+        schedule.simulate_until(30)
+
+        self.assertEqual(5, schedule.time_now)
+        self.assertTrue(schedule.is_stopped)
+        self.assertEqual("converged", schedule.stop_reason)
+        self.verify_calls([], action)
+
     def verify_calls(self, expectation, action):
         self.assertTrue(action.was_called_at(expectation), "Action called on %s" % str(action.calls))
 
 
+class ListEventPoolSchedulerTest(SchedulerTest):
+
+    def create_scheduler(self, initial_time=0):
+        return Scheduler(initial_time, EventPool())
+
+
+class CalendarEventPoolSchedulerTest(SchedulerTest):
+
+    def create_scheduler(self, initial_time=0):
+        return Scheduler(initial_time, CalendarEventPool(size=4))
+
+
+class BatchDispatchSchedulerTest(SchedulerTest):
+
+    def create_scheduler(self, initial_time=0):
+        return Scheduler(initial_time, batch_dispatch=True)
+
+    def test_progress_is_reported_once_per_distinct_time(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        for time in [5, 5, 5, 10, 10]:
+            schedule.at(time, action)
+        display = MagicMock()
+
+        schedule.simulate_until(20, display)
+
+        self.assertEqual([call(5, 20, 3), call(10, 20, 5)], display.update.call_args_list)
+
+    def test_cancelling_an_action_from_the_same_batch(self):
+        schedule = self.create_scheduler()
+        action = DummyAction(schedule)
+        schedule.at(5, lambda: second.cancel())
+        second = schedule.at(5, action)
+
+        schedule.simulate_until(20)
+
+        self.verify_calls([], action)
+
+
+class BatchDispatchListEventPoolSchedulerTest(BatchDispatchSchedulerTest):
+
+    def create_scheduler(self, initial_time=0):
+        return Scheduler(initial_time, EventPool(), batch_dispatch=True)
+
+
+class BatchDispatchCalendarEventPoolSchedulerTest(BatchDispatchSchedulerTest):
+
+    def create_scheduler(self, initial_time=0):
+        return Scheduler(initial_time, CalendarEventPool(size=4), batch_dispatch=True)
+
+
+class HeapEventPoolTest(TestCase):
+
+    def test_next_event_is_the_earliest(self):
+        pool = HeapEventPool()
+        late, early = Event(10, lambda: None), Event(5, lambda: None)
+        pool.put(late)
+        pool.put(early)
+
+        self.assertIs(early, pool.next_event())
+
+    def test_discarding_an_event_which_is_not_the_next_one(self):
+        pool = HeapEventPool()
+        events = [Event(time, lambda: None) for time in [3, 1, 2]]
+        for each_event in events:
+            pool.put(each_event)
+
+        pool.discard(events[2])
+
+        self.assertIs(events[1], pool.next_event())
+        pool.discard(events[1])
+        self.assertIs(events[0], pool.next_event())
+        pool.discard(events[0])
+        self.assertTrue(pool.is_empty)
+
+
+
+class CalendarEventPoolTest(TestCase):
+
+    def setUp(self):
+        self.pool = CalendarEventPool(size=4)
+
+    def test_far_events_are_exposed_once_the_wheel_reaches_them(self):
+        far, near = Event(100, lambda: None), Event(2, lambda: None)
+        self.pool.put(far)
+        self.pool.put(near)
+
+        self.assertIs(near, self.pool.next_event())
+        self.pool.discard(near)
+        self.assertIs(far, self.pool.next_event())
+        self.pool.discard(far)
+        self.assertTrue(self.pool.is_empty)
+
+    def test_far_events_precede_simultaneous_events_put_later(self):
+        first, second = Event(10, lambda: None), Event(10, lambda: None)
+        self.pool.put(first)
+        self.pool.put(Event(8, lambda: None))
+        self.pool.discard(self.pool.next_event())
+        self.pool.put(second)
+
+        self.assertIs(first, self.pool.next_event())
+        self.pool.discard(first)
+        self.assertIs(second, self.pool.next_event())
+
+    def test_putting_an_event_before_the_next_one(self):
+        late, early = Event(50, lambda: None), Event(20, lambda: None)
+        self.pool.put(late)
+        self.assertIs(late, self.pool.next_event())
+
+        self.pool.put(early)
+
+        self.assertIs(early, self.pool.next_event())
+        self.pool.discard(early)
+        self.assertIs(late, self.pool.next_event())
+
+    def test_discarding_a_far_event(self):
+        far, near = Event(100, lambda: None), Event(2, lambda: None)
+        self.pool.put(far)
+        self.pool.put(near)
+
+        self.pool.discard(far)
+
+        self.assertIs(near, self.pool.next_event())
+        self.pool.discard(near)
+        self.assertTrue(self.pool.is_empty)
 
 
 if __name__ == "__main__":
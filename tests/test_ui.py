@@ -24,7 +24,9 @@ from unittest import TestCase
 from mock import MagicMock, patch
 
 from mad import __version__ as MAD_VERSION
-from mad.ui import Display, Arguments, InvalidSimulationLength, InvalidSimulationModel, WrongNumberOfArguments
+from mad.ui import Display, Arguments, InvalidSimulationLength, InvalidSimulationModel, WrongNumberOfArguments, \
+    UnknownOption, InvalidOptionValue
+from mad.simulation.factory import Simulation
 
 
 class DisplayTest(TestCase):
@@ -46,10 +48,45 @@ class DisplayTest(TestCase):
         self.display.update(20, 100)
         self._verify_output("20.00 %")
 
+    def test_simulation_update_is_rate_limited(self):
+        display = Display(self.output, refresh_period=1, wall_clock=MagicMock(side_effect=[0, 0.5, 1.5]))
+
+        display.update(10, 100, 50)
+        display.update(20, 100, 100)
+        display.update(30, 100, 150)
+
+        self._verify_output("10.00 %")
+        self.assertNotIn("20.00 %", self.output.getvalue())
+        self._verify_output("30.00 %")
+
+    def test_simulation_update_shows_the_pace_and_remaining_time(self):
+        display = Display(self.output, refresh_period=1, wall_clock=MagicMock(side_effect=[0, 2]))
+
+        display.update(0, 100, 0)
+        display.update(20, 100, 400)
+
+        self._verify_output("t=20")
+        self._verify_output("200 events/s")
+        self._verify_output("10.0 time units/s")
+        self._verify_output("ETA 0:00:08")
+
+    def test_simulation_update_is_always_shown_at_the_end(self):
+        display = Display(self.output, refresh_period=1, wall_clock=MagicMock(side_effect=[0, 0.1]))
+
+        display.update(90, 100)
+        display.update(100, 100)
+
+        self._verify_output("100.00 %")
+
     def test_simulation_complete(self):
         self.display.simulation_complete(self.project)
         self._verify_output(self.project._output_directory)
 
+    def test_results_stored(self):
+        project = Arguments(["test.mad", "25", "--database=results.db"])
+        self.display.results_stored(project, 3)
+        self._verify_output("'results.db' (run 3)")
+
     def _verify_output(self, expected_pattern):
         output = self.output.getvalue()
         match = search(escape(expected_pattern), output, IGNORECASE)
@@ -74,6 +111,127 @@ class ArgumentsTest(TestCase):
         self.assertEqual("test.mad", project._file_name)
         self.assertEqual(25, project._time_limit)
 
+    def test_parsing_batch_option(self):
+        project = Arguments(["test.mad", "--batch", "25"])
+        self.assertEqual("test.mad", project._file_name)
+        self.assertEqual(25, project._time_limit)
+        self.assertTrue(project.is_batch)
+
+    def test_batch_is_disabled_by_default(self):
+        project = Arguments(["test.mad", "25"])
+        self.assertFalse(project.is_batch)
+
+    def test_parsing_checkpoint_options(self):
+        project = Arguments(["test.mad", "25", "--checkpoint=10", "--resume=test_1/checkpoint.snapshot"])
+        self.assertEqual(10, project.checkpoint_period)
+        self.assertEqual("test_1/checkpoint.snapshot", project.snapshot)
+
+    def test_detecting_invalid_checkpoint_period(self):
+        for each_period in ["--checkpoint", "--checkpoint=0", "--checkpoint=ten"]:
+            with self.assertRaises(InvalidOptionValue):
+                Arguments(["test.mad", "25", each_period])
+
+    def test_parsing_seed_option(self):
+        project = Arguments(["test.mad", "25", "--seed=42"])
+        self.assertEqual(42, project.seed)
+
+    def test_seed_is_random_by_default(self):
+        project = Arguments(["test.mad", "25"])
+        self.assertIsNone(project.seed)
+
+    def test_detecting_invalid_seed(self):
+        for each_option in ["--seed", "--seed=-1", "--seed=abc"]:
+            with self.assertRaises(InvalidOptionValue):
+                Arguments(["test.mad", "25", each_option])
+
+    def test_parsing_report_format_option(self):
+        with patch.object(Arguments, "_identifier", return_value="1"):
+            project = Arguments(["test.mad", "25", "--report-format=binary"])
+            self.assertEqual(Arguments.BINARY, project.report_format)
+            self.assertEqual("test_1/DB.bin", project.report_for("DB"))
+
+    def test_reports_are_csv_by_default(self):
+        with patch.object(Arguments, "_identifier", return_value="1"):
+            project = Arguments(["test.mad", "25"])
+            self.assertEqual(Arguments.CSV, project.report_format)
+            self.assertEqual("test_1/DB.log", project.report_for("DB"))
+
+    def test_detecting_invalid_report_format(self):
+        for each_option in ["--report-format", "--report-format=xml"]:
+            with self.assertRaises(InvalidOptionValue):
+                Arguments(["test.mad", "25", each_option])
+
+    def test_parsing_event_pool_option(self):
+        project = Arguments(["test.mad", "25", "--event-pool=calendar"])
+        self.assertEqual(Simulation.CALENDAR, project.event_pool)
+
+    def test_events_are_pooled_in_a_heap_by_default(self):
+        project = Arguments(["test.mad", "25"])
+        self.assertEqual(Simulation.HEAP, project.event_pool)
+
+    def test_detecting_invalid_event_pool(self):
+        for each_option in ["--event-pool", "--event-pool=list"]:
+            with self.assertRaises(InvalidOptionValue):
+                Arguments(["test.mad", "25", each_option])
+
+    def test_parsing_monitoring_period_option(self):
+        project = Arguments(["test.mad", "25", "--monitoring-period=50"])
+        self.assertEqual(50, project.monitoring_period)
+
+    def test_monitoring_period_is_left_to_the_monitors_by_default(self):
+        project = Arguments(["test.mad", "25"])
+        self.assertIsNone(project.monitoring_period)
+
+    def test_detecting_invalid_monitoring_period(self):
+        for each_option in ["--monitoring-period", "--monitoring-period=0", "--monitoring-period=often"]:
+            with self.assertRaises(InvalidOptionValue):
+                Arguments(["test.mad", "25", each_option])
+
+    def test_parsing_database_option(self):
+        project = Arguments(["test.mad", "25", "--database=results.db"])
+        self.assertEqual("results.db", project.database)
+
+    def test_results_are_stored_in_files_by_default(self):
+        project = Arguments(["test.mad", "25"])
+        self.assertIsNone(project.database)
+
+    def test_detecting_invalid_database(self):
+        for each_option in ["--database", "--database="]:
+            with self.assertRaises(InvalidOptionValue):
+                Arguments(["test.mad", "25", each_option])
+
+    def test_parsing_steady_state_options(self):
+        project = Arguments(["test.mad", "25", "--precision=0.05", "--metrics=throughput"])
+        self.assertEqual(0.05, project.precision)
+        self.assertEqual(["throughput"], project.metrics)
+
+    def test_steady_state_detection_is_disabled_by_default(self):
+        project = Arguments(["test.mad", "25"])
+        self.assertIsNone(project.precision)
+        self.assertIsNone(project.metrics)
+
+    def test_detecting_invalid_steady_state_options(self):
+        for each_option in ["--precision", "--precision=0", "--precision=high", "--metrics", "--metrics=latency"]:
+            with self.assertRaises(InvalidOptionValue):
+                Arguments(["test.mad", "25", each_option])
+
+    def test_parsing_watchdog_options(self):
+        project = Arguments(["test.mad", "25", "--max-queue-growth=5", "--max-events=1000",
+                             "--max-memory=512", "--abort-when=DB/response time > 12.5"])
+        self.assertEqual(5, project.max_queue_growth)
+        self.assertEqual(1000, project.max_events)
+        self.assertEqual(512, project.max_memory)
+        self.assertEqual(("DB", "response time", ">", 12.5), project.abort_when)
+
+    def test_detecting_invalid_watchdog_options(self):
+        for each_option in ["--max-events=-1", "--max-memory", "--abort-when=DB", "--abort-when=DB/queue=3"]:
+            with self.assertRaises(InvalidOptionValue):
+                Arguments(["test.mad", "25", each_option])
+
+    def test_detecting_unknown_options(self):
+        with self.assertRaises(UnknownOption):
+            Arguments(["test.mad", "25", "--foo"])
+
     def test_detecting_missing_arguments(self):
         with self.assertRaises(WrongNumberOfArguments):
             Arguments([25])
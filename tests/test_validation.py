@@ -23,6 +23,7 @@ from unittest import TestCase
 from mad.ast.definitions import DefineClientStub, DefineOperation, DefineService
 from mad.ast.actions import Trigger, Think
 from mad.ast.commons import Sequence
+from mad.ast.settings import Settings, Monitoring
 
 from mad.validation.issues import *
 from mad.validation.engine import Validator, InvalidModel
@@ -61,8 +62,17 @@ class ValidatorTests(TestCase):
             self.duplicate_service(),
             self.duplicate_operation(),
             self.never_invoked_operation(),
+            self.unknown_probe(),
         ]
 
+    def unknown_probe(self):
+        return {"expression":
+                    DefineService("DB", Sequence(
+                        Settings(monitoring=Monitoring(probes=["queue", "response time Insert", "latency"])),
+                        DefineOperation("Insert", Think(5)))),
+                "expected_errors":
+                    [UnknownProbe("DB", "latency")]}
+
     def unknown_operation(self):
         return {"expression":
             Sequence(